@@ -14,7 +14,6 @@
 # The camera is by default set at high resolution
 # WARNING this file code is JUST for camera for the moment
 
-from queue import Queue
 from threading import Event
 from src.comm_protocol.Packet import Packet
 import atexit
@@ -71,7 +70,8 @@ def main():
     global halt_event
     atexit.register(exit_handler)
     np_shape = (*camera.resolution[::-1], 3)
-    frames_queue: Queue[tuple[int, np.ndarray]] = Queue()
+    # the frame is captured in the same array each time, it is serialized before the next capture
+    img_arr = np.empty(np_shape, dtype=np.uint8)
     frame_num = 0
 
     # Ask the user for the Raspberry Pi's IP address
@@ -84,11 +84,9 @@ def main():
 
     # Start capturing frames and publishing via ZeroMQ
     while not halt_event.is_set():
-        img_arr = np.empty(np_shape, dtype=np.uint8)
         camera.capture(img_arr, 'rgb')
         packet = Packet(frame_num, img_arr)
         socket.send(packet.serialize())  # Send the frame as a custom Packet via ZeroMQ
-        frames_queue.put((frame_num, img_arr))
         frame_num = frame_num + 1
         
 
@@ -112,7 +112,7 @@ class Packet:
 
     def payload_length(self):
         """Returns the number of **bytes** required to store this payload."""
-        return len(self.payload.tobytes())
+        return self.payload.nbytes
 
     def is_valid(self):
         return self.payload_crc == Packet.CRC_COMPUTER.arc(self.payload.tobytes()) \
@@ -145,7 +145,7 @@ class Packet:
             proto_channelcount_bytes,
             self.frame_number,
             *self.frame_shape[:2],
-            self.payload_length(),
+            actual_payload_length,
             self.payload.tobytes(),
             self.payload_crc,
             Packet.END_MAGIC_WORD
@@ -173,8 +173,11 @@ class Packet:
         return Packet(0, np.array((), dtype=PacketDataType.U8_INT.value.type_))
 
     @classmethod
-    def deserialize(cls, raw_packet: bytes) -> typing.Union[Packet, None]:
-        """Deserializes a packet, and returns a Packet object. Returns None in case of protocol or CRC mismatch"""
+    def deserialize(cls, raw_packet: bytes | memoryview) -> typing.Union[Packet, None]:
+        """
+        Deserializes a packet, and returns a Packet object. Returns None in case of protocol or CRC mismatch
+        The raw packet can be any buffer, such as the memoryview of a message received without copy
+        """
 
         # find payload's format in the raw packet
         payload_length = raw_packet[cls.PAYLOAD_LEN_IDX: cls.PAYLOAD_LEN_IDX + cls.LEN_PAYLOAD_LENGTH]
@@ -17,6 +17,10 @@ class TestPacket(TestCase):
         p_deser = Packet.deserialize(p_ser)
         self.assertEqual(self._p, p_deser)
 
+    def test_deserialize_from_buffer(self):
+        p_deser = Packet.deserialize(memoryview(self._p.serialize()))
+        self.assertEqual(self._p, p_deser)
+
     def test_eq_override(self):
         p_copy = Packet(*self._p_data)
         self.assertEqual(self._p, p_copy)
@@ -1,13 +1,19 @@
+import os
 import sys
+import time
 from threading import Event
 
 from PySide6.QtWidgets import QApplication
 
+from src.pattern_tracking.logic.analysis.DenseMotionAnalyzer import DenseMotionAnalyzer
 from src.pattern_tracking.logic.BackgroundComputation import BackgroundComputation
+from src.pattern_tracking.logic.storage.SeriesRecorder import SeriesRecorder
 from src.pattern_tracking.logic.tracker.TrackerManager import TrackerManager
 from src.pattern_tracking.logic.video.DummyVideoFeed import DummyVideoFeed
 from src.pattern_tracking.logic.video.LiveFeedWrapper import LiveFeedWrapper
 from src.pattern_tracking.qt_gui.AppMainWindow import AppMainWindow
+from src.pattern_tracking.qt_gui.widgets.FrameDisplayWidget import FrameDisplayWidget
+from src.pattern_tracking.shared import constants
 
 
 class Main:
@@ -23,23 +29,37 @@ class Main:
         """Event used to halt operations on separate threads. Should only be modified by the Qt aboutToQuit() signal"""
         self._tracker_manager = TrackerManager()
         """Contains all current trackers used"""
-        self._live_feed_wrapper: LiveFeedWrapper = LiveFeedWrapper(DummyVideoFeed(self._global_halt))
-        """Continuously reads the current video stream. Dummy feed on startup, replaced by a proper one by the user"""
-        self._main_window = AppMainWindow(self._tracker_manager, self._live_feed_wrapper)
+        self._live_feed_wrapper: LiveFeedWrapper = LiveFeedWrapper(DummyVideoFeed(self._global_halt),
+                                                                   ingest_size=FrameDisplayWidget.WIDGET_SIZE)
+        """
+        Continuously reads the current video stream. Dummy feed on startup, replaced by a proper one by the user.
+        The frames are queued at the size they are tracked at, so that large sensors don't fill the memory
+        """
+        self._dense_motion_analyzer = DenseMotionAnalyzer()
+        """Maps the motion of the whole frame, enabled by the user from the Analysis menu"""
+        self._main_window = AppMainWindow(self._tracker_manager, self._live_feed_wrapper, self._dense_motion_analyzer)
         """QT Main window object"""
         self._app.aboutToQuit.connect(self._stop_children_operations)
         """Allows us to do properly stop children threads before the Qt interface exits"""
+        self._recorder = SeriesRecorder(
+            os.path.join(constants.RECORDINGS_DIR, time.strftime("%Y%m%d-%H%M%S")),
+            self._global_halt
+        )
+        """Saves the centers and distances computed during this session to the disk"""
         self._background_computation_worker = BackgroundComputation(
             self._tracker_manager,
             self._live_feed_wrapper,
             self._main_window.get_frame_display_widget(),
             self._main_window.get_plot_container_widget(),
-            self._global_halt
+            self._global_halt,
+            self._recorder,
+            self._dense_motion_analyzer
         )
         """Connects the widgets and the children threads together"""
 
     def run(self):
         self._live_feed_wrapper.start()
+        self._recorder.start()
         self._background_computation_worker.start()
         self._main_window.show()
         self._app.exec()
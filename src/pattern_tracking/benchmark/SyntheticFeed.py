@@ -0,0 +1,119 @@
+import cv2 as cv
+import numpy as np
+
+
+class SyntheticFeed:
+    """
+    Generates frames in which textured patches "beat" along known trajectories,
+    to measure the accuracy of the trackers against a ground truth.
+
+    Each patch oscillates around its rest position along a sinusoid of its own direction and phase,
+    with a small random jitter. The background is a fixed texture. The frames are then degraded
+    by a slow illumination drift, a gaussian blur and a gaussian noise.
+
+    The frames are generated deterministically from the seed, so all trackers see the same feed.
+    """
+
+    DEFAULT_PATCH_SIZE = 50
+    """Side of the patches, in pixels, the same as the default POI size"""
+    DEFAULT_AMPLITUDE = 0.012
+    """Amplitude of the motion of the patches, relative to the width of the frame"""
+    DEFAULT_BEATING_PERIOD = 30
+    """Number of frames of a beat"""
+    DEFAULT_JITTER = 0.3
+    """Standard deviation of the random motion added to the trajectories, in pixels"""
+    DEFAULT_NOISE = 4.0
+    """Standard deviation of the gaussian noise added to each frame, in gray levels"""
+    DEFAULT_BLUR = 1.0
+    """Standard deviation of the gaussian blur applied to each frame, in pixels"""
+    DEFAULT_ILLUMINATION_DRIFT = 0.15
+    """Maximum relative change of the brightness of the frames"""
+    ILLUMINATION_PERIOD = 400
+    """Number of frames of a cycle of the illumination drift"""
+
+    def __init__(self, width: int, height: int, patches: int,
+                 patch_size: int = DEFAULT_PATCH_SIZE,
+                 amplitude: float = DEFAULT_AMPLITUDE,
+                 beating_period: int = DEFAULT_BEATING_PERIOD,
+                 jitter: float = DEFAULT_JITTER,
+                 noise: float = DEFAULT_NOISE,
+                 blur: float = DEFAULT_BLUR,
+                 illumination_drift: float = DEFAULT_ILLUMINATION_DRIFT,
+                 seed: int = 0):
+        if patches <= 0:
+            raise ValueError("At least one patch is required")
+        self._width, self._height = width, height
+        self._patch_size = patch_size
+        self._amplitude = amplitude * width
+        """Amplitude of the motion, in pixels"""
+        self._beating_period = beating_period
+        self._jitter = jitter
+        self._noise = noise
+        self._blur = blur
+        self._illumination_drift = illumination_drift
+        self._rng = np.random.default_rng(seed)
+
+        self._background = self._texture(height, width, smoothness=9)
+        """Fixed texture on which the patches move"""
+        self._patch_images = [self._texture(patch_size, patch_size, smoothness=3) for _ in range(patches)]
+        """Texture of each patch, more detailed than the background"""
+        self._rest_positions = self._grid(patches)
+        """Xy location of the top-left corner of each patch, at rest"""
+        angles = self._rng.uniform(0, np.pi, patches)
+        self._directions = np.stack((np.cos(angles), np.sin(angles)), axis=1)
+        """Unit vector of the direction of the motion of each patch"""
+        self._phases = self._rng.uniform(0, 2 * np.pi, patches)
+        """Phase of the beating of each patch"""
+        self._frame_number = 0
+
+    def _texture(self, height: int, width: int, smoothness: int) -> np.ndarray:
+        """:return: A random BGR texture, blurred to have structures of about `smoothness` pixels"""
+        noise = self._rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        return cv.GaussianBlur(noise, (0, 0), smoothness / 3)
+
+    def _grid(self, patches: int) -> np.ndarray:
+        """:return: Rest positions of the patches on a regular grid, away from the borders of the frame"""
+        columns = int(np.ceil(np.sqrt(patches * self._width / self._height)))
+        rows = int(np.ceil(patches / columns))
+        margin = self._amplitude + 3 * self._jitter + 1
+        xs = np.linspace(margin, self._width - self._patch_size - margin, columns)
+        ys = np.linspace(margin, self._height - self._patch_size - margin, rows)
+        grid = np.array([(x, y) for y in ys for x in xs])[:patches]
+        if (grid < 0).any():
+            raise ValueError("The frame is too small for this number of patches")
+        return grid
+
+    def get_patch_size(self) -> int:
+        return self._patch_size
+
+    def get_rest_positions(self) -> np.ndarray:
+        """:return: The xy location of the top-left corner of each patch in the first frame, as integers"""
+        return np.round(self.positions_at(0)).astype(int)
+
+    def positions_at(self, frame_number: int) -> np.ndarray:
+        """:return: The xy location of the top-left corner of each patch in the given frame, without jitter"""
+        offsets = self._amplitude * np.sin(2 * np.pi * frame_number / self._beating_period + self._phases)
+        return self._rest_positions + offsets[:, np.newaxis] * self._directions
+
+    def next_frame(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generates the next frame of the feed
+        :return: The BGR frame, and the ground truth xy location of the center of each patch in it
+        """
+        positions = self.positions_at(self._frame_number)
+        if self._frame_number > 0:
+            positions = positions + self._rng.normal(0, self._jitter, positions.shape)
+        positions = np.round(positions).astype(int)
+
+        frame = self._background.copy()
+        for (x, y), patch in zip(positions, self._patch_images):
+            frame[y: y + self._patch_size, x: x + self._patch_size] = patch
+
+        gain = 1 + self._illumination_drift * np.sin(2 * np.pi * self._frame_number / SyntheticFeed.ILLUMINATION_PERIOD)
+        frame = frame.astype(np.float32) * gain
+        if self._blur > 0:
+            frame = cv.GaussianBlur(frame, (0, 0), self._blur)
+        if self._noise > 0:
+            frame += self._rng.normal(0, self._noise, frame.shape).astype(np.float32)
+        self._frame_number += 1
+        return np.clip(frame, 0, 255).astype(np.uint8), positions + self._patch_size / 2
@@ -0,0 +1,128 @@
+import json
+import time
+from dataclasses import dataclass, asdict
+
+import numpy as np
+
+# utils must be imported before RegionOfInterest, because of their circular import
+from src.pattern_tracking.shared import utils
+from src.pattern_tracking.benchmark.SyntheticFeed import SyntheticFeed
+from src.pattern_tracking.logic.tracker.TrackerManager import TrackerManager
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+@dataclass
+class BenchmarkResult:
+    """Speed and accuracy of a type of tracker, for a frame size and a number of trackers"""
+    tracker_type: str
+    width: int
+    height: int
+    trackers: int
+    frames: int
+    fps: float
+    """Number of frames processed per second, by all the trackers together"""
+    latency_p50_ms: float
+    latency_p90_ms: float
+    latency_p99_ms: float
+    """Percentiles of the time taken to update all the trackers with a frame"""
+    center_error_mean_px: float
+    center_error_p95_px: float
+    """Distance between the found centers and the ground truth, when found. NaN if never found"""
+    loss_rate: float
+    """Fraction of the frames in which the trackers didn't find their POI"""
+
+
+class TrackerBenchmark:
+    """
+    Runs types of tracker on synthetic feeds (see SyntheticFeed), without any GUI,
+    and measures their speed and their accuracy.
+
+    The trackers are created and updated through a TrackerManager, like in the application,
+    so the trackers sharing data (FFT matcher, optical flow engine) are measured as they are used.
+    The frames are generated before the measures, and reused by all the types of tracker.
+    """
+
+    DEFAULT_FRAMES = 100
+    """Number of frames tracked for each measure"""
+
+    def __init__(self, frames: int = DEFAULT_FRAMES, seed: int = 0):
+        if frames <= 0:
+            raise ValueError("At least one frame must be tracked")
+        self._frames = frames
+        self._seed = seed
+
+    def run(self, tracker_types: list[TrackerType], sizes: list[tuple[int, int]], counts: list[int]) \
+            -> list[BenchmarkResult]:
+        """
+        Measures each type of tracker for each frame size and number of trackers
+        :param tracker_types: The types of tracker to measure
+        :param sizes: Width and height of the frames
+        :param counts: Numbers of trackers updated with each frame
+        """
+        results = []
+        for width, height in sizes:
+            for count in counts:
+                feed = SyntheticFeed(width, height, count, seed=self._seed)
+                frames, truths = zip(*(feed.next_frame() for _ in range(self._frames + 1)))
+                for tracker_type in tracker_types:
+                    results.append(self._measure(tracker_type, feed, frames, truths))
+        return results
+
+    def _measure(self, tracker_type: TrackerType, feed: SyntheticFeed,
+                 frames: tuple[np.ndarray, ...], truths: tuple[np.ndarray, ...]) -> BenchmarkResult:
+        """Tracks the patches of the feed with trackers of the given type, the first frame setting their POI"""
+        manager = TrackerManager()
+        first_frame = frames[0]
+        size = feed.get_patch_size()
+        trackers = [manager.create_tracker(f"{tracker_type.name} {index}", tracker_type)
+                    for index in range(len(feed.get_rest_positions()))]
+        # the trackers need a base frame before their POI is set, as in the GUI
+        manager.update_trackers(first_frame, first_frame.copy())
+        for tracker, (x, y) in zip(trackers, feed.get_rest_positions()):
+            tracker.set_poi(RegionOfInterest.new(first_frame, int(x), size, int(y), size))
+
+        latencies, errors, lost = [], [], 0
+        for frame, truth in zip(frames[1:], truths[1:]):
+            start = time.perf_counter()
+            manager.update_trackers(frame, frame.copy())
+            latencies.append(time.perf_counter() - start)
+            for tracker, center in zip(trackers, truth):
+                # the OpenCV trackers keep their previous location when they miss the POI
+                if not tracker.is_found():
+                    lost += 1
+                else:
+                    errors.append(float(np.hypot(*(tracker.get_found_poi_center() - center))))
+
+        latencies_ms = 1000 * np.array(latencies)
+        return BenchmarkResult(
+            tracker_type=tracker_type.name,
+            width=first_frame.shape[1],
+            height=first_frame.shape[0],
+            trackers=len(trackers),
+            frames=len(latencies),
+            fps=len(latencies) / sum(latencies),
+            latency_p50_ms=float(np.percentile(latencies_ms, 50)),
+            latency_p90_ms=float(np.percentile(latencies_ms, 90)),
+            latency_p99_ms=float(np.percentile(latencies_ms, 99)),
+            center_error_mean_px=float(np.mean(errors)) if len(errors) > 0 else float("nan"),
+            center_error_p95_px=float(np.percentile(errors, 95)) if len(errors) > 0 else float("nan"),
+            loss_rate=lost / (len(latencies) * len(trackers))
+        )
+
+    @staticmethod
+    def save_json(results: list[BenchmarkResult], path: str):
+        """Writes the results to a JSON file, as a list of objects"""
+        with open(path, "w") as file:
+            json.dump([asdict(result) for result in results], file, indent=2)
+
+    @staticmethod
+    def format_table(results: list[BenchmarkResult]) -> str:
+        """:return: A summary of the results, one line per measure"""
+        lines = [f"{'tracker':<28}{'size':>11}{'count':>7}{'fps':>9}{'p50 (ms)':>10}{'p99 (ms)':>10}"
+                 f"{'err (px)':>10}{'err p95':>9}{'lost':>8}"]
+        for r in results:
+            lines.append(f"{r.tracker_type:<28}{f'{r.width}x{r.height}':>11}{r.trackers:>7}{r.fps:>9.1f}"
+                         f"{r.latency_p50_ms:>10.2f}{r.latency_p99_ms:>10.2f}{r.center_error_mean_px:>10.2f}"
+                         f"{r.center_error_p95_px:>9.2f}{r.loss_rate:>8.1%}")
+        return "\n".join(lines)
@@ -0,0 +1,131 @@
+"""
+Compares the coarse-to-fine pyramid template matching with the full-frame matching,
+on the videos of the `video_assets/` folder.
+
+For each video, templates are taken on a grid of points of the first frame, then searched
+in every frame with both methods. The script reports the time taken per search, and how many
+times the pyramid matching found a different location than the full-frame matching.
+For these mismatches, the score gap is the difference between the correlation of the template at
+the location found by the full-frame matching, and at the one found by the pyramid matching :
+a gap close to 0 means the template has several equally good matches in the frame.
+The pyramid matching must give the same results as the full-frame matching : the script exits
+with an error if any search mismatched.
+
+Usage (from the root of the repository) :
+    python -m src.pattern_tracking.benchmark.bench_pyramid_matching [--videos DIR] [--grid N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2 as cv
+import numpy as np
+
+# utils must be imported before RegionOfInterest, because of their circular import
+from src.pattern_tracking.shared import constants, utils
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
+
+DISPLAY_SIZE = (720, 480)
+"""Size of the frames given to the trackers by the application"""
+
+
+def load_frames(path: str, size: tuple[int, int] | None) -> list[np.ndarray]:
+    """Decodes all the frames of a video, resized to the given size if it is not None"""
+    capture = cv.VideoCapture(path)
+    frames = []
+    while True:
+        ret, frame = capture.read()
+        if not ret:
+            break
+        frames.append(frame if size is None else cv.resize(frame, size))
+    capture.release()
+    return frames
+
+
+def grid_templates(frame: np.ndarray, grid: int) -> list[np.ndarray]:
+    """Takes POI-sized templates centered on a grid x grid points of the frame"""
+    height, width = frame.shape[:2]
+    templates = []
+    for gy in range(1, grid + 1):
+        for gx in range(1, grid + 1):
+            x = width * gx // (grid + 1) - constants.POI_WIDTH // 2
+            y = height * gy // (grid + 1) - constants.POI_HEIGHT // 2
+            templates.append(frame[y: y + constants.POI_HEIGHT, x: x + constants.POI_WIDTH].copy())
+    return templates
+
+
+def top_left(region: RegionOfInterest) -> tuple[int, int] | None:
+    return None if region.is_undefined() else tuple(int(v) for v in region.get_coords(0))
+
+
+def score_at(frame: np.ndarray, template: np.ndarray, location: tuple[int, int]) -> float:
+    """Correlation of the template with the frame, at the given top-left location"""
+    x, y = location
+    patch = frame[y: y + template.shape[0], x: x + template.shape[1]]
+    return float(cv.matchTemplate(patch, template, cv.TM_CCORR_NORMED)[0, 0])
+
+
+def run(frames: list[np.ndarray], templates: list[np.ndarray]) -> dict[str, float]:
+    """Searches each template in each frame with both methods, and compares the results"""
+    pyramids = [utils.build_template_pyramid(t) for t in templates]
+    full_time, pyramid_time = 0.0, 0.0
+    mismatches, max_error, max_gap, searches = 0, 0.0, 0.0, 0
+    for frame in frames:
+        frame_data = SharedFrameData(frame)
+        for template, template_pyramid in zip(templates, pyramids):
+            start = time.perf_counter()
+            full = utils.find_template_in_image(frame, template, constants.DETECTION_THRESHOLD)
+            full_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            coarse_to_fine = utils.find_template_in_pyramid(frame_data, template_pyramid,
+                                                            constants.DETECTION_THRESHOLD)
+            pyramid_time += time.perf_counter() - start
+
+            searches += 1
+            full_location, pyramid_location = top_left(full), top_left(coarse_to_fine)
+            if full_location != pyramid_location:
+                mismatches += 1
+                if full_location is not None and pyramid_location is not None:
+                    max_error = max(max_error, float(np.hypot(*np.subtract(full_location, pyramid_location))))
+                    max_gap = max(max_gap, score_at(frame, template, full_location)
+                                  - score_at(frame, template, pyramid_location))
+    return {
+        "searches": searches,
+        "full_ms": 1000 * full_time / searches,
+        "pyramid_ms": 1000 * pyramid_time / searches,
+        "speedup": full_time / pyramid_time,
+        "mismatches": mismatches,
+        "max_error_px": max_error,
+        "max_score_gap": max_gap,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog="bench_pyramid_matching.py",
+        description="Compares the speed and the results of the pyramid and full-frame template matching"
+    )
+    parser.add_argument('--videos', default="video_assets", help="Folder containing the videos to use")
+    parser.add_argument('--grid', type=int, default=3, help="Number of templates per row and column")
+    args = parser.parse_args()
+
+    print(f"{'video':<30}{'size':>12}{'searches':>10}{'full (ms)':>11}{'pyramid (ms)':>14}"
+          f"{'speedup':>9}{'mismatches':>12}{'max err (px)':>14}{'score gap':>11}")
+    total_mismatches = 0
+    for video_name in sorted(os.listdir(args.videos)):
+        for size in (DISPLAY_SIZE, None):
+            video_frames = load_frames(os.path.join(args.videos, video_name), size)
+            if len(video_frames) == 0:
+                continue
+            result = run(video_frames, grid_templates(video_frames[0], args.grid))
+            size_str = "x".join(str(v) for v in video_frames[0].shape[1::-1])
+            print(f"{video_name[:29]:<30}{size_str:>12}{result['searches']:>10}{result['full_ms']:>11.2f}"
+                  f"{result['pyramid_ms']:>14.2f}{result['speedup']:>9.1f}{result['mismatches']:>12}"
+                  f"{result['max_error_px']:>14.1f}{result['max_score_gap']:>11.4f}")
+            total_mismatches += result["mismatches"]
+    if total_mismatches > 0:
+        print(f"The pyramid matching mismatched the full-frame matching {total_mismatches} times", file=sys.stderr)
+    sys.exit(1 if total_mismatches > 0 else 0)
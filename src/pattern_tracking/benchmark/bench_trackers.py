@@ -0,0 +1,48 @@
+"""
+Measures the speed and the accuracy of the types of tracker on synthetic feeds,
+in which textured patches beat along known trajectories (see SyntheticFeed).
+
+Reports, for each type of tracker, frame size and number of trackers : the number of frames
+processed per second, the percentiles of the latency of a frame, the error of the found centers
+and the rate at which the trackers lose their POI.
+
+Usage (from the root of the repository) :
+    python -m src.pattern_tracking.benchmark.bench_trackers [--frames N] [--sizes 720x480 ...]
+                                                            [--counts 1 10 ...] [--types TEMPLATE_TRACKER ...]
+                                                            [--output results.json]
+"""
+import argparse
+
+from src.pattern_tracking.benchmark.TrackerBenchmark import TrackerBenchmark
+from src.pattern_tracking.logic.tracker.TrackerManager import TrackerManager
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog="bench_trackers.py",
+        description="Measures the speed and the accuracy of the trackers on synthetic feeds"
+    )
+    parser.add_argument('--frames', type=int, default=TrackerBenchmark.DEFAULT_FRAMES,
+                        help="Number of frames tracked for each measure")
+    parser.add_argument('--sizes', type=parse_size, nargs='+', default=[(360, 240), (720, 480)],
+                        help="Sizes of the frames, as WIDTHxHEIGHT")
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 10],
+                        help="Numbers of trackers updated with each frame")
+    parser.add_argument('--types', nargs='+', choices=[t.name for t in TrackerType],
+                        help="Types of tracker to measure, all the available ones by default")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the synthetic feeds")
+    parser.add_argument('--output', help="JSON file in which to write the results")
+    args = parser.parse_args()
+
+    tracker_types = TrackerManager.available_tracker_types() if args.types is None \
+        else [TrackerType[name] for name in args.types]
+    results = TrackerBenchmark(args.frames, args.seed).run(tracker_types, args.sizes, args.counts)
+    print(TrackerBenchmark.format_table(results))
+    if args.output is not None:
+        TrackerBenchmark.save_json(results, args.output)
@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.pattern_tracking.benchmark.SyntheticFeed import SyntheticFeed
+from src.pattern_tracking.benchmark.TrackerBenchmark import TrackerBenchmark
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+
+
+class TestSyntheticFeed(TestCase):
+
+    def test_deterministic(self):
+        first, second = SyntheticFeed(200, 150, 3, seed=4), SyntheticFeed(200, 150, 3, seed=4)
+        for _ in range(3):
+            (frame_a, truth_a), (frame_b, truth_b) = first.next_frame(), second.next_frame()
+            np.testing.assert_array_equal(frame_a, frame_b)
+            np.testing.assert_array_equal(truth_a, truth_b)
+
+    def test_ground_truth_follows_the_beating(self):
+        feed = SyntheticFeed(360, 240, 4, jitter=0)
+        size = feed.get_patch_size()
+        truths = [feed.next_frame()[1] for _ in range(SyntheticFeed.DEFAULT_BEATING_PERIOD + 1)]
+        np.testing.assert_array_equal(truths[0], feed.get_rest_positions() + size / 2)
+        # back to the rest position after a whole beat
+        np.testing.assert_array_equal(truths[0], truths[-1])
+        self.assertGreater(np.abs(truths[SyntheticFeed.DEFAULT_BEATING_PERIOD // 4] - truths[0]).max(), 2)
+
+    def test_patches_stay_in_the_frame(self):
+        feed = SyntheticFeed(120, 100, 6)
+        half = feed.get_patch_size() / 2
+        for _ in range(40):
+            frame, truth = feed.next_frame()
+            self.assertTrue((truth - half >= 0).all())
+            self.assertTrue((truth + half <= frame.shape[1::-1]).all())
+
+    def test_benchmark_template_tracker(self):
+        result, = TrackerBenchmark(frames=5).run([TrackerType.TEMPLATE_TRACKER], [(240, 160)], [2])
+        self.assertEqual((240, 160, 2, 5), (result.width, result.height, result.trackers, result.frames))
+        self.assertEqual(0.0, result.loss_rate)
+        self.assertLess(result.center_error_mean_px, 1.0)
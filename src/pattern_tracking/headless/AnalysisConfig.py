@@ -0,0 +1,117 @@
+import json
+from dataclasses import dataclass, field
+
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+
+
+@dataclass
+class TrackerConfig:
+    """A tracker to create, and the regions it starts with"""
+    name: str
+    tracker_type: TrackerType
+    poi: tuple[int, int, int, int]
+    """(x, y, width, height) of the POI in the first frame"""
+    detection_region: tuple[int, int, int, int] | None = None
+    """(x, y, width, height) of the region in which the POI is searched, the whole frame if None"""
+    detection_threshold: float | None = None
+    """Minimal correlation of a match with the template, constants.DETECTION_THRESHOLD if None"""
+
+
+@dataclass
+class DistanceConfig:
+    """A pair of trackers whose distance is recorded, as a plot would in the GUI"""
+    name: str
+    first: str
+    second: str
+    """Names of the two trackers of the pair"""
+
+
+@dataclass
+class AnalysisConfig:
+    """
+    Trackers and distances of a headless analysis, usually loaded from a JSON file :
+        {
+            "frame_size": [720, 480],
+            "trackers": [
+                {"name": "left", "type": "TEMPLATE_TRACKER", "poi": [100, 120, 50, 50],
+                 "detection_region": [50, 70, 150, 150], "detection_threshold": 0.9},
+                {"name": "right", "type": "TEMPLATE_TRACKER", "poi": [400, 120, 50, 50]}
+            ],
+            "distances": [
+                {"name": "left-right", "first": "left", "second": "right"}
+            ]
+        }
+    The type of a tracker is the name of a member of TrackerType, its detection region and threshold are optional. The coordinates are expressed
+    in frames of `frame_size`, as they are in the GUI ; set it to null to work on the native frames.
+    """
+    DEFAULT_FRAME_SIZE = (720, 480)
+    """Size of the frames displayed by the GUI, in which the regions are selected"""
+
+    trackers: list[TrackerConfig]
+    distances: list[DistanceConfig] = field(default_factory=list)
+    frame_size: tuple[int, int] | None = DEFAULT_FRAME_SIZE
+    """Width and height to which each frame is resized before tracking, None to keep the size of the video"""
+
+    @staticmethod
+    def load(path: str) -> "AnalysisConfig":
+        """
+        Reads a configuration from a JSON file
+        :param path: Path of the file
+        """
+        with open(path) as file:
+            return AnalysisConfig.from_dict(json.load(file))
+
+    @staticmethod
+    def from_dict(data: dict) -> "AnalysisConfig":
+        """
+        Builds a configuration from its JSON representation, checking that it is consistent
+        :raise KeyError: If a required field, a type of tracker or a tracker of a distance is unknown
+        :raise ValueError: If a field has an invalid value
+        """
+        trackers = [
+            TrackerConfig(
+                name=entry["name"],
+                tracker_type=AnalysisConfig._tracker_type(entry["type"]),
+                poi=AnalysisConfig._box(entry["poi"], "poi"),
+                detection_region=None if entry.get("detection_region") is None
+                else AnalysisConfig._box(entry["detection_region"], "detection_region"),
+                detection_threshold=entry.get("detection_threshold")
+            )
+            for entry in data["trackers"]
+        ]
+        for tracker in trackers:
+            if tracker.detection_threshold is not None and not 0 <= tracker.detection_threshold <= 1:
+                raise ValueError(f"Invalid detection threshold {tracker.detection_threshold} of \"{tracker.name}\"")
+        names = [t.name for t in trackers]
+        if len(set(names)) != len(names):
+            raise ValueError("All trackers must have different names")
+
+        distances = [DistanceConfig(entry["name"], entry["first"], entry["second"])
+                     for entry in data.get("distances", [])]
+        for distance in distances:
+            for tracker_name in (distance.first, distance.second):
+                if tracker_name not in names:
+                    raise KeyError(f"Unknown tracker \"{tracker_name}\" in the distance \"{distance.name}\"")
+
+        frame_size = data.get("frame_size", AnalysisConfig.DEFAULT_FRAME_SIZE)
+        if frame_size is not None:
+            if len(frame_size) != 2 or min(frame_size) <= 0:
+                raise ValueError(f"Invalid frame size {frame_size}, expected [width, height]")
+            frame_size = (int(frame_size[0]), int(frame_size[1]))
+        return AnalysisConfig(trackers, distances, frame_size)
+
+    @staticmethod
+    def _tracker_type(name: str) -> TrackerType:
+        if name not in TrackerType.__members__:
+            raise KeyError(f"Unknown tracker type \"{name}\", available : {list(TrackerType.__members__)}")
+        tracker_type = TrackerType[name]
+        if not tracker_type.value.is_available():
+            raise ValueError(f"The tracker type \"{name}\" is not available with the installed OpenCV")
+        return tracker_type
+
+    @staticmethod
+    def _box(values: list[int], field_name: str) -> tuple[int, int, int, int]:
+        if len(values) != 4 or values[2] <= 0 or values[3] <= 0:
+            raise ValueError(f"Invalid {field_name} {values}, expected [x, y, width, height]")
+        x, y, width, height = (int(v) for v in values)
+        return x, y, width, height
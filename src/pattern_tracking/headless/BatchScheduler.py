@@ -0,0 +1,134 @@
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable
+
+import cv2 as cv
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.ResumableAnalysis import ResumableAnalysis
+
+
+@dataclass
+class BatchJob:
+    """Analysis of a video with a configuration, and its outcome once the batch has run"""
+    video_path: str
+    config_path: str
+    output_directory: str
+    frames: int | None = None
+    """Number of frames processed, once the job is done"""
+    error: str | None = None
+    """Description of the error that stopped the job, if any"""
+
+
+class BatchScheduler:
+    """
+    Runs the analyses of many videos on a pool of processes, each video being analysed by a ResumableAnalysis.
+
+    The jobs are given by a manifest, or by a directory of videos analysed with the same configuration.
+    Each job checkpoints its progress in its output directory : running the same batch again skips
+    the finished jobs, and resumes the interrupted ones from their last checkpoint.
+    A job that fails doesn't stop the others, its error is reported in its BatchJob.
+    """
+
+    VIDEO_EXTENSIONS = (".avi", ".mp4", ".mov", ".mkv")
+    """Extensions of the files considered as videos in a directory"""
+
+    def __init__(self, jobs: list[BatchJob], workers: int | None = None,
+                 checkpoint_interval: int = ResumableAnalysis.DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        :param jobs: The analyses to run
+        :param workers: Number of videos analysed in parallel, the number of CPUs by default
+        :param checkpoint_interval: Number of frames processed by a job between two checkpoints
+        """
+        self._jobs = jobs
+        self._workers = workers if workers is not None else max(1, os.cpu_count() or 1)
+        if self._workers < 1:
+            raise ValueError("At least one process is required")
+        self._checkpoint_interval = checkpoint_interval
+
+    @staticmethod
+    def from_directory(video_directory: str, config_path: str, output_directory: str) -> list[BatchJob]:
+        """
+        :return: A job for each video of the directory, analysed with the same configuration.
+                 The series of a video are written in a sub-directory of the output directory, named after the video
+        """
+        videos = sorted(name for name in os.listdir(video_directory)
+                        if os.path.splitext(name)[1].lower() in BatchScheduler.VIDEO_EXTENSIONS)
+        return [BatchJob(os.path.join(video_directory, name), config_path,
+                         os.path.join(output_directory, directory))
+                for name, directory in zip(videos, BatchScheduler._unique_directories(videos))]
+
+    @staticmethod
+    def from_manifest(path: str, output_directory: str) -> list[BatchJob]:
+        """
+        Reads the jobs from a JSON manifest :
+            {"jobs": [{"video": "day1/movie_10.avi", "config": "left-right.json", "output": "day1-10"}, ...]}
+        The paths of the videos and configurations are relative to the manifest, the outputs to the output directory.
+        The output is optional, named after the video by default
+        :raise KeyError: If a job has no video or no configuration
+        """
+        with open(path) as file:
+            entries = json.load(file)["jobs"]
+        base = os.path.dirname(path)
+        defaults = BatchScheduler._unique_directories([os.path.basename(entry["video"]) for entry in entries])
+        return [BatchJob(os.path.join(base, entry["video"]), os.path.join(base, entry["config"]),
+                         os.path.join(output_directory, entry.get("output", default)))
+                for entry, default in zip(entries, defaults)]
+
+    @staticmethod
+    def _unique_directories(video_names: list[str]) -> list[str]:
+        """:return: A directory named after each video, suffixed with a number when several videos have the same name"""
+        directories, used = [], set()
+        for name in video_names:
+            stem, directory, index = os.path.splitext(name)[0], os.path.splitext(name)[0], 1
+            while directory in used:
+                index += 1
+                directory = f"{stem}_{index}"
+            used.add(directory)
+            directories.append(directory)
+        return directories
+
+    def run(self, on_job_end: Callable[[BatchJob], None] | None = None) -> list[BatchJob]:
+        """
+        Runs the jobs that aren't done yet, blocking until all of them are over
+        :param on_job_end: Called with each job once it is over, in the order in which they end
+        :return: The jobs, with their outcome
+        """
+        pending = []
+        for job in self._jobs:
+            checkpoint = ResumableAnalysis.read_checkpoint(job.output_directory)
+            if checkpoint is not None and checkpoint["done"]:
+                job.frames = checkpoint["frames"]
+                if on_job_end is not None:
+                    on_job_end(job)
+            else:
+                pending.append(job)
+        if len(pending) == 0:
+            return self._jobs
+
+        # spawned processes don't inherit the threads of OpenCV, that may deadlock after a fork
+        with ProcessPoolExecutor(max_workers=min(self._workers, len(pending)),
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=cv.setNumThreads, initargs=(1,)) as executor:
+            futures = {executor.submit(BatchScheduler.run_job, job, self._checkpoint_interval): job for job in pending}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    job.frames = future.result()
+                except Exception as error:
+                    job.error = f"{type(error).__name__}: {error}"
+                if on_job_end is not None:
+                    on_job_end(job)
+        return self._jobs
+
+    @staticmethod
+    def run_job(job: BatchJob, checkpoint_interval: int) -> int:
+        """
+        Runs a job in the calling process, from its last checkpoint
+        :return: The number of frames of the video
+        """
+        config = AnalysisConfig.load(job.config_path)
+        return ResumableAnalysis(config, job.video_path, job.output_directory, checkpoint_interval).run()
@@ -0,0 +1,86 @@
+import numpy as np
+
+# utils must be imported before RegionOfInterest, because of their circular import
+from src.pattern_tracking.shared import utils
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.logic.DistanceComputer import DistanceComputer
+from src.pattern_tracking.logic.MetricsEngine import MetricsEngine
+from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+from src.pattern_tracking.logic.tracker.TrackerManager import TrackerManager
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class ConfiguredTrackers:
+    """
+    The trackers and the pairs of an AnalysisConfig, created in their own TrackerManager.
+
+    The POIs and detection regions of the configuration are selected in the first frame of the video,
+    given to setup(). The trackers are then updated frame by frame, and the distances of all the pairs
+    are computed at once by a MetricsEngine.
+    """
+
+    def __init__(self, config: AnalysisConfig):
+        self._config = config
+        self._tracker_manager = TrackerManager()
+        self._metrics_engine = MetricsEngine()
+        """Computes the distances of all the pairs at once"""
+        self._trackers: list[AbstractTracker] = []
+        """Trackers of the configuration, in its order"""
+        self._pairs: list[DistanceComputer] = []
+        """Pairs of the configuration, in its order"""
+        self._drawing_sheet: np.ndarray | None = None
+        """Scratch image on which all trackers draw, their drawings are never displayed"""
+
+    def get_trackers(self) -> list[AbstractTracker]:
+        return self._trackers
+
+    def get_pairs(self) -> list[DistanceComputer]:
+        return self._pairs
+
+    def setup(self, first_frame: np.ndarray):
+        """
+        Creates the trackers and the pairs of the configuration
+        :param first_frame: The first frame of the video, in which the regions of the configuration are selected
+        """
+        self._drawing_sheet = np.empty_like(first_frame)
+        for tracker_config in self._config.trackers:
+            self._trackers.append(
+                self._tracker_manager.create_tracker(tracker_config.name, tracker_config.tracker_type)
+            )
+        # the trackers need a base frame before their POI is set, as in the GUI
+        self._tracker_manager.update_trackers(first_frame, self._drawing_sheet)
+        for tracker, tracker_config in zip(self._trackers, self._config.trackers):
+            x, y, width, height = tracker_config.poi
+            tracker.set_poi(RegionOfInterest.new(first_frame, x, width, y, height))
+            if tracker_config.detection_region is not None:
+                x, y, width, height = tracker_config.detection_region
+                tracker.set_detection_region(RegionOfInterest.new(first_frame, x, width, y, height))
+            if tracker_config.detection_threshold is not None:
+                tracker.set_detection_threshold(tracker_config.detection_threshold)
+
+        by_name = {tracker.get_name(): tracker for tracker in self._trackers}
+        for distance_config in self._config.distances:
+            pair = DistanceComputer(distance_config.name, by_name[distance_config.first], by_name[distance_config.second])
+            self._metrics_engine.add_pair(pair)
+            self._pairs.append(pair)
+
+    def update(self, frame_number: int, frame: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Updates the trackers with a frame
+        :param frame_number: Number of the frame in the video
+        :param frame: The frame, of the same size as the first one
+        :return: The (N, 2) center of each tracker and the (P,) distance of each pair, NaN when not found,
+                 and the (N,) mask of the trackers that found their POI in this frame : the OpenCV trackers
+                 keep their previous center when they miss it, see AbstractTracker.is_found()
+        """
+        self._tracker_manager.update_trackers(frame, self._drawing_sheet)
+        distances = self._metrics_engine.compute(frame_number).distances
+        centers = np.full((len(self._trackers), 2), np.nan)
+        found = np.zeros(len(self._trackers), dtype=bool)
+        for row, tracker in enumerate(self._trackers):
+            center = tracker.get_found_poi_center()
+            if center is not None:
+                centers[row] = center
+            found[row] = tracker.is_found()
+        return centers, distances[[self._metrics_engine.get_column(pair) for pair in self._pairs]], found
+
@@ -0,0 +1,196 @@
+import uuid
+from threading import Event
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.ConfiguredTrackers import ConfiguredTrackers
+from src.pattern_tracking.logic.MetricsEngine import MetricsEngine
+from src.pattern_tracking.logic.storage.ResultCache import ResultCache
+from src.pattern_tracking.logic.storage.SeriesRecorder import SeriesRecorder
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+from src.pattern_tracking.shared import constants
+
+
+class HeadlessAnalysis:
+    """
+    Runs the trackers of a configuration over a whole video file, without any GUI,
+    and records the centers and distances with a SeriesRecorder, as the application does.
+
+    Frames are read as fast as the trackers process them, no frame is skipped nor throttled.
+    The POIs and detection regions of the configuration are selected in the first frame,
+    which is then tracked like the others. The analysis stops at the end of the stream,
+    once every row has been written to the disk.
+
+    With a ResultCache, the centers of a tracker are reused when the same video was analysed with
+    the same tracker before : its key is made of the fingerprint of the video, the type of the tracker,
+    its POI (location and template bytes), its detection region and the detection parameters.
+    Only the other trackers are updated, and when all the centers are cached, the video isn't decoded
+    at all : changing only the distances of a configuration is immediate.
+    """
+
+    CACHE_VERSION = "1"
+    """Part of the key of every cached result, to change when the trackers give different results"""
+    GROUPED_TRACKER_TYPES = (TrackerType.OPTICAL_FLOW_TRACKER,)
+    """Types of the trackers whose results depend on the other trackers of their type, they are cached as a group"""
+
+    def __init__(self, config: AnalysisConfig, video_path: str, output_directory: str,
+                 cache: ResultCache | None = None):
+        self._config = config
+        self._video_path = video_path
+        self._halt = Event()
+        """Set to interrupt the analysis before the end of the video"""
+        self._recorder = SeriesRecorder(output_directory, self._halt)
+        self._cache = cache
+        """Stores the centers of the trackers, None to always compute them"""
+        self._series_ids = [uuid.uuid4() for _ in config.trackers + config.distances]
+        """UUID of the series of each tracker, then of each distance"""
+        rows = {t.name: row for row, t in enumerate(config.trackers)}
+        self._pair_first = np.array([rows[d.first] for d in config.distances], dtype=int)
+        self._pair_second = np.array([rows[d.second] for d in config.distances], dtype=int)
+        """Row of the first and of the second tracker of each distance"""
+
+    def get_output_directory(self) -> str:
+        return self._recorder.get_directory()
+
+    def stop(self):
+        """Interrupts the analysis, the rows of the frames already processed are still written"""
+        self._halt.set()
+
+    def run(self) -> int:
+        """
+        Processes the whole video, blocking until the series are written
+        :return: The number of processed frames
+        :raise IOError: If the video cannot be read
+        """
+        capture = cv.VideoCapture(self._video_path)
+        if not capture.isOpened():
+            raise IOError(f"Cannot open the video file {self._video_path}")
+
+        frame_count = 0
+        self._recorder.start()
+        try:
+            frame = HeadlessAnalysis.read_frame(capture, self._config.frame_size)
+            if frame is None:
+                return 0
+            keys = self._cache_keys(frame) if self._cache is not None else {}
+            cached = self._complete_groups(
+                {name: centers for name, centers in ((n, self._cache.get(k)) for n, k in keys.items())
+                 if centers is not None})
+            computed = [t for t in self._config.trackers if t.name not in cached]
+            trackers = ConfiguredTrackers(AnalysisConfig(computed, [], self._config.frame_size))
+            trackers.setup(frame)
+            computed_centers = []
+
+            if len(computed) == 0 and len(cached) > 0:
+                # every center is known, the video doesn't need to be read
+                frame = None
+                frame_count = min(len(centers) for centers in cached.values())
+                for frame_number in range(frame_count):
+                    self._record(frame_number, self._merge(frame_number, cached, {}))
+            while frame is not None and not self._halt.is_set():
+                centers, _, _ = trackers.update(frame_count, frame)
+                self._record(frame_count, self._merge(frame_count, cached, {t.name: c for t, c in zip(computed, centers)}))
+                if self._cache is not None:
+                    computed_centers.append(centers)
+                frame_count += 1
+                frame = HeadlessAnalysis.read_frame(capture, self._config.frame_size)
+
+            # only the results of complete analyses are cached
+            if len(computed_centers) > 0 and not self._halt.is_set():
+                centers = np.array(computed_centers)
+                for index, tracker_config in enumerate(computed):
+                    self._cache.put(keys[tracker_config.name], centers[:, index])
+        finally:
+            capture.release()
+            self._recorder.stop(wait=True)
+        return frame_count
+
+    def _merge(self, frame_number: int, cached: dict[str, np.ndarray],
+               computed: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        :param cached: The cached centers of the trackers in all the frames, by name
+        :param computed: The centers computed in this frame, by name
+        :return: The (N, 2) center of each tracker of the configuration in the frame
+        """
+        centers = np.full((len(self._config.trackers), 2), np.nan)
+        for row, tracker_config in enumerate(self._config.trackers):
+            if tracker_config.name in cached:
+                if frame_number < len(cached[tracker_config.name]):
+                    centers[row] = cached[tracker_config.name][frame_number]
+            else:
+                centers[row] = computed[tracker_config.name]
+        return centers
+
+    def _record(self, frame_number: int, centers: np.ndarray):
+        """Records the centers of the trackers and the distances of the pairs in a frame"""
+        for series_id, tracker_config, (x, y) in zip(self._series_ids, self._config.trackers, centers):
+            self._recorder.record_row(SeriesRecorder.CENTERS_DIR, series_id, tracker_config.name,
+                                      (frame_number, x, y))
+        # the same computation as the application, on the centers that may come from the cache
+        distances, _ = MetricsEngine.pair_metrics(centers, self._pair_first, self._pair_second)
+        for series_id, distance_config, distance in zip(self._series_ids[len(self._config.trackers):],
+                                                        self._config.distances, distances):
+            self._recorder.record_row(SeriesRecorder.DISTANCES_DIR, series_id, distance_config.name,
+                                      (frame_number, float(distance)))
+
+    def _complete_groups(self, cached: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """
+        :param cached: The centers found in the cache, by name of tracker
+        :return: The cached centers that can be used : the trackers of a group, see GROUPED_TRACKER_TYPES,
+                 are all computed again when the centers of one of them aren't in the cache anymore
+        """
+        for tracker_type in HeadlessAnalysis.GROUPED_TRACKER_TYPES:
+            group = [t.name for t in self._config.trackers if t.tracker_type == tracker_type]
+            if any(name not in cached for name in group):
+                for name in group:
+                    cached.pop(name, None)
+        return cached
+
+    def _cache_keys(self, first_frame: np.ndarray) -> dict[str, str]:
+        """:return: The key of the cached centers of each tracker of the configuration"""
+        video = self._cache.fingerprint_file(self._video_path)
+        parameters = f"{HeadlessAnalysis.CACHE_VERSION} {self._config.frame_size} {constants.SEARCH_WINDOW_MARGIN}"
+        descriptions = {}
+        for tracker_config in self._config.trackers:
+            x, y, width, height = tracker_config.poi
+            template = np.ascontiguousarray(first_frame[y: y + height, x: x + width])
+            descriptions[tracker_config.name] = [
+                tracker_config.tracker_type.name, str(tracker_config.poi), str(tracker_config.detection_region),
+                str(constants.DETECTION_THRESHOLD if tracker_config.detection_threshold is None
+                    else tracker_config.detection_threshold),
+                str(template.shape), template.tobytes()
+            ]
+        keys = {}
+        for tracker_config in self._config.trackers:
+            parts = [video, parameters] + descriptions[tracker_config.name]
+            if tracker_config.tracker_type in HeadlessAnalysis.GROUPED_TRACKER_TYPES:
+                for other in self._config.trackers:
+                    if other.tracker_type == tracker_config.tracker_type and other is not tracker_config:
+                        parts += descriptions[other.name]
+            keys[tracker_config.name] = ResultCache.make_key(*parts)
+        return keys
+
+    @staticmethod
+    def read_frame(capture: cv.VideoCapture, frame_size: tuple[int, int] | None) -> np.ndarray | None:
+        """
+        :param capture: The opened video
+        :param frame_size: Width and height to which the frame is resized, None to keep its size
+        :return: The next frame of the video, or None at the end of the stream
+        """
+        success, frame = capture.read()
+        if not success:
+            return None
+        if frame_size is not None:
+            frame = cv.resize(frame, frame_size)
+        return frame
+
+    @staticmethod
+    def seek(capture: cv.VideoCapture, frame_number: int):
+        """Moves the capture to the given frame, reading the frames one by one if the backend cannot seek"""
+        capture.set(cv.CAP_PROP_POS_FRAMES, frame_number)
+        if int(capture.get(cv.CAP_PROP_POS_FRAMES)) != frame_number:
+            capture.set(cv.CAP_PROP_POS_FRAMES, 0)
+            for _ in range(frame_number):
+                capture.grab()
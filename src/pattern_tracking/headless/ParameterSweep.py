@@ -0,0 +1,184 @@
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, replace
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.ConfiguredTrackers import ConfiguredTrackers
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+from src.pattern_tracking.logic.video.FrameCache import FrameCache
+
+
+@dataclass
+class SweepVariant:
+    """A point of the grid of a sweep, applied to all the trackers of the configuration"""
+    tracker_type: TrackerType
+    detection_threshold: float
+    poi_size: tuple[int, int]
+    """Width and height of the POIs, in the coordinates of the configuration, around the center of each POI"""
+
+
+@dataclass
+class SweepResult:
+    """Speed and stability of the trackers of the configuration with a variant of the parameters"""
+    tracker_type: str
+    detection_threshold: float
+    poi_width: int
+    poi_height: int
+    frames: int
+    ms_per_frame: float
+    """Time taken to update all the trackers with a frame"""
+    loss_rate: float
+    """Fraction of the frames in which the trackers didn't find their POI"""
+    distance_mean: float
+    distance_std: float
+    """
+    Mean over the pairs of the mean and the standard deviation of their distance when found, in pixels of the cached
+    frames. NaN without pairs
+    """
+
+
+class ParameterSweep:
+    """
+    Compares variants of the parameters of a configuration (type of tracker, detection threshold, size of the POIs)
+    on the same video, decoded once in a FrameCache.
+
+    The variants are split in batches, one per process. Each process reads the memory-mapped frames once,
+    and updates the trackers of all the variants of its batch with each frame. The POIs and detection regions
+    of the configuration are scaled to the resolution of the cache, which can be reduced to speed the sweep up.
+    """
+
+    def __init__(self, config: AnalysisConfig, frame_cache: FrameCache, workers: int | None = None):
+        self._config = config
+        self._frame_cache = frame_cache
+        self._workers = workers if workers is not None else max(1, os.cpu_count() or 1)
+        if self._workers < 1:
+            raise ValueError("At least one process is required")
+
+    @staticmethod
+    def grid(tracker_types: list[TrackerType], thresholds: list[float],
+             poi_sizes: list[tuple[int, int]]) -> list[SweepVariant]:
+        """:return: Every combination of the given parameters"""
+        return [SweepVariant(tracker_type, threshold, poi_size)
+                for tracker_type in tracker_types for threshold in thresholds for poi_size in poi_sizes]
+
+    def variant_config(self, variant: SweepVariant) -> AnalysisConfig:
+        """:return: The configuration with the parameters of the variant, in the coordinates of the cached frames"""
+        config_size = self._config.frame_size if self._config.frame_size is not None \
+            else self._frame_cache.get_source_size()
+        frame_width, frame_height = self._frame_cache.get_frame_size()
+        scale_x, scale_y = frame_width / config_size[0], frame_height / config_size[1]
+
+        def scaled_box(x: float, y: float, width: float, height: float) -> tuple[int, int, int, int]:
+            """:return: The box scaled to the cached frames, moved inside them if required"""
+            width, height = max(1, round(width * scale_x)), max(1, round(height * scale_y))
+            x = int(np.clip(round(x * scale_x), 0, frame_width - width))
+            y = int(np.clip(round(y * scale_y), 0, frame_height - height))
+            return x, y, width, height
+
+        trackers = []
+        for tracker_config in self._config.trackers:
+            x, y, width, height = tracker_config.poi
+            poi_width, poi_height = variant.poi_size
+            center_x, center_y = x + width / 2, y + height / 2
+            trackers.append(replace(
+                tracker_config,
+                tracker_type=variant.tracker_type,
+                detection_threshold=variant.detection_threshold,
+                poi=scaled_box(center_x - poi_width / 2, center_y - poi_height / 2, poi_width, poi_height),
+                detection_region=None if tracker_config.detection_region is None
+                else scaled_box(*tracker_config.detection_region)
+            ))
+        return AnalysisConfig(trackers, self._config.distances, self._frame_cache.get_frame_size())
+
+    def run(self, variants: list[SweepVariant]) -> list[SweepResult]:
+        """
+        Evaluates the variants, blocking until all of them have been evaluated
+        :return: The result of each variant, in the order of the variants
+        """
+        if len(variants) == 0:
+            return []
+        configs = [self.variant_config(variant) for variant in variants]
+        batches = [list(range(start, len(variants), self._workers)) for start in range(min(self._workers, len(variants)))]
+        # spawned processes don't inherit the threads of OpenCV, that may deadlock after a fork
+        with ProcessPoolExecutor(max_workers=len(batches), mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=cv.setNumThreads, initargs=(1,)) as executor:
+            batch_results = executor.map(
+                ParameterSweep.evaluate_batch,
+                [self._frame_cache.get_directory() for _ in batches],
+                [[configs[index] for index in batch] for batch in batches]
+            )
+            measures = {}
+            for batch, results in zip(batches, batch_results):
+                measures.update(zip(batch, results))
+
+        return [SweepResult(variant.tracker_type.name, variant.detection_threshold, *variant.poi_size,
+                            **measures[index])
+                for index, variant in enumerate(variants)]
+
+    @staticmethod
+    def evaluate_batch(cache_directory: str, configs: list[AnalysisConfig]) -> list[dict]:
+        """
+        Tracks the cached frames with several configurations, in the calling process, each frame being read once
+        :return: The measures of each configuration, as the fields of a SweepResult
+        """
+        frame_cache = FrameCache(cache_directory)
+        if len(frame_cache) == 0:
+            raise ValueError(f"The frame cache {cache_directory} contains no frame")
+        # trackers that don't work on grayscale images are given the frames converted back to BGR
+        needs_bgr = [frame_cache.is_grayscale() and not c.trackers[0].tracker_type.value.grayscale
+                     if len(c.trackers) > 0 else False for c in configs]
+
+        def frames_of(index: int) -> tuple[np.ndarray, np.ndarray | None]:
+            frame = frame_cache[index]
+            return frame, cv.cvtColor(frame, cv.COLOR_GRAY2BGR) if any(needs_bgr) else None
+
+        frame, bgr = frames_of(0)
+        trackers = [ConfiguredTrackers(config) for config in configs]
+        for configured, bgr_required in zip(trackers, needs_bgr):
+            configured.setup(bgr if bgr_required else frame)
+
+        elapsed = np.zeros(len(configs))
+        distances = [np.empty((len(frame_cache), len(c.distances))) for c in configs]
+        found = [np.empty((len(frame_cache), len(c.trackers)), dtype=bool) for c in configs]
+        for frame_number in range(len(frame_cache)):
+            if frame_number > 0:
+                frame, bgr = frames_of(frame_number)
+            for index, (configured, bgr_required) in enumerate(zip(trackers, needs_bgr)):
+                start = time.perf_counter()
+                _, distances[index][frame_number], found[index][frame_number] = \
+                    configured.update(frame_number, bgr if bgr_required else frame)
+                elapsed[index] += time.perf_counter() - start
+
+        measures = []
+        for index in range(len(configs)):
+            pair_distances = distances[index]
+            has_distances = pair_distances.size > 0 and not np.isnan(pair_distances).all()
+            measures.append({
+                "frames": len(frame_cache),
+                "ms_per_frame": 1000 * elapsed[index] / len(frame_cache),
+                "loss_rate": float(1 - found[index].mean()) if found[index].size > 0 else 0.0,
+                "distance_mean": float(np.nanmean(np.nanmean(pair_distances, axis=0))) if has_distances else np.nan,
+                "distance_std": float(np.nanmean(np.nanstd(pair_distances, axis=0))) if has_distances else np.nan,
+            })
+        return measures
+
+    @staticmethod
+    def save_json(results: list[SweepResult], path: str):
+        """Writes the results to a JSON file, as a list of objects"""
+        with open(path, "w") as file:
+            json.dump([asdict(result) for result in results], file, indent=2)
+
+    @staticmethod
+    def format_table(results: list[SweepResult]) -> str:
+        """:return: A comparison of the results, one line per variant, the most stable first"""
+        lines = [f"{'tracker':<28}{'threshold':>10}{'poi':>9}{'ms/frame':>10}{'lost':>8}{'dist':>9}{'dist std':>10}"]
+        for r in sorted(results, key=lambda r: (r.loss_rate, np.nan_to_num(r.distance_std, nan=np.inf), r.ms_per_frame)):
+            lines.append(f"{r.tracker_type:<28}{r.detection_threshold:>10.3f}{f'{r.poi_width}x{r.poi_height}':>9}"
+                         f"{r.ms_per_frame:>10.2f}{r.loss_rate:>8.1%}{r.distance_mean:>9.2f}{r.distance_std:>10.3f}")
+        return "\n".join(lines)
@@ -0,0 +1,147 @@
+import json
+import os
+import uuid
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.ConfiguredTrackers import ConfiguredTrackers
+from src.pattern_tracking.headless.HeadlessAnalysis import HeadlessAnalysis
+from src.pattern_tracking.logic.storage.ChunkedSeriesWriter import ChunkedSeriesWriter
+from src.pattern_tracking.logic.storage.SeriesRecorder import SeriesRecorder
+
+
+class ResumableAnalysis:
+    """
+    Analyses a whole video like HeadlessAnalysis, saving a checkpoint every `checkpoint_interval` frames,
+    so that an interrupted analysis resumes from its last checkpoint instead of starting over.
+
+    The series are written synchronously, with the layout of a session of the application (see SeriesRecorder).
+    A checkpoint flushes them, then atomically replaces the checkpoint file with the number of frames
+    they contain. The OpenCV trackers cannot be serialized, so on resume, the trackers are created again
+    from the configuration and tracked over the `warmup_frames` frames preceding the checkpoint
+    (see TrackerTypeData), as the segments of a SegmentedAnalysis are. The rows written after the last
+    checkpoint are then overwritten.
+    """
+
+    CHECKPOINT_FILE_NAME = "checkpoint.json"
+    """Name of the checkpoint file, in the output directory"""
+    DEFAULT_CHECKPOINT_INTERVAL = 500
+    """Number of frames processed between two checkpoints"""
+
+    def __init__(self, config: AnalysisConfig, video_path: str, output_directory: str,
+                 checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL):
+        if checkpoint_interval <= 0:
+            raise ValueError("The number of frames between two checkpoints must be positive")
+        self._config = config
+        self._video_path = video_path
+        self._output_directory = output_directory
+        self._checkpoint_interval = checkpoint_interval
+        self._warmup_frames = max([t.tracker_type.value.warmup_frames for t in config.trackers], default=0)
+        """Number of frames tracked before the checkpoint on resume, for the trackers to reach their state"""
+
+    def get_output_directory(self) -> str:
+        return self._output_directory
+
+    @staticmethod
+    def read_checkpoint(output_directory: str) -> dict | None:
+        """
+        :param output_directory: The output directory of an analysis
+        :return: The last checkpoint saved by the analysis, None if it never started.
+                 Contains the number of processed "frames", the "series" directories and whether it is "done"
+        """
+        path = os.path.join(output_directory, ResumableAnalysis.CHECKPOINT_FILE_NAME)
+        if not os.path.exists(path):
+            return None
+        with open(path) as file:
+            return json.load(file)
+
+    def is_done(self) -> bool:
+        checkpoint = ResumableAnalysis.read_checkpoint(self._output_directory)
+        return checkpoint is not None and checkpoint["done"]
+
+    def run(self) -> int:
+        """
+        Processes the video from the last checkpoint, blocking until the series are written
+        :return: The total number of processed frames, including the ones processed before the checkpoint
+        :raise IOError: If the video cannot be read
+        :raise ValueError: If the checkpoint was saved by an analysis of different trackers or distances
+        """
+        checkpoint = ResumableAnalysis.read_checkpoint(self._output_directory)
+        if checkpoint is not None and checkpoint["done"]:
+            return checkpoint["frames"]
+
+        capture = cv.VideoCapture(self._video_path)
+        if not capture.isOpened():
+            raise IOError(f"Cannot open the video file {self._video_path}")
+        writers = self._open_writers(checkpoint)
+        series = [writer.get_directory() for writer in writers]
+        if checkpoint is None:
+            # the series are found again if the analysis is interrupted before its first checkpoint
+            self._save_checkpoint(writers, series, 0, done=False)
+        start = 0 if checkpoint is None else checkpoint["frames"]
+        frame_number = start
+        try:
+            frame = HeadlessAnalysis.read_frame(capture, self._config.frame_size)
+            if frame is not None:
+                trackers = ConfiguredTrackers(self._config)
+                trackers.setup(frame)
+                frame_number = max(0, start - self._warmup_frames)
+                if frame_number > 0:
+                    HeadlessAnalysis.seek(capture, frame_number)
+                    frame = HeadlessAnalysis.read_frame(capture, self._config.frame_size)
+            while frame is not None:
+                centers, distances, _ = trackers.update(frame_number, frame)
+                if frame_number >= start:
+                    self._append(writers, frame_number, centers, distances)
+                frame_number += 1
+                if frame_number > start and frame_number % self._checkpoint_interval == 0:
+                    self._save_checkpoint(writers, series, frame_number, done=False)
+                frame = HeadlessAnalysis.read_frame(capture, self._config.frame_size)
+            frame_number = max(frame_number, start)
+            self._save_checkpoint(writers, series, frame_number, done=True)
+        finally:
+            capture.release()
+            for writer in writers:
+                writer.close()
+        return frame_number
+
+    def _open_writers(self, checkpoint: dict | None) -> list[ChunkedSeriesWriter]:
+        """:return: The writer of the center of each tracker, then the one of each distance"""
+        names = [t.name for t in self._config.trackers] + [d.name for d in self._config.distances]
+        if checkpoint is None:
+            return [SeriesRecorder.create_writer(self._output_directory, SeriesRecorder.CENTERS_DIR, uuid.uuid4(), name)
+                    for name in names[:len(self._config.trackers)]] + \
+                   [SeriesRecorder.create_writer(self._output_directory, SeriesRecorder.DISTANCES_DIR, uuid.uuid4(), name)
+                    for name in names[len(self._config.trackers):]]
+
+        writers = [ChunkedSeriesWriter.reopen(os.path.join(self._output_directory, directory), checkpoint["frames"])
+                   for directory in checkpoint["series"]]
+        if [writer.get_name() for writer in writers] != names:
+            raise ValueError(f"The checkpoint of {self._output_directory} was saved with other trackers or distances")
+        return writers
+
+    def _append(self, writers: list[ChunkedSeriesWriter], frame_number: int,
+                centers: np.ndarray, distances: np.ndarray):
+        """Appends the results of a frame to the series"""
+        trackers = len(self._config.trackers)
+        for writer, (x, y) in zip(writers[:trackers], centers):
+            writer.append((frame_number, x, y))
+        for writer, distance in zip(writers[trackers:], distances):
+            writer.append((frame_number, distance))
+
+    def _save_checkpoint(self, writers: list[ChunkedSeriesWriter], series: list[str], frames: int, done: bool):
+        """Flushes the series, then atomically replaces the checkpoint file"""
+        for writer in writers:
+            writer.flush()
+        checkpoint = {
+            "video": self._video_path,
+            "frames": frames,
+            "series": [os.path.relpath(directory, self._output_directory) for directory in series],
+            "done": done
+        }
+        path = os.path.join(self._output_directory, ResumableAnalysis.CHECKPOINT_FILE_NAME)
+        with open(path + ".tmp", "w") as file:
+            json.dump(checkpoint, file)
+        os.replace(path + ".tmp", path)
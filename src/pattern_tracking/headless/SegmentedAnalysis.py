@@ -0,0 +1,157 @@
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.ConfiguredTrackers import ConfiguredTrackers
+from src.pattern_tracking.headless.HeadlessAnalysis import HeadlessAnalysis
+from src.pattern_tracking.logic.storage.SeriesRecorder import SeriesRecorder
+
+
+@dataclass
+class SegmentResult:
+    """Results of the frames of a segment of the video, in frame order"""
+    first_frame_number: int
+    centers: np.ndarray
+    """(F, N, 2) center of each tracker in each frame, NaN when not found"""
+    distances: np.ndarray
+    """(F, P) distance of each pair in each frame, NaN when not found"""
+
+
+class SegmentedAnalysis:
+    """
+    Analyses a single video on several processes, each one tracking a range of frames
+    with its own cv.VideoCapture and its own trackers. The results of the segments are written
+    in frame order, with the layout of a session of the application (see SeriesRecorder).
+
+    Every process selects the POIs of the configuration in the first frame of the video, as a sequential
+    analysis does, then seeks to its segment. A tracker whose result depends on the previous frames starts
+    tracking `warmup_frames` frames (see TrackerTypeData) before its segment, the results of these frames
+    being discarded : the trackers that search their template in each frame on their own need no warm-up,
+    and the segments of the other trackers overlap the end of the previous segment.
+
+    Seeking relies on the backend of OpenCV, it is exact for intra-frame codecs such as MJPG.
+    The last segment is read until the end of the stream, whatever the number of frames announced by the file.
+    """
+
+    def __init__(self, config: AnalysisConfig, video_path: str, output_directory: str,
+                 workers: int | None = None, segments: int | None = None):
+        """
+        :param workers: Number of processes, the number of CPUs by default
+        :param segments: Number of ranges of frames the video is split in, the number of processes by default
+        """
+        self._config = config
+        self._video_path = video_path
+        self._output_directory = output_directory
+        self._workers = workers if workers is not None else max(1, os.cpu_count() or 1)
+        self._segments = segments if segments is not None else self._workers
+        if self._workers < 1 or self._segments < 1:
+            raise ValueError("At least one process and one segment are required")
+        self._warmup_frames = max([t.tracker_type.value.warmup_frames for t in config.trackers], default=0)
+        """Number of frames tracked before each segment, for the trackers to reach their state"""
+
+    def get_output_directory(self) -> str:
+        return self._output_directory
+
+    def split(self, frame_count: int) -> list[tuple[int, int | None]]:
+        """
+        :param frame_count: Number of frames announced by the video file
+        :return: The first frame of each segment and the frame at which it stops (excluded), None for the last one
+        """
+        limits = np.linspace(0, frame_count, min(self._segments, max(frame_count, 1)) + 1).astype(int)
+        ranges: list[tuple[int, int | None]] = [(int(start), int(stop)) for start, stop in zip(limits[:-1], limits[1:])]
+        ranges[-1] = (ranges[-1][0], None)
+        return ranges
+
+    def run(self) -> int:
+        """
+        Processes the whole video, blocking until the series are written
+        :return: The number of processed frames
+        :raise IOError: If the video cannot be read
+        """
+        capture = cv.VideoCapture(self._video_path)
+        if not capture.isOpened():
+            raise IOError(f"Cannot open the video file {self._video_path}")
+        frame_count = max(0, int(capture.get(cv.CAP_PROP_FRAME_COUNT)))
+        capture.release()
+
+        ranges = self.split(frame_count)
+        writers = [SeriesRecorder.create_writer(self._output_directory, SeriesRecorder.CENTERS_DIR, uuid.uuid4(), t.name)
+                   for t in self._config.trackers]
+        writers += [SeriesRecorder.create_writer(self._output_directory, SeriesRecorder.DISTANCES_DIR, uuid.uuid4(), d.name)
+                    for d in self._config.distances]
+
+        processed = 0
+        # spawned processes don't inherit the threads of OpenCV, that may deadlock after a fork
+        with ProcessPoolExecutor(max_workers=min(self._workers, len(ranges)),
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=cv.setNumThreads, initargs=(1,)) as executor:
+            results = executor.map(
+                SegmentedAnalysis.track_segment,
+                *zip(*[(self._config, self._video_path, start, stop, self._warmup_frames) for start, stop in ranges])
+            )
+            # results are given in the order of the segments, so the series are written in frame order
+            for result in results:
+                processed += self._write(result, writers)
+        for writer in writers:
+            writer.close()
+        return processed
+
+    def _write(self, result: SegmentResult, writers: list) -> int:
+        """Appends the results of a segment to the series, :return: the number of frames of the segment"""
+        frames = len(result.centers)
+        frame_numbers = np.arange(result.first_frame_number, result.first_frame_number + frames, dtype=np.float64)
+        trackers = len(self._config.trackers)
+        for index, writer in enumerate(writers[:trackers]):
+            writer.append_rows(np.column_stack((frame_numbers, result.centers[:, index])))
+        for index, writer in enumerate(writers[trackers:]):
+            writer.append_rows(np.column_stack((frame_numbers, result.distances[:, index])))
+        for writer in writers:
+            writer.flush()
+        return frames
+
+    @staticmethod
+    def track_segment(config: AnalysisConfig, video_path: str, start: int, stop: int | None,
+                      warmup_frames: int) -> SegmentResult:
+        """
+        Tracks a range of frames of a video, in the calling process
+        :param config: The trackers and pairs to create
+        :param video_path: Path of the video file
+        :param start: First frame whose results are returned
+        :param stop: Frame at which to stop (excluded), None to stop at the end of the stream
+        :param warmup_frames: Number of frames tracked before `start`, whose results are discarded
+        """
+        capture = cv.VideoCapture(video_path)
+        if not capture.isOpened():
+            raise IOError(f"Cannot open the video file {video_path}")
+        trackers = ConfiguredTrackers(config)
+        centers, distances = [], []
+        try:
+            frame = HeadlessAnalysis.read_frame(capture, config.frame_size)
+            if frame is None:
+                return SegmentResult(start, np.empty((0, len(config.trackers), 2)), np.empty((0, len(config.distances))))
+            trackers.setup(frame)
+
+            frame_number = max(0, start - warmup_frames)
+            if frame_number > 0:
+                HeadlessAnalysis.seek(capture, frame_number)
+                frame = HeadlessAnalysis.read_frame(capture, config.frame_size)
+            while frame is not None and (stop is None or frame_number < stop):
+                frame_centers, frame_distances, _ = trackers.update(frame_number, frame)
+                if frame_number >= start:
+                    centers.append(frame_centers)
+                    distances.append(frame_distances)
+                frame_number += 1
+                frame = HeadlessAnalysis.read_frame(capture, config.frame_size)
+        finally:
+            capture.release()
+        return SegmentResult(
+            start,
+            np.array(centers).reshape(-1, len(config.trackers), 2),
+            np.array(distances).reshape(-1, len(config.distances))
+        )
@@ -0,0 +1,254 @@
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import cv2 as cv
+import numpy as np
+
+# utils must be imported before RegionOfInterest, because of their circular import
+from src.pattern_tracking.shared import constants, utils
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig, TrackerConfig
+from src.pattern_tracking.headless.ConfiguredTrackers import ConfiguredTrackers
+from src.pattern_tracking.logic.tracker.BatchedFFTMatcher import BatchedFFTMatcher
+from src.pattern_tracking.logic.tracker.HybridTracker import HybridTracker
+from src.pattern_tracking.logic.tracker.OpenCVTracker import OpenCVTracker
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
+
+
+@dataclass
+class StackTrackingResult:
+    """Results of the tracking of a stack of frames"""
+    centers: np.ndarray
+    """(T, N, 2) xy center of the POI of each tracker in each frame, NaN when not found"""
+    confidences: np.ndarray
+    """
+    (T, N) confidence of each tracker in each frame, between 0 and 1 : the correlation of the best match
+    for the template trackers, the score of the tracker when it has one, otherwise 1 when found and 0 when lost
+    """
+
+
+@dataclass
+class _TemplateSearch:
+    """The template of a template tracker, and where to search it"""
+    tracker_type: TrackerType
+    template: np.ndarray
+    pyramid: list[np.ndarray]
+    """The template at each level, for the coarse-to-fine matching"""
+    key: uuid.UUID
+    """Key of the template in the BatchedFFTMatcher of each thread"""
+    bounds: tuple[int, int, int, int]
+    """Corners (x_min, y_min, x_max, y_max) of the detection region, or of the whole frame"""
+    has_detection_region: bool
+    threshold: float
+
+
+class StackTracker:
+    """
+    Tracks the POIs of a configuration over a stack of frames held in memory, for NumPy pipelines :
+        centers = StackTracker(config).track(frames).centers
+
+    The POIs and detection regions are selected in the first frame, in the coordinates of the frames
+    of the stack (the frame size of the configuration is ignored). The distances aren't computed.
+
+    The trackers are grouped by the way they can be computed :
+        - template trackers search their template in each frame independently (the adaptive search of
+          TemplateTracker, that depends on the previous frames, isn't used), with the matching of their type :
+          cv.matchTemplate() on preallocated buffers, utils.find_template_in_pyramid(), or a BatchedFFTMatcher
+          of each thread shared by the FFT template trackers. The frames are processed in batches, each frame
+          of a batch on its own thread : OpenCV releases the GIL
+        - the OpenCV trackers (KCF, MIL...) depend on the previous frames, each one goes through
+          the whole stack on its own thread, its cv.Tracker being updated directly
+        - the other trackers are updated frame by frame through a TrackerManager, as in the application
+    """
+
+    TEMPLATE_TYPES = (TrackerType.TEMPLATE_TRACKER, TrackerType.PYRAMID_TEMPLATE_TRACKER,
+                      TrackerType.FFT_TEMPLATE_TRACKER)
+    """Types of the trackers that search their template in each frame independently"""
+    DEFAULT_BATCH_SIZE = 64
+    """Number of frames matched in parallel"""
+
+    def __init__(self, config: AnalysisConfig, batch_size: int = DEFAULT_BATCH_SIZE, workers: int | None = None):
+        if batch_size <= 0:
+            raise ValueError("The batch size must be positive")
+        self._config = config
+        self._batch_size = batch_size
+        self._workers = workers if workers is not None else max(1, os.cpu_count() or 1)
+        self._buffers = threading.local()
+        """Correlation maps and FFT matcher of each thread, renewed for each stack"""
+
+    def track(self, frames: np.ndarray) -> StackTrackingResult:
+        """
+        :param frames: Stack of frames, of shape (T, H, W) or (T, H, W, C)
+        :return: The center and the confidence of each tracker of the configuration in each frame
+        """
+        if frames.ndim not in (3, 4) or len(frames) == 0:
+            raise ValueError("Expected a non-empty stack of frames of shape (T, H, W) or (T, H, W, C)")
+        self._buffers = threading.local()
+        count = len(self._config.trackers)
+        centers = np.full((len(frames), count, 2), np.nan)
+        confidences = np.zeros((len(frames), count))
+
+        template_columns, opencv_columns, other_columns = [], [], []
+        opencv_trackers = []
+        for column, tracker_config in enumerate(self._config.trackers):
+            if tracker_config.tracker_type in StackTracker.TEMPLATE_TYPES:
+                template_columns.append(column)
+                continue
+            tracker = tracker_config.tracker_type.value.constructor(tracker_config.name)
+            if isinstance(tracker, OpenCVTracker) and not isinstance(tracker, HybridTracker):
+                opencv_columns.append(column)
+                opencv_trackers.append(tracker.get_base_tracker())
+            else:
+                other_columns.append(column)
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            if len(template_columns) > 0:
+                self._track_templates(executor, frames, template_columns, centers, confidences)
+            futures = [executor.submit(self._track_opencv, base_tracker, frames, self._config.trackers[column],
+                                       centers[:, column], confidences[:, column])
+                       for column, base_tracker in zip(opencv_columns, opencv_trackers)]
+            if len(other_columns) > 0:
+                self._track_others(frames, other_columns, centers, confidences)
+            for future in futures:
+                future.result()
+        return StackTrackingResult(centers, confidences)
+
+    def _track_templates(self, executor: ThreadPoolExecutor, frames: np.ndarray, columns: list[int],
+                         centers: np.ndarray, confidences: np.ndarray):
+        """Matches the template of each tracker in each frame, by batches of frames processed in parallel"""
+        first_frame = frames[0]
+        searches = []
+        for column in columns:
+            tracker_config = self._config.trackers[column]
+            x, y, width, height = tracker_config.poi
+            template = np.ascontiguousarray(first_frame[y: y + height, x: x + width])
+            region = tracker_config.detection_region if tracker_config.detection_region is not None \
+                else (0, 0, first_frame.shape[1], first_frame.shape[0])
+            searches.append(_TemplateSearch(
+                tracker_type=tracker_config.tracker_type,
+                template=template,
+                pyramid=utils.build_template_pyramid(template),
+                key=uuid.uuid4(),
+                bounds=StackTracker._clip_region(region, first_frame.shape),
+                has_detection_region=tracker_config.detection_region is not None,
+                threshold=constants.DETECTION_THRESHOLD if tracker_config.detection_threshold is None
+                else tracker_config.detection_threshold
+            ))
+
+        # (T, N, 3) center and correlation of the best match of each template tracker in each frame
+        matches = np.empty((len(frames), len(columns), 3))
+        for start in range(0, len(frames), self._batch_size):
+            indices = range(start, min(start + self._batch_size, len(frames)))
+            for index, match in zip(indices, executor.map(lambda i: self._match_frame(frames[i], searches), indices)):
+                matches[index] = match
+
+        found = ~np.isnan(matches[..., 0]) & (matches[..., 2] >= np.array([s.threshold for s in searches]))
+        for row, column in enumerate(columns):
+            confidences[:, column] = matches[:, row, 2]
+            centers[found[:, row], column] = matches[found[:, row], row, :2]
+
+    def _match_frame(self, frame: np.ndarray, searches: list[_TemplateSearch]) -> np.ndarray:
+        """
+        :return: The (N, 3) center and correlation of the best match of each template in the frame,
+                 the center being NaN if the template couldn't be searched
+        """
+        if not hasattr(self._buffers, "maps"):
+            self._buffers.maps = [None] * len(searches)
+            self._buffers.matcher = BatchedFFTMatcher()
+            for search in searches:
+                if search.tracker_type == TrackerType.FFT_TEMPLATE_TRACKER:
+                    self._buffers.matcher.register(search.key, search.template, frame.shape)
+        # the pyramid of the frame and its spectrum are computed once for all the templates
+        frame_data = SharedFrameData(frame)
+        result = np.full((len(searches), 3), np.nan)
+        result[:, 2] = 0.0
+        for index, search in enumerate(searches):
+            x_min, y_min, x_max, y_max = search.bounds
+            height, width = search.template.shape[:2]
+            if x_max - x_min < width or y_max - y_min < height:
+                continue
+            if search.tracker_type == TrackerType.PYRAMID_TEMPLATE_TRACKER:
+                result[index] = self._match_pyramid(frame_data, search)
+                continue
+            if search.tracker_type == TrackerType.FFT_TEMPLATE_TRACKER:
+                # only keep the locations where the template is entirely in the detection region
+                confidence_map = self._buffers.matcher.get_confidence_map(frame_data, search.key)[
+                    y_min: y_max - height + 1, x_min: x_max - width + 1]
+            else:
+                confidence_map = self._buffers.maps[index]
+                if confidence_map is None \
+                        or confidence_map.shape != (y_max - y_min - height + 1, x_max - x_min - width + 1):
+                    confidence_map = None
+                confidence_map = cv.matchTemplate(frame[y_min: y_max, x_min: x_max], search.template,
+                                                  cv.TM_CCORR_NORMED, result=confidence_map)
+                self._buffers.maps[index] = confidence_map
+            _, max_val, _, (x, y) = cv.minMaxLoc(confidence_map)
+            # same center as utils.middle_of() on the corners of the match
+            result[index] = (x_min + x + width // 2, y_min + y + height // 2, max_val)
+        return result
+
+    @staticmethod
+    def _match_pyramid(frame_data: SharedFrameData, search: _TemplateSearch) -> tuple[float, float, float]:
+        """:return: The center and the correlation of the match of the coarse-to-fine matching, a NaN center if lost"""
+        frame = frame_data.get_frame()
+        bounds = RegionOfInterest.new_empty()
+        if search.has_detection_region:
+            x_min, y_min, x_max, y_max = search.bounds
+            bounds = RegionOfInterest.new(frame, x_min, x_max - x_min, y_min, y_max - y_min)
+        found = utils.find_template_in_pyramid(frame_data, search.pyramid, search.threshold, bounds)
+        if found.is_undefined():
+            return np.nan, np.nan, 0.0
+        top_left, bottom_right = found.get_coords()
+        x, y = top_left
+        height, width = search.template.shape[:2]
+        score = cv.matchTemplate(frame[y: y + height, x: x + width], search.template, cv.TM_CCORR_NORMED)[0, 0]
+        center = utils.middle_of(top_left, bottom_right)
+        return float(center[0]), float(center[1]), float(score)
+
+    @staticmethod
+    def _track_opencv(base_tracker: cv.Tracker, frames: np.ndarray, tracker_config: TrackerConfig,
+                      centers: np.ndarray, confidences: np.ndarray):
+        """
+        Updates an OpenCV tracker with each frame of the stack
+        :param centers: The (T, 2) view of the centers of the tracker, filled by this method
+        :param confidences: The (T,) view of the confidences of the tracker, filled by this method
+        """
+        x, y, width, height = tracker_config.poi
+        x_min, y_min, x_max, y_max = (0, 0, frames.shape[2], frames.shape[1]) \
+            if tracker_config.detection_region is None \
+            else StackTracker._clip_region(tracker_config.detection_region, frames.shape[1:])
+        base_tracker.init(frames[0][y_min: y_max, x_min: x_max], (x - x_min, y - y_min, width, height))
+        has_score = hasattr(base_tracker, "getTrackingScore")
+        for index, frame in enumerate(frames):
+            found, (box_x, box_y, box_width, box_height) = base_tracker.update(frame[y_min: y_max, x_min: x_max])
+            if found:
+                centers[index] = (x_min + int(box_x) + int(box_width) // 2, y_min + int(box_y) + int(box_height) // 2)
+                confidences[index] = base_tracker.getTrackingScore() if has_score else 1.0
+
+    def _track_others(self, frames: np.ndarray, columns: list[int], centers: np.ndarray, confidences: np.ndarray):
+        """Updates the other trackers with each frame, through a TrackerManager"""
+        trackers = ConfiguredTrackers(AnalysisConfig([self._config.trackers[c] for c in columns], []))
+        trackers.setup(frames[0])
+        for index, frame in enumerate(frames):
+            frame_centers, _, _ = trackers.update(index, frame)
+            centers[index, columns] = frame_centers
+            for row, (column, tracker) in enumerate(zip(columns, trackers.get_trackers())):
+                if hasattr(tracker, "get_confidence"):
+                    confidences[index, column] = tracker.get_confidence()
+                else:
+                    confidences[index, column] = 0.0 if np.isnan(frame_centers[row]).any() else 1.0
+
+    @staticmethod
+    def _clip_region(region: tuple[int, int, int, int], shape: tuple[int, ...]) -> tuple[int, int, int, int]:
+        """:return: The (x_min, y_min, x_max, y_max) corners of a (x, y, width, height) region, inside the frame"""
+        x, y, width, height = region
+        return max(0, x), max(0, y), min(shape[1], x + width), min(shape[0], y + height)
+
+
+def track(frames: np.ndarray, config: AnalysisConfig) -> StackTrackingResult:
+    """Shortcut for StackTracker(config).track(frames)"""
+    return StackTracker(config).track(frames)
@@ -0,0 +1,55 @@
+"""
+Analyses a video file without the GUI, as fast as the trackers allow.
+
+The trackers, their POI and detection regions, and the pairs whose distance is recorded,
+are read from a JSON configuration file (see AnalysisConfig). The centers and the distances
+are written in the output directory, with the layout of a session of the application (see SeriesRecorder).
+The centers of sequential analyses are cached, analysing the same video with the same trackers
+again only computes the distances (see HeadlessAnalysis).
+
+With more than one worker, the video is split in ranges of frames tracked by separate processes
+(see SegmentedAnalysis).
+
+Usage (from the root of the repository) :
+    python -m src.pattern_tracking.headless CONFIG VIDEO [--output DIRECTORY] [--workers N] [--segments N]
+                                              [--cache DIRECTORY | --no-cache]
+"""
+import argparse
+import os
+import time
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.HeadlessAnalysis import HeadlessAnalysis
+from src.pattern_tracking.headless.SegmentedAnalysis import SegmentedAnalysis
+from src.pattern_tracking.logic.storage.ResultCache import ResultCache
+from src.pattern_tracking.shared import constants
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog="python -m src.pattern_tracking.headless",
+        description="Tracks the POIs of a configuration file over a video, and records their centers and distances"
+    )
+    parser.add_argument('config', help="JSON file describing the trackers and the distances")
+    parser.add_argument('video', help="Video file to analyse")
+    parser.add_argument('--output', default=os.path.join(constants.RECORDINGS_DIR, time.strftime("%Y%m%d-%H%M%S")),
+                        help="Directory in which to write the series, a new one in the recordings by default")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of processes tracking ranges of frames in parallel, 1 to track sequentially")
+    parser.add_argument('--segments', type=int,
+                        help="Number of ranges of frames the video is split in, the number of workers by default")
+    parser.add_argument('--cache', default=constants.RESULT_CACHE_DIR,
+                        help="Directory of the cache of the centers of the trackers")
+    parser.add_argument('--no-cache', action='store_true', help="Always compute the centers of the trackers")
+    args = parser.parse_args()
+
+    config = AnalysisConfig.load(args.config)
+    if args.workers > 1:
+        analysis = SegmentedAnalysis(config, args.video, args.output, args.workers, args.segments)
+    else:
+        cache = None if args.no_cache else ResultCache(args.cache, constants.RESULT_CACHE_MAX_BYTES)
+        analysis = HeadlessAnalysis(config, args.video, args.output, cache)
+    start = time.perf_counter()
+    frames = analysis.run()
+    elapsed = time.perf_counter() - start
+    print(f"{frames} frames analysed in {elapsed:.1f} s ({frames / max(elapsed, 1e-9):.1f} fps), "
+          f"series written to {analysis.get_output_directory()}")
@@ -0,0 +1,46 @@
+"""
+Analyses many videos without the GUI, on a pool of processes (see BatchScheduler).
+
+The videos are either all the videos of a directory, analysed with the same configuration,
+or the jobs of a JSON manifest. Each video gets its own output directory, in which its progress
+is checkpointed : running the same command again resumes the interrupted batch.
+
+Usage (from the root of the repository) :
+    python -m src.pattern_tracking.headless.batch --videos DIRECTORY --config CONFIG --output DIRECTORY [--workers N]
+    python -m src.pattern_tracking.headless.batch --manifest MANIFEST --output DIRECTORY [--workers N]
+"""
+import argparse
+import sys
+
+from src.pattern_tracking.headless.BatchScheduler import BatchJob, BatchScheduler
+from src.pattern_tracking.headless.ResumableAnalysis import ResumableAnalysis
+
+
+def report(job: BatchJob):
+    outcome = f"{job.frames} frames" if job.error is None else f"FAILED ({job.error})"
+    print(f"{job.video_path} -> {job.output_directory} : {outcome}", flush=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog="python -m src.pattern_tracking.headless.batch",
+        description="Tracks the POIs of configuration files over many videos, resuming interrupted batches"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--videos', help="Directory of the videos to analyse, all with the configuration --config")
+    source.add_argument('--manifest', help="JSON file listing the videos and the configuration of each one")
+    parser.add_argument('--config', help="JSON configuration used for all the videos of --videos")
+    parser.add_argument('--output', required=True, help="Directory in which the output directory of each video is created")
+    parser.add_argument('--workers', type=int, help="Number of videos analysed in parallel, the number of CPUs by default")
+    parser.add_argument('--checkpoint-interval', type=int, default=ResumableAnalysis.DEFAULT_CHECKPOINT_INTERVAL,
+                        help="Number of frames processed between two checkpoints of a video")
+    args = parser.parse_args()
+    if args.videos is not None and args.config is None:
+        parser.error("--videos requires --config")
+
+    jobs = BatchScheduler.from_directory(args.videos, args.config, args.output) if args.videos is not None \
+        else BatchScheduler.from_manifest(args.manifest, args.output)
+    jobs = BatchScheduler(jobs, args.workers, args.checkpoint_interval).run(on_job_end=report)
+    failed = [job for job in jobs if job.error is not None]
+    print(f"{len(jobs) - len(failed)} of {len(jobs)} videos analysed")
+    sys.exit(1 if len(failed) > 0 else 0)
@@ -0,0 +1,62 @@
+"""
+Compares variants of the parameters of a configuration on a video (see ParameterSweep) :
+types of tracker, detection thresholds and sizes of the POIs.
+
+The video is decoded once in a frame cache, optionally at a reduced resolution or in grayscale,
+then every combination of the given parameters is evaluated on a pool of processes.
+A table comparing the loss rate, the time per frame and the stability of the distances is printed.
+
+Usage (from the root of the repository) :
+    python -m src.pattern_tracking.headless.sweep CONFIG VIDEO [--types TEMPLATE_TRACKER ...]
+                                                  [--thresholds 0.85 0.91 ...] [--poi-sizes 40x40 50x50 ...]
+                                                  [--frame-size WIDTHxHEIGHT] [--grayscale] [--frame-cache DIRECTORY]
+                                                  [--workers N] [--output results.json]
+"""
+import argparse
+import os
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.ParameterSweep import ParameterSweep
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+from src.pattern_tracking.logic.video.FrameCache import FrameCache
+from src.pattern_tracking.shared import constants
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog="python -m src.pattern_tracking.headless.sweep",
+        description="Compares types of tracker, detection thresholds and POI sizes on a video decoded once"
+    )
+    parser.add_argument('config', help="JSON file describing the trackers and the distances")
+    parser.add_argument('video', help="Video file to analyse")
+    parser.add_argument('--types', nargs='+', choices=[t.name for t in TrackerType], default=["TEMPLATE_TRACKER"],
+                        help="Types of tracker to compare")
+    parser.add_argument('--thresholds', type=float, nargs='+', default=[constants.DETECTION_THRESHOLD],
+                        help="Detection thresholds to compare")
+    parser.add_argument('--poi-sizes', type=parse_size, nargs='+',
+                        default=[(constants.POI_WIDTH, constants.POI_HEIGHT)],
+                        help="Sizes of the POIs to compare, as WIDTHxHEIGHT in the coordinates of the configuration")
+    parser.add_argument('--frame-size', type=parse_size,
+                        help="Size of the cached frames as WIDTHxHEIGHT, the frame size of the configuration by default")
+    parser.add_argument('--grayscale', action='store_true', help="Cache the frames in grayscale")
+    parser.add_argument('--frame-cache', help="Directory of the frame cache, named after the video by default")
+    parser.add_argument('--workers', type=int, help="Number of processes, the number of CPUs by default")
+    parser.add_argument('--output', help="JSON file in which to write the results")
+    args = parser.parse_args()
+
+    config = AnalysisConfig.load(args.config)
+    frame_size = args.frame_size if args.frame_size is not None else config.frame_size
+    cache_directory = args.frame_cache if args.frame_cache is not None else os.path.join(
+        constants.FRAME_CACHE_DIR, os.path.splitext(os.path.basename(args.video))[0]
+    )
+    frame_cache = FrameCache.build(args.video, cache_directory, frame_size, args.grayscale)
+    variants = ParameterSweep.grid([TrackerType[name] for name in args.types], args.thresholds, args.poi_sizes)
+    results = ParameterSweep(config, frame_cache, args.workers).run(variants)
+    print(ParameterSweep.format_table(results))
+    if args.output is not None:
+        ParameterSweep.save_json(results, args.output)
@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import numpy as np
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.ConfiguredTrackers import ConfiguredTrackers
+from src.pattern_tracking.headless.HeadlessAnalysis import HeadlessAnalysis
+from src.pattern_tracking.headless.testing_utils import SyntheticVideoTestCase, read_session
+from src.pattern_tracking.logic.storage.ResultCache import ResultCache
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+
+
+class TestHeadlessAnalysis(SyntheticVideoTestCase):
+
+    def test_every_frame_is_recorded(self):
+        for tracker_types in (("TEMPLATE_TRACKER", "TEMPLATE_TRACKER"), ("PYRAMID_TEMPLATE_TRACKER", "FFT_TEMPLATE_TRACKER")):
+            with self.subTest(tracker_types=tracker_types):
+                output = os.path.join(self._directory.name, "_".join(tracker_types))
+                config = AnalysisConfig.from_dict(self.config_dict(*tracker_types))
+                frames = HeadlessAnalysis(config, self._video_path, output).run()
+                self.assertEqual(TestHeadlessAnalysis.FRAMES, frames)
+
+                series = read_session(output)
+                self.assertEqual({"first", "second", "pair"}, series.keys())
+                for rows in series.values():
+                    np.testing.assert_array_equal(np.arange(frames), rows[:, 0])
+                    self.assertFalse(np.isnan(rows[:, 1:]).any())
+
+    def test_cached_centers_are_reused(self):
+        cache = ResultCache(os.path.join(self._directory.name, "cache"), max_bytes=1 << 20)
+        first_output = os.path.join(self._directory.name, "first")
+        HeadlessAnalysis(self._config, self._video_path, first_output, cache).run()
+        self.assertEqual(2, len([n for n in os.listdir(cache.get_directory()) if n.endswith(".npy")]))
+
+        # only the distances change, no tracker is created again
+        self._config.distances[0].name = "renamed pair"
+        second_output = os.path.join(self._directory.name, "second")
+        with patch.object(ConfiguredTrackers, "update", side_effect=AssertionError("centers recomputed")):
+            frames = HeadlessAnalysis(self._config, self._video_path, second_output, cache).run()
+        self.assertEqual(TestHeadlessAnalysis.FRAMES, frames)
+        first, second = read_session(first_output), read_session(second_output)
+        first["renamed pair"] = first.pop("pair")
+        self.assertEqual(first.keys(), second.keys())
+        for name, rows in first.items():
+            np.testing.assert_array_equal(rows, second[name])
+
+    def test_partially_evicted_group_is_computed_again(self):
+        for tracker_config in self._config.trackers:
+            tracker_config.tracker_type = TrackerType.OPTICAL_FLOW_TRACKER
+        cache = ResultCache(os.path.join(self._directory.name, "cache"), max_bytes=1 << 20)
+        first_output = os.path.join(self._directory.name, "first")
+        HeadlessAnalysis(self._config, self._video_path, first_output, cache).run()
+        entries = sorted(n for n in os.listdir(cache.get_directory()) if n.endswith(".npy"))
+        os.remove(os.path.join(cache.get_directory(), entries[0]))
+
+        second_output = os.path.join(self._directory.name, "second")
+        with patch.object(ConfiguredTrackers, "setup", autospec=True, side_effect=ConfiguredTrackers.setup) as setup:
+            HeadlessAnalysis(self._config, self._video_path, second_output, cache).run()
+        # both trackers of the group are created again, not only the evicted one
+        self.assertEqual(2, len(setup.call_args.args[0].get_trackers()))
+        first, second = read_session(first_output), read_session(second_output)
+        for name, rows in first.items():
+            np.testing.assert_array_equal(rows, second[name])
+
+    def test_unreadable_video(self):
+        with self.assertRaises(IOError):
+            HeadlessAnalysis(self._config, os.path.join(self._directory.name, "missing.avi"),
+                             os.path.join(self._directory.name, "session")).run()
+
+    def test_never_imports_qt(self):
+        code = "import sys, src.pattern_tracking.headless.HeadlessAnalysis; " \
+               "print(any(m.startswith('PySide6') for m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual("False", result.stdout.strip())
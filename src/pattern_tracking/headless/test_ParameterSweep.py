@@ -0,0 +1,55 @@
+import os
+
+import numpy as np
+
+from src.pattern_tracking.headless.ParameterSweep import ParameterSweep
+from src.pattern_tracking.headless.testing_utils import SyntheticVideoTestCase
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+from src.pattern_tracking.logic.video.FrameCache import FrameCache
+
+
+class TestParameterSweep(SyntheticVideoTestCase):
+    FRAMES = 15
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._cache_directory = os.path.join(self._directory.name, "frames")
+
+    def test_frame_cache(self):
+        cache = FrameCache.build(self._video_path, self._cache_directory, (160, 120), grayscale=True)
+        self.assertEqual(TestParameterSweep.FRAMES, len(cache))
+        self.assertEqual((120, 160), cache[0].shape)
+        self.assertEqual((320, 240), cache.get_source_size())
+        # built with the same options, the cache is reused as it is
+        mtime = os.stat(os.path.join(self._cache_directory, FrameCache.FRAMES_FILE_NAME)).st_mtime_ns
+        FrameCache.build(self._video_path, self._cache_directory, (160, 120), grayscale=True)
+        self.assertEqual(mtime, os.stat(os.path.join(self._cache_directory, FrameCache.FRAMES_FILE_NAME)).st_mtime_ns)
+        # the video is recorded again, the cache is rebuilt
+        video_mtime = os.stat(self._video_path).st_mtime_ns
+        os.utime(self._video_path, ns=(video_mtime + 10 ** 9, video_mtime + 10 ** 9))
+        FrameCache.build(self._video_path, self._cache_directory, (160, 120), grayscale=True)
+        self.assertNotEqual(mtime, os.stat(os.path.join(self._cache_directory, FrameCache.FRAMES_FILE_NAME)).st_mtime_ns)
+
+    def test_variants_are_scaled_to_the_cache(self):
+        cache = FrameCache.build(self._video_path, self._cache_directory, (160, 120))
+        variant = ParameterSweep.grid([TrackerType.FFT_TEMPLATE_TRACKER], [0.8], [(40, 40)])[0]
+        config = ParameterSweep(self._config, cache, workers=1).variant_config(variant)
+        x, y, width, height = self._config.trackers[0].poi
+        self.assertEqual((20, 20), config.trackers[0].poi[2:])
+        np.testing.assert_allclose(((x + width / 2) / 2, (y + height / 2) / 2),
+                                   (config.trackers[0].poi[0] + 10, config.trackers[0].poi[1] + 10), atol=1)
+        self.assertEqual(TrackerType.FFT_TEMPLATE_TRACKER, config.trackers[1].tracker_type)
+        self.assertEqual(0.8, config.trackers[1].detection_threshold)
+
+    def test_sweep(self):
+        cache = FrameCache.build(self._video_path, self._cache_directory, grayscale=True)
+        # the variants are sent to the worker processes, the pyramid type must survive the pickling
+        variants = ParameterSweep.grid([TrackerType.TEMPLATE_TRACKER, TrackerType.PYRAMID_TEMPLATE_TRACKER,
+                                        TrackerType.FIXED_POINT_TRACKER], [0.9], [(50, 50)])
+        results = ParameterSweep(self._config, cache, workers=2).run(variants)
+        self.assertEqual(["TEMPLATE_TRACKER", "PYRAMID_TEMPLATE_TRACKER", "FIXED_POINT_TRACKER"],
+                         [r.tracker_type for r in results])
+        for result in results:
+            self.assertEqual(TestParameterSweep.FRAMES, result.frames)
+            self.assertEqual(0.0, result.loss_rate)
+        self.assertIn("FIXED_POINT_TRACKER", ParameterSweep.format_table(results))
@@ -0,0 +1,52 @@
+import json
+import os
+
+import numpy as np
+
+from src.pattern_tracking.headless.BatchScheduler import BatchScheduler
+from src.pattern_tracking.headless.ResumableAnalysis import ResumableAnalysis
+from src.pattern_tracking.headless.testing_utils import SyntheticVideoTestCase, read_session
+from src.pattern_tracking.logic.storage.ChunkedSeriesWriter import ChunkedSeriesWriter
+
+
+class TestResumableAnalysis(SyntheticVideoTestCase):
+    FRAMES = 25
+
+    def test_resume_gives_the_same_results(self):
+        complete_dir = os.path.join(self._directory.name, "complete")
+        ResumableAnalysis(self._config, self._video_path, complete_dir, checkpoint_interval=10).run()
+
+        # simulates an analysis interrupted after its checkpoint at frame 10, with unsaved rows after it
+        resumed_dir = os.path.join(self._directory.name, "resumed")
+        ResumableAnalysis(self._config, self._video_path, resumed_dir, checkpoint_interval=10).run()
+        checkpoint = ResumableAnalysis.read_checkpoint(resumed_dir)
+        checkpoint.update(frames=10, done=False)
+        with open(os.path.join(resumed_dir, ResumableAnalysis.CHECKPOINT_FILE_NAME), "w") as file:
+            json.dump(checkpoint, file)
+        for series in checkpoint["series"]:
+            writer = ChunkedSeriesWriter.reopen(os.path.join(resumed_dir, series), 10)
+            writer.append_rows(np.full((5, len(writer.get_columns())), -1.0))
+            writer.close()
+
+        analysis = ResumableAnalysis(self._config, self._video_path, resumed_dir, checkpoint_interval=10)
+        self.assertFalse(analysis.is_done())
+        self.assertEqual(TestResumableAnalysis.FRAMES, analysis.run())
+        self.assertTrue(analysis.is_done())
+        complete, resumed = read_session(complete_dir), read_session(resumed_dir)
+        self.assertEqual(complete.keys(), resumed.keys())
+        for name, rows in complete.items():
+            self.assertEqual(TestResumableAnalysis.FRAMES, len(rows))
+            np.testing.assert_array_equal(rows, resumed[name])
+
+    def test_batch_skips_finished_jobs(self):
+        config_path = os.path.join(self._directory.name, "config.json")
+        with open(config_path, "w") as file:
+            json.dump(self._config_dict, file)
+        output = os.path.join(self._directory.name, "batch")
+        jobs = BatchScheduler.from_directory(self._directory.name, config_path, output)
+        self.assertEqual([os.path.join(output, "feed")], [job.output_directory for job in jobs])
+
+        BatchScheduler.run_job(jobs[0], ResumableAnalysis.DEFAULT_CHECKPOINT_INTERVAL)
+        jobs = BatchScheduler(jobs, workers=1).run()
+        self.assertEqual(TestResumableAnalysis.FRAMES, jobs[0].frames)
+        self.assertIsNone(jobs[0].error)
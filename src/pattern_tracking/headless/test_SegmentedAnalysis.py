@@ -0,0 +1,34 @@
+import os
+
+import numpy as np
+
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.HeadlessAnalysis import HeadlessAnalysis
+from src.pattern_tracking.headless.SegmentedAnalysis import SegmentedAnalysis
+from src.pattern_tracking.headless.testing_utils import SyntheticVideoTestCase, read_session
+
+
+class TestSegmentedAnalysis(SyntheticVideoTestCase):
+    FRAMES = 30
+
+    def test_split(self):
+        analysis = SegmentedAnalysis(self._config, self._video_path, "", workers=2, segments=3)
+        self.assertEqual([(0, 10), (10, 20), (20, None)], analysis.split(30))
+        self.assertEqual([(0, None)], analysis.split(0))
+
+    def test_same_results_as_sequential(self):
+        # the configurations are sent to the worker processes, every type must survive the pickling
+        for tracker_types in (("FFT_TEMPLATE_TRACKER", "TEMPLATE_TRACKER"),
+                              ("PYRAMID_TEMPLATE_TRACKER", "PYRAMID_TEMPLATE_TRACKER")):
+            with self.subTest(tracker_types=tracker_types):
+                config = AnalysisConfig.from_dict(self.config_dict(*tracker_types))
+                sequential_dir = os.path.join(self._directory.name, "sequential_" + "_".join(tracker_types))
+                segmented_dir = os.path.join(self._directory.name, "segmented_" + "_".join(tracker_types))
+                HeadlessAnalysis(config, self._video_path, sequential_dir).run()
+                frames = SegmentedAnalysis(config, self._video_path, segmented_dir, workers=2, segments=3).run()
+
+                self.assertEqual(TestSegmentedAnalysis.FRAMES, frames)
+                sequential, segmented = read_session(sequential_dir), read_session(segmented_dir)
+                self.assertEqual(sequential.keys(), segmented.keys())
+                for name, rows in sequential.items():
+                    np.testing.assert_array_equal(rows, segmented[name])
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.pattern_tracking.benchmark.SyntheticFeed import SyntheticFeed
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.headless.ConfiguredTrackers import ConfiguredTrackers
+from src.pattern_tracking.headless.StackTracker import StackTracker, track
+
+
+class TestStackTracker(TestCase):
+    FRAMES = 20
+
+    def setUp(self) -> None:
+        super().setUp()
+        feed = SyntheticFeed(320, 240, 3, noise=0, seed=0)
+        frames, truths = zip(*(feed.next_frame() for _ in range(TestStackTracker.FRAMES)))
+        self._frames, self._truths = np.stack(frames), np.stack(truths)
+        self._size = feed.get_patch_size()
+        self._positions = feed.get_rest_positions()
+
+    def _config(self, *tracker_types: str) -> AnalysisConfig:
+        return AnalysisConfig.from_dict({
+            "frame_size": None,
+            "trackers": [{"name": f"{index}", "type": tracker_type, "poi": [int(x), int(y), self._size, self._size]}
+                         for index, (tracker_type, (x, y)) in enumerate(zip(tracker_types, self._positions))],
+            "distances": []
+        })
+
+    def test_follows_the_patches(self):
+        config = self._config("TEMPLATE_TRACKER", "MIL_TRACKER", "FIXED_POINT_TRACKER")
+        result = StackTracker(config, batch_size=8).track(self._frames)
+        self.assertEqual((TestStackTracker.FRAMES, 3, 2), result.centers.shape)
+        self.assertEqual((TestStackTracker.FRAMES, 3), result.confidences.shape)
+        np.testing.assert_allclose(result.centers[:, :2], self._truths[:, :2], atol=3)
+        self.assertTrue((result.confidences[:, 0] > 0.9).all())
+
+    def test_same_centers_as_the_template_tracker(self):
+        # without detection region, the search of TemplateTracker covers the whole frame as well
+        config = self._config("TEMPLATE_TRACKER", "TEMPLATE_TRACKER")
+        trackers = ConfiguredTrackers(config)
+        trackers.setup(self._frames[0])
+        expected = np.stack([trackers.update(index, frame)[0] for index, frame in enumerate(self._frames)])
+        np.testing.assert_array_equal(expected, track(self._frames, config).centers)
+
+    def test_same_centers_as_the_pyramid_and_fft_trackers(self):
+        config = self._config("PYRAMID_TEMPLATE_TRACKER", "FFT_TEMPLATE_TRACKER", "FFT_TEMPLATE_TRACKER")
+        trackers = ConfiguredTrackers(config)
+        trackers.setup(self._frames[0])
+        expected = np.stack([trackers.update(index, frame)[0] for index, frame in enumerate(self._frames)])
+        result = StackTracker(config, batch_size=8).track(self._frames)
+        np.testing.assert_array_equal(expected, result.centers)
+        self.assertTrue((result.confidences > 0.9).all())
+
+    def test_lost_below_threshold(self):
+        config = self._config("TEMPLATE_TRACKER")
+        config.trackers[0].detection_threshold = 1.0
+        result = track(self._frames, config)
+        # only the first frame, the template itself, may be matched perfectly
+        self.assertTrue(np.isnan(result.centers[1:]).all())
+
+    def test_invalid_stack(self):
+        with self.assertRaises(ValueError):
+            track(self._frames[0, 0], self._config("TEMPLATE_TRACKER"))
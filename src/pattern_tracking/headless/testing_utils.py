@@ -0,0 +1,64 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.benchmark.SyntheticFeed import SyntheticFeed
+from src.pattern_tracking.headless.AnalysisConfig import AnalysisConfig
+from src.pattern_tracking.logic.storage.ChunkedSeriesReader import ChunkedSeriesReader
+from src.pattern_tracking.logic.storage.SeriesRecorder import SeriesRecorder
+
+
+class SyntheticVideoTestCase(TestCase):
+    """
+    Base of the tests of the headless analyses : each test gets a video of FRAMES frames of a SyntheticFeed
+    with two patches, in a temporary directory, and a configuration tracking them with a pair between them.
+    The types of the trackers of the configuration are given by config_dict()
+    """
+
+    FRAMES = 20
+    """Number of frames of the video"""
+    TRACKER_TYPES = ("TEMPLATE_TRACKER", "TEMPLATE_TRACKER")
+    """Types of the "first" and the "second" tracker of the default configuration"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._directory = tempfile.TemporaryDirectory()
+        self._video_path = os.path.join(self._directory.name, "feed.avi")
+        feed = SyntheticFeed(320, 240, 2, noise=0, seed=0)
+        writer = cv.VideoWriter(self._video_path, cv.VideoWriter_fourcc(*"MJPG"), 30, (320, 240))
+        for _ in range(self.FRAMES):
+            writer.write(feed.next_frame()[0])
+        writer.release()
+        self._positions = feed.get_rest_positions()
+        self._size = feed.get_patch_size()
+        self._config_dict = self.config_dict(*self.TRACKER_TYPES)
+        self._config = AnalysisConfig.from_dict(self._config_dict)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+        super().tearDown()
+
+    def config_dict(self, first_type: str, second_type: str) -> dict:
+        """:return: The configuration of a "first" and a "second" tracker of the given types, and their "pair" """
+        (x1, y1), (x2, y2) = self._positions
+        return {
+            "frame_size": None,
+            "trackers": [
+                {"name": "first", "type": first_type, "poi": [int(x1), int(y1), self._size, self._size]},
+                {"name": "second", "type": second_type, "poi": [int(x2), int(y2), self._size, self._size]}
+            ],
+            "distances": [{"name": "pair", "first": "first", "second": "second"}]
+        }
+
+
+def read_session(directory: str) -> dict[str, np.ndarray]:
+    """:return: The rows of each series of the centers and the distances of a session, by name"""
+    series = {}
+    for sub_directory in (SeriesRecorder.CENTERS_DIR, SeriesRecorder.DISTANCES_DIR):
+        for name in os.listdir(os.path.join(directory, sub_directory)):
+            reader = ChunkedSeriesReader(os.path.join(directory, sub_directory, name))
+            series[reader.get_name()] = reader.read()
+    return series
@@ -2,8 +2,11 @@ import queue
 from threading import Event, Thread
 import cv2 as cv
 
+from src.pattern_tracking.logic.analysis.DenseMotionAnalyzer import DenseMotionAnalyzer
+from src.pattern_tracking.logic.storage.SeriesRecorder import SeriesRecorder
 from src.pattern_tracking.logic.tracker.TrackerManager import TrackerManager
 from src.pattern_tracking.logic.video.LiveFeedWrapper import LiveFeedWrapper
+from src.pattern_tracking.objects.CompactFrame import CompactFrame
 from src.pattern_tracking.qt_gui.widgets.FrameDisplayWidget import FrameDisplayWidget
 from src.pattern_tracking.qt_gui.dock_widgets.LivePlotterDockWidget import LivePlotterDockWidget
 
@@ -19,12 +22,18 @@ class BackgroundComputation:
                  live_feed: LiveFeedWrapper,
                  frame_display_widget: FrameDisplayWidget,
                  plots_container: LivePlotterDockWidget,
-                 global_halt: Event):
+                 global_halt: Event,
+                 recorder: SeriesRecorder | None = None,
+                 dense_motion_analyzer: DenseMotionAnalyzer | None = None):
         self._TRACKER_MANAGER = tracker_manager
         self._LIVE_FEED = live_feed
         self._FRAME_DISPLAY_WIDGET = frame_display_widget
         self._PLOTS_CONTAINER_WIDGET = plots_container
         self._global_halt = global_halt
+        self._RECORDER = recorder
+        """Saves the computed centers and distances to the disk, if set"""
+        self._DENSE_MOTION_ANALYZER = dense_motion_analyzer
+        """Maps the motion of the whole frame when enabled, if set"""
         self._thread: Thread | None = None
 
     def _run(self):
@@ -33,16 +42,45 @@ class BackgroundComputation:
         This method shouldn't be launched as is, but from a separate thread only
         """
         while not self._global_halt.is_set():
+            # the next frames only hold the regions read by the trackers, unless the whole frame is analyzed
+            dense_motion_enabled = self._DENSE_MOTION_ANALYZER is not None and self._DENSE_MOTION_ANALYZER.is_enabled()
+            self._LIVE_FEED.set_regions_hint(
+                None if dense_motion_enabled else self._TRACKER_MANAGER.get_regions_hint(),
+                FrameDisplayWidget.WIDGET_SIZE
+            )
             try:
                 frame_number, live_frame = self._LIVE_FEED.grab_frame(block=True, timeout=0.5)
             except queue.Empty:
                 # Wait for the video feed to get reset
                 while self._LIVE_FEED.is_feed_resetting():
                     continue
-            resized_frame = cv.resize(live_frame, FrameDisplayWidget.WIDGET_SIZE)
+                continue
+            if isinstance(live_frame, CompactFrame):
+                resized_frame = live_frame.compose()
+            else:
+                resized_frame = cv.resize(live_frame, FrameDisplayWidget.WIDGET_SIZE)
+            # the trackers only work on the resized frame, the buffer of the frame can be reused by the feed
+            self._LIVE_FEED.release_frame(live_frame)
             edited_frame = self._TRACKER_MANAGER.update_trackers(resized_frame, drawing_sheet=resized_frame.copy())
-            self._PLOTS_CONTAINER_WIDGET.update_plots(frame_number)
+            distances = self._PLOTS_CONTAINER_WIDGET.update_plots(frame_number)
+            if self._RECORDER is not None:
+                self._RECORDER.record_centers(frame_number, self._TRACKER_MANAGER.alive_trackers())
+                self._RECORDER.record_distances(frame_number, distances)
+            if self._DENSE_MOTION_ANALYZER is not None:
+                self._update_dense_motion(frame_number, resized_frame)
             self._FRAME_DISPLAY_WIDGET.change_frame_to_display(edited_frame, swap_rgb=True)
+        if self._DENSE_MOTION_ANALYZER is not None:
+            self._DENSE_MOTION_ANALYZER.close()
+
+    def _update_dense_motion(self, frame_number: int, frame):
+        """Analyzes the motion of the whole frame, and updates the heat map displayed over it"""
+        result = self._DENSE_MOTION_ANALYZER.analyze(frame_number, frame)
+        if result is None:
+            self._FRAME_DISPLAY_WIDGET.set_heat_map(None)
+        elif self._FRAME_DISPLAY_WIDGET.is_heat_map_visible():
+            self._FRAME_DISPLAY_WIDGET.set_heat_map(
+                self._DENSE_MOTION_ANALYZER.render_heat_map(result, FrameDisplayWidget.WIDGET_SIZE)
+            )
 
     def start(self):
         """Starts this class' job in the background"""
@@ -0,0 +1,141 @@
+import dataclasses
+import uuid
+from threading import Lock
+
+import numpy as np
+
+from src.pattern_tracking.logic.DistanceComputer import DistanceComputer
+from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+
+
+@dataclasses.dataclass
+class FrameMetrics:
+    """
+    Metrics computed by the MetricsEngine for a single frame.
+    Values that couldn't be computed (POI not found) are NaN.
+    Arrays indexed by tracker follow the order of MetricsEngine.get_trackers(),
+    arrays indexed by pair follow the column returned by MetricsEngine.add_pair()
+    """
+    frame_number: int
+    centers: np.ndarray
+    """(N, 2) center of the found POI of each tracker"""
+    displacements: np.ndarray
+    """(N,) distance between the current center of each tracker and its first known center"""
+    velocities: np.ndarray
+    """(N, 2) velocity of each tracker, in pixels per frame"""
+    distances: np.ndarray
+    """(P,) Euclidean distance between the two trackers of each pair"""
+    angles: np.ndarray
+    """(P,) angle in degrees of the vector going from the first tracker to the second one of each pair"""
+
+
+class MetricsEngine:
+    """
+    Computes the metrics of every registered pair of trackers in a single vectorized pass.
+
+    The found POIs of all trackers involved in a pair are gathered in one (N, 4) array
+    per frame, from which the centers, and then the distances and angles of all pairs,
+    are computed with NumPy. Thus, the cost of a frame barely depends on the number of plots.
+    Each pair is given a column when it is registered, that is used to read its values
+    in the resulting FrameMetrics.
+    """
+
+    def __init__(self):
+        self._trackers: list[AbstractTracker] = []
+        """Trackers involved in at least one pair, in the order of the rows of the results"""
+        self._tracker_rows: dict[uuid.UUID, int] = {}
+        """Row of each tracker in the results"""
+        self._columns: dict[DistanceComputer, int] = {}
+        """Column of each pair in the results"""
+        self._pair_first = np.empty(0, dtype=int)
+        """Row of the first tracker of each pair"""
+        self._pair_second = np.empty(0, dtype=int)
+        """Row of the second tracker of each pair"""
+        self._initial_centers = np.empty((0, 2))
+        """First center found for each tracker, NaN while it hasn't been found yet"""
+        self._previous_centers = np.empty((0, 2))
+        """Centers computed in the previous frame"""
+        self._previous_frame_number: int | None = None
+        """Number of the frame of the previous computation"""
+        self._mutex = Lock()
+        """Prevents pairs from being registered while the metrics are being computed"""
+
+    def add_pair(self, dist_computer: DistanceComputer) -> int:
+        """
+        Registers a pair of trackers, whose metrics will be computed for each frame from now on
+        :param dist_computer: The object linking the two trackers together
+        :return: The column of this pair in the computed FrameMetrics
+        """
+        self._mutex.acquire()
+        if dist_computer not in self._columns:
+            first = self._tracker_row(dist_computer.get_tracker_one())
+            second = self._tracker_row(dist_computer.get_tracker_two())
+            self._columns[dist_computer] = len(self._columns)
+            self._pair_first = np.append(self._pair_first, first)
+            self._pair_second = np.append(self._pair_second, second)
+        column = self._columns[dist_computer]
+        self._mutex.release()
+        return column
+
+    def get_column(self, dist_computer: DistanceComputer) -> int:
+        """:return: The column of the given pair in the computed FrameMetrics"""
+        return self._columns[dist_computer]
+
+    def get_trackers(self) -> list[AbstractTracker]:
+        """:return: The trackers involved in the pairs, in the order of the rows of the computed FrameMetrics"""
+        return self._trackers
+
+    def compute(self, frame_number: int) -> FrameMetrics:
+        """
+        Computes the metrics of all the registered pairs, using the last POI found by each tracker
+        :param frame_number: Number of the frame in which the POIs have been found
+        """
+        self._mutex.acquire()
+        # (x, width, y, height) of each tracker, an undefined region only contains zeros
+        regions = np.array([t.get_found_poi().get_xwyh() for t in self._trackers], dtype=float).reshape(-1, 4)
+        found = (regions != 0).any(axis=1)
+        # same as utils.middle_of() on the corners of each region
+        centers = np.floor(regions[:, [0, 2]] + regions[:, [1, 3]] / 2)
+        centers[~found] = np.nan
+
+        newly_found = np.isnan(self._initial_centers[:, 0]) & found
+        self._initial_centers[newly_found] = centers[newly_found]
+        displacements = np.hypot(*(centers - self._initial_centers).T)
+
+        if self._previous_frame_number is not None and frame_number > self._previous_frame_number:
+            velocities = (centers - self._previous_centers) / (frame_number - self._previous_frame_number)
+        else:
+            velocities = np.full_like(centers, np.nan)
+
+        distances, angles = MetricsEngine.pair_metrics(centers, self._pair_first, self._pair_second)
+
+        self._previous_centers = centers
+        self._previous_frame_number = frame_number
+        self._mutex.release()
+        return FrameMetrics(frame_number, centers, displacements, velocities, distances, angles)
+
+    @staticmethod
+    def pair_metrics(centers: np.ndarray, first_rows: np.ndarray, second_rows: np.ndarray) \
+            -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the metrics of pairs of centers, also used without trackers on recorded centers
+        :param centers: (N, 2) centers, NaN when not found
+        :param first_rows: (P,) row of the first center of each pair
+        :param second_rows: (P,) row of the second center of each pair
+        :return: The (P,) distance and the (P,) angle in degrees of each pair, see FrameMetrics
+        """
+        deltas = centers[second_rows] - centers[first_rows]
+        distances = np.hypot(deltas[:, 0], deltas[:, 1])
+        angles = np.degrees(np.arctan2(deltas[:, 1], deltas[:, 0]))
+        return distances, angles
+
+    def _tracker_row(self, tracker: AbstractTracker) -> int:
+        """Returns the row of the given tracker, adding it to the tracked rows if required"""
+        row = self._tracker_rows.get(tracker.get_id())
+        if row is None:
+            row = len(self._trackers)
+            self._trackers.append(tracker)
+            self._tracker_rows[tracker.get_id()] = row
+            self._initial_centers = np.vstack((self._initial_centers, (np.nan, np.nan)))
+            self._previous_centers = np.vstack((self._previous_centers, (np.nan, np.nan)))
+        return row
@@ -0,0 +1,161 @@
+import numpy as np
+
+
+class BeatRateAnalyzer:
+    """
+    Estimates the beating frequency and the contraction amplitude of a distance series,
+    while its samples arrive.
+
+    The frequency is estimated with a sliding DFT : only the bins of the frequency range
+    of interest are kept, and each of them is updated in constant time when a sample arrives,
+    instead of computing an FFT over the history for each frame.
+    A Hann window is applied in the frequency domain, and the frequency of the strongest bin
+    is refined with a parabolic interpolation over its neighbours.
+
+    The amplitude is the difference between the last peak and the last trough, found by an
+    online peak detector with hysteresis.
+    """
+
+    DEFAULT_WINDOW_DURATION = 10.0
+    """Duration in seconds of the window over which the spectrum is computed"""
+    DEFAULT_MIN_BPM = 12
+    DEFAULT_MAX_BPM = 240
+    DEFAULT_HYSTERESIS = 0.5
+    """Variation required to confirm a peak or a trough, in the unit of the series (pixels)"""
+    DAMPING = 0.99999
+    """
+    Slightly smaller than 1, prevents the rounding errors accumulated by the
+    recursive update of the sliding DFT from growing without bound
+    """
+
+    def __init__(self, sample_rate: float,
+                 window_duration: float = DEFAULT_WINDOW_DURATION,
+                 min_bpm: float = DEFAULT_MIN_BPM,
+                 max_bpm: float = DEFAULT_MAX_BPM,
+                 hysteresis: float = DEFAULT_HYSTERESIS):
+        if sample_rate <= 0:
+            raise ValueError("The sample rate must be positive")
+        if not 0 < min_bpm < max_bpm:
+            raise ValueError("The BPM range is invalid")
+        self._sample_rate = sample_rate
+        """Number of samples per second, i.e. the FPS of the feed"""
+        self._window = max(4, int(round(window_duration * sample_rate)))
+        """Number of samples in the sliding window"""
+        # bins of the range of interest, plus one on each side for the Hann window
+        # the Hann-windowed DC component (the mean distance) spreads to the bin 1, which is never used
+        k_min = max(2, int(np.floor(min_bpm / 60 * self._window / sample_rate)))
+        k_max = min(self._window // 2 - 1, int(np.ceil(max_bpm / 60 * self._window / sample_rate)))
+        self._bins = np.arange(k_min - 1, k_max + 2)
+        """Indexes of the DFT bins that are kept up to date"""
+        self._twiddles = np.exp(2j * np.pi * self._bins / self._window)
+        """Rotation applied to each bin when the window slides by one sample"""
+        self._damping_n = BeatRateAnalyzer.DAMPING ** self._window
+        """Damping applied to the sample leaving the window"""
+        self._spectrum = np.zeros(len(self._bins), dtype=complex)
+        """Current value of the kept DFT bins"""
+        self._history = np.zeros(self._window)
+        """Ring buffer containing the samples of the window"""
+        self._count = 0
+        """Number of samples added to this analyzer"""
+        self._last_frame_number: int | None = None
+        """Number of the frame of the last sample, if given"""
+        self._hysteresis = hysteresis
+        """Variation required to confirm a peak or a trough"""
+
+        self._rising = True
+        """True if the signal is currently going towards a peak, False if going towards a trough"""
+        self._extremum = np.nan
+        """Highest value since the last trough if rising, lowest value since the last peak otherwise"""
+        self._extremum_index = 0
+        """Index of the sample of the current extremum"""
+        self._last_peak = np.nan
+        self._last_trough = np.nan
+        self._peak_indexes: list[int] = []
+        """Index of the samples of the last confirmed peaks"""
+
+    def add_sample(self, value: float, frame_number: int | None = None):
+        """
+        Adds the next sample of the series. NaN values (POI not found)
+        are replaced by the previous sample, to keep a constant sample rate
+        :param value: The new sample
+        :param frame_number: Number of the frame of the sample. When frames were skipped since the last sample
+                             (decimated feed), their samples are linearly interpolated, up to a whole window
+        """
+        if np.isnan(value):
+            if self._count == 0:
+                return
+            value = self._history[(self._count - 1) % self._window]
+
+        if frame_number is not None:
+            if self._last_frame_number is not None and self._count > 0:
+                gap = min(frame_number - self._last_frame_number - 1, self._window)
+                previous = self._history[(self._count - 1) % self._window]
+                for step in range(1, gap + 1):
+                    self._add(previous + (value - previous) * step / (gap + 1))
+            self._last_frame_number = frame_number
+        self._add(value)
+
+    def _add(self, value: float):
+        """Slides the window by one sample"""
+        # sliding DFT update
+        slot = self._count % self._window
+        leaving = self._history[slot]
+        self._spectrum = self._twiddles * (BeatRateAnalyzer.DAMPING * self._spectrum + value - self._damping_n * leaving)
+        self._history[slot] = value
+        self._update_peaks(value)
+        self._count += 1
+
+    def is_ready(self) -> bool:
+        """:return: True once the sliding window has been filled"""
+        return self._count >= self._window
+
+    def get_bpm(self) -> float | None:
+        """:return: The dominant beating frequency in beats per minute, or None if the window isn't filled yet"""
+        if not self.is_ready():
+            return None
+        # Hann window applied in the frequency domain
+        windowed = np.abs(self._spectrum[1:-1] - 0.5 * (self._spectrum[:-2] + self._spectrum[2:]))
+        strongest = int(np.argmax(windowed))
+        # parabolic interpolation of the peak, when it has a neighbour on each side
+        shift = 0.0
+        if 0 < strongest < len(windowed) - 1:
+            left, center, right = windowed[strongest - 1: strongest + 2]
+            denominator = left - 2 * center + right
+            if denominator != 0:
+                shift = 0.5 * (left - right) / denominator
+        frequency = (self._bins[1 + strongest] + shift) * self._sample_rate / self._window
+        return 60 * frequency
+
+    def get_peak_bpm(self) -> float | None:
+        """:return: The beating frequency computed from the interval between the last peaks, or None"""
+        if len(self._peak_indexes) < 2:
+            return None
+        mean_interval = (self._peak_indexes[-1] - self._peak_indexes[0]) / (len(self._peak_indexes) - 1)
+        return 60 * self._sample_rate / mean_interval
+
+    def get_amplitude(self) -> float | None:
+        """:return: The difference between the last peak and the last trough, or None if unknown"""
+        if np.isnan(self._last_peak) or np.isnan(self._last_trough):
+            return None
+        return self._last_peak - self._last_trough
+
+    def _update_peaks(self, value: float):
+        """Online peak detection, confirms an extremum once the signal moved away from it by the hysteresis"""
+        if np.isnan(self._extremum):
+            self._extremum = value
+            self._extremum_index = self._count
+        elif self._rising:
+            if value > self._extremum:
+                self._extremum, self._extremum_index = value, self._count
+            elif self._extremum - value > self._hysteresis:
+                self._last_peak = self._extremum
+                self._peak_indexes = self._peak_indexes[-7:] + [self._extremum_index]
+                self._rising = False
+                self._extremum, self._extremum_index = value, self._count
+        else:
+            if value < self._extremum:
+                self._extremum, self._extremum_index = value, self._count
+            elif value - self._extremum > self._hysteresis:
+                self._last_trough = self._extremum
+                self._rising = True
+                self._extremum, self._extremum_index = value, self._count
@@ -0,0 +1,187 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+
+import cv2 as cv
+import numpy as np
+
+
+@dataclass
+class DenseMotionFrame:
+    """Summary of the dense motion of a frame, on a grid of tiles"""
+    frame_number: int
+    displacements: np.ndarray
+    """Mean xy displacement of each tile since the reference frame, in pixels of the frame, shape (rows, cols, 2)"""
+    strains: np.ndarray
+    """Strain of each tile (exx, eyy, exy), computed from the displacements of the tiles, shape (rows, cols, 3)"""
+
+
+class DenseMotionAnalyzer:
+    """
+    Computes the displacement of the whole field of view relative to a reference frame,
+    to map the contraction of the tissue.
+
+    The optical flow (DIS, or Farneback) is computed on the frame downscaled by `downscale`.
+    The downscaled image is split in horizontal bands, overlapping by a few pixels to avoid
+    artifacts at their borders, and the flow of each band is computed on its own thread
+    (OpenCV releases the GIL). The flow is then averaged on tiles of `tile_size` pixels of
+    the downscaled image, and the strain of each tile is derived from the displacements of its neighbours.
+
+    Results are stored as float16 arrays, the last `history` ones are kept in memory.
+    """
+
+    DIS = "DIS"
+    FARNEBACK = "Farneback"
+    METHODS = (DIS, FARNEBACK)
+    """Optical flow algorithms that can be used"""
+
+    DEFAULT_DOWNSCALE = 2
+    DEFAULT_TILE_SIZE = 16
+    """Size of a tile, in pixels of the downscaled image"""
+    DEFAULT_HISTORY = 600
+    """Number of results kept in memory"""
+    BAND_OVERLAP = 16
+    """Number of rows of the downscaled image shared by two consecutive bands"""
+    HEAT_MAP_MAX_DISPLACEMENT = 5.0
+    """Displacement in pixels displayed with the hottest color of the heat map"""
+
+    def __init__(self, method: str = DIS,
+                 downscale: int = DEFAULT_DOWNSCALE,
+                 tile_size: int = DEFAULT_TILE_SIZE,
+                 history: int = DEFAULT_HISTORY,
+                 workers: int | None = None):
+        if method not in DenseMotionAnalyzer.METHODS:
+            raise ValueError(f"Unknown optical flow method {method}, available : {DenseMotionAnalyzer.METHODS}")
+        if downscale < 1 or tile_size < 1:
+            raise ValueError("The downscale factor and the size of the tiles must be positive")
+        self._method = method
+        self._downscale = downscale
+        """Factor by which the frames are downscaled before computing the flow"""
+        self._tile_size = tile_size
+        self._workers = workers if workers is not None else max(1, os.cpu_count() or 1)
+        """Number of bands computed in parallel"""
+        self._executor = ThreadPoolExecutor(max_workers=self._workers)
+        self._flow_computers = [self._new_flow_computer() for _ in range(self._workers)]
+        """One optical flow object per band, they cannot be shared between threads"""
+
+        self._enabled = False
+        """The frames are only analyzed when enabled"""
+        self._closed = False
+        """Set by close(), the analysis cannot be enabled anymore"""
+        self._reference: np.ndarray | None = None
+        """Downscaled grayscale frame from which the displacements are measured"""
+        self._history: list[DenseMotionFrame] = []
+        self._max_history = history
+        self._lock = Lock()
+        """Held while a frame is analyzed, the analyzer is toggled from the GUI thread"""
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def set_enabled(self, enabled: bool):
+        """Enables or disables the analysis. The next analyzed frame becomes the reference"""
+        self._lock.acquire(blocking=True)
+        self._enabled = enabled and not self._closed
+        self._reference = None
+        self._lock.release()
+
+    def reset_reference(self):
+        """The next analyzed frame will be the reference of the displacements"""
+        self._lock.acquire(blocking=True)
+        self._reference = None
+        self._lock.release()
+
+    def close(self):
+        """Disables the analysis and stops the threads computing the bands. The analyzer cannot be enabled again"""
+        self._lock.acquire(blocking=True)
+        try:
+            self._enabled = False
+            self._closed = True
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            self._lock.release()
+
+    def get_last_result(self) -> DenseMotionFrame | None:
+        return self._history[-1] if len(self._history) > 0 else None
+
+    def get_history(self) -> list[DenseMotionFrame]:
+        """:return: The last results computed, oldest first"""
+        return list(self._history)
+
+    def analyze(self, frame_number: int, frame: np.ndarray) -> DenseMotionFrame | None:
+        """
+        Computes the displacements and strains of the tiles of a frame, relative to the reference frame
+        :param frame_number: Number of the frame in the feed
+        :param frame: BGR or grayscale frame
+        :return: The summary of the motion of the frame, or None if the analysis is disabled
+        """
+        self._lock.acquire(blocking=True)
+        try:
+            if not self._enabled:
+                return None
+            gray = frame if frame.ndim == 2 else cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+            height, width = gray.shape
+            gray = cv.resize(gray, (width // self._downscale, height // self._downscale), interpolation=cv.INTER_AREA)
+            if self._reference is None or self._reference.shape != gray.shape:
+                self._reference = gray
+
+            flow = self._compute_flow(self._reference, gray) * self._downscale
+            result = self._summarize(frame_number, flow)
+            self._history = self._history[-(self._max_history - 1):] + [result]
+            return result
+        finally:
+            self._lock.release()
+
+    def render_heat_map(self, result: DenseMotionFrame, size: tuple[int, int]) -> np.ndarray:
+        """
+        Colors each tile according to its displacement
+        :param result: The result to represent
+        :param size: Width and height of the returned image
+        :return: BGR image of the given size
+        """
+        magnitude = np.linalg.norm(result.displacements.astype(np.float32), axis=2)
+        scaled = np.clip(255 * magnitude / DenseMotionAnalyzer.HEAT_MAP_MAX_DISPLACEMENT, 0, 255).astype(np.uint8)
+        return cv.applyColorMap(cv.resize(scaled, size, interpolation=cv.INTER_LINEAR), cv.COLORMAP_JET)
+
+    def _new_flow_computer(self):
+        if self._method == DenseMotionAnalyzer.DIS:
+            return cv.DISOpticalFlow_create(cv.DISOPTICAL_FLOW_PRESET_ULTRAFAST)
+        return None
+
+    def _compute_flow(self, reference: np.ndarray, gray: np.ndarray) -> np.ndarray:
+        """:return: The flow from the reference to the given image, computed by bands in parallel"""
+        height = gray.shape[0]
+        limits = np.linspace(0, height, self._workers + 1).astype(int)
+        bands = [(start, end) for start, end in zip(limits[:-1], limits[1:]) if end > start]
+        futures = [
+            self._executor.submit(self._compute_band_flow, self._flow_computers[index], reference, gray, start, end)
+            for index, (start, end) in enumerate(bands)
+        ]
+        return np.concatenate([future.result() for future in futures], axis=0)
+
+    def _compute_band_flow(self, flow_computer, reference: np.ndarray, gray: np.ndarray,
+                           start: int, end: int) -> np.ndarray:
+        """:return: The flow of the rows start to end, computed on the band extended by BAND_OVERLAP rows"""
+        low = max(0, start - DenseMotionAnalyzer.BAND_OVERLAP)
+        high = min(gray.shape[0], end + DenseMotionAnalyzer.BAND_OVERLAP)
+        if flow_computer is None:
+            flow = cv.calcOpticalFlowFarneback(reference[low:high], gray[low:high], None,
+                                               0.5, 3, 15, 3, 5, 1.2, 0)
+        else:
+            flow = flow_computer.calc(reference[low:high], gray[low:high], None)
+        return flow[start - low: end - low]
+
+    def _summarize(self, frame_number: int, flow: np.ndarray) -> DenseMotionFrame:
+        """Averages the flow on the tiles, and computes the strain of each tile"""
+        rows, cols = flow.shape[0] // self._tile_size, flow.shape[1] // self._tile_size
+        tiles = flow[:rows * self._tile_size, :cols * self._tile_size] \
+            .reshape(rows, self._tile_size, cols, self._tile_size, 2).mean(axis=(1, 3))
+
+        strains = np.zeros((rows, cols, 3), dtype=np.float32)
+        if rows >= 2 and cols >= 2:
+            spacing = self._tile_size * self._downscale
+            du_dy, du_dx = np.gradient(tiles[..., 0], spacing)
+            dv_dy, dv_dx = np.gradient(tiles[..., 1], spacing)
+            strains = np.stack((du_dx, dv_dy, 0.5 * (du_dy + dv_dx)), axis=2)
+        return DenseMotionFrame(frame_number, tiles.astype(np.float16), strains.astype(np.float16))
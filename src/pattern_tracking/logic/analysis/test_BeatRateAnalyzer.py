@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.pattern_tracking.logic.analysis.BeatRateAnalyzer import BeatRateAnalyzer
+
+
+class TestBeatRateAnalyzer(TestCase):
+
+    FPS = 30
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._phase = 0.0
+        self._rng = np.random.default_rng(0)
+
+    def _feed(self, analyzer: BeatRateAnalyzer, bpm: float, amplitude: float, seconds: float, offset: float = 100):
+        """Feeds a noisy sine wave to the analyzer, continuing the phase of the previous calls"""
+        phases = self._phase + 2 * np.pi * bpm / 60 * np.arange(int(seconds * self.FPS)) / self.FPS
+        self._phase = phases[-1] + 2 * np.pi * bpm / 60 / self.FPS
+        for v in offset + amplitude * np.sin(phases) + self._rng.normal(0, 0.05, len(phases)):
+            analyzer.add_sample(v)
+
+    def test_not_ready_before_window_filled(self):
+        analyzer = BeatRateAnalyzer(self.FPS, window_duration=10)
+        self._feed(analyzer, 72, 3, 5)
+        self.assertIsNone(analyzer.get_bpm())
+
+    def test_bpm_and_amplitude(self):
+        analyzer = BeatRateAnalyzer(self.FPS, window_duration=10)
+        self._feed(analyzer, 72, 3, 20)
+        self.assertAlmostEqual(analyzer.get_bpm(), 72, delta=2)
+        self.assertAlmostEqual(analyzer.get_peak_bpm(), 72, delta=2)
+        self.assertAlmostEqual(analyzer.get_amplitude(), 6, delta=0.3)
+
+    def test_follows_rate_change(self):
+        analyzer = BeatRateAnalyzer(self.FPS, window_duration=8)
+        self._feed(analyzer, 60, 3, 20)
+        self._feed(analyzer, 110, 3, 10)
+        self.assertAlmostEqual(analyzer.get_bpm(), 110, delta=3)
+
+    def test_skipped_frames_are_interpolated(self):
+        analyzer = BeatRateAnalyzer(self.FPS, window_duration=10)
+        stride = 4
+        frames = np.arange(0, 20 * self.FPS, stride)
+        for frame_number, v in zip(frames, 100 + 3 * np.sin(2 * np.pi * 72 / 60 * frames / self.FPS)):
+            analyzer.add_sample(v, frame_number)
+        self.assertAlmostEqual(analyzer.get_bpm(), 72, delta=2)
+
+    def test_nan_samples_are_held(self):
+        analyzer = BeatRateAnalyzer(self.FPS)
+        analyzer.add_sample(np.nan)
+        self.assertFalse(analyzer.is_ready())
+        analyzer.add_sample(1.0)
+        analyzer.add_sample(np.nan)
+        self.assertIsNone(analyzer.get_amplitude())
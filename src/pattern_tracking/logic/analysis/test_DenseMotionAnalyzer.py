@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.analysis.DenseMotionAnalyzer import DenseMotionAnalyzer
+
+
+class TestDenseMotionAnalyzer(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(0)
+        self._frame = cv.GaussianBlur(rng.integers(0, 256, (240, 320), dtype=np.uint8), (9, 9), 0)
+        self._analyzer = DenseMotionAnalyzer(downscale=2, tile_size=16, workers=3)
+        self._analyzer.set_enabled(True)
+
+    def tearDown(self) -> None:
+        self._analyzer.close()
+        super().tearDown()
+
+    def test_disabled_returns_none(self):
+        self._analyzer.set_enabled(False)
+        self.assertIsNone(self._analyzer.analyze(0, self._frame))
+
+    def test_closed_analyzer_stays_disabled(self):
+        self._analyzer.close()
+        self._analyzer.set_enabled(True)
+        self.assertFalse(self._analyzer.is_enabled())
+        self.assertIsNone(self._analyzer.analyze(0, self._frame))
+
+    def test_translation(self):
+        self._analyzer.analyze(0, self._frame)
+        result = self._analyzer.analyze(1, np.roll(self._frame, (2, 4), axis=(0, 1)))
+        self.assertEqual((7, 10, 2), result.displacements.shape)
+        self.assertEqual(np.float16, result.displacements.dtype)
+        # the borders of the frame don't move with the rest of it
+        inner = result.displacements[1:-1, 1:-1].astype(np.float32)
+        np.testing.assert_allclose(np.median(inner, axis=(0, 1)), (4, 2), atol=0.3)
+        self.assertLess(np.abs(np.median(result.strains[1:-1, 1:-1], axis=(0, 1))).max(), 0.01)
+
+    def test_expansion_gives_positive_strain(self):
+        self._analyzer.analyze(0, self._frame)
+        stretched = cv.warpAffine(self._frame, np.float32([[1.02, 0, -3.2], [0, 1.02, -2.4]]), (320, 240))
+        result = self._analyzer.analyze(1, stretched)
+        inner = result.strains[1:-1, 1:-1].astype(np.float32)
+        np.testing.assert_allclose(np.median(inner[..., :2], axis=(0, 1)), (0.02, 0.02), atol=0.008)
+
+    def test_history_is_bounded(self):
+        analyzer = DenseMotionAnalyzer(history=3, workers=1)
+        analyzer.set_enabled(True)
+        for i in range(5):
+            analyzer.analyze(i, self._frame)
+        self.assertEqual([2, 3, 4], [r.frame_number for r in analyzer.get_history()])
@@ -0,0 +1,168 @@
+import numpy as np
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution representation of a time series, used to plot very long
+    series without sending every single point to the plotting library.
+
+    Level 0 contains the raw (x, y) samples. Each level k > 0 splits the raw samples
+    in buckets of `factor ** k` consecutive samples, and only keeps the minimum and
+    the maximum of each bucket (alongside their x coordinate). This way, when the series
+    is displayed with less pixels than there are points, we can pick the level whose
+    number of buckets matches the pixel width, and still display every peak of the signal.
+
+    The pyramid is updated incrementally, appending a point costs O(number of levels).
+    The x values are expected to be increasing.
+    """
+
+    DEFAULT_FACTOR = 4
+    """Number of buckets of level k merged into a single bucket of level k+1"""
+    DEFAULT_LEVELS = 12
+    """Number of levels of the pyramid, the last one holds buckets of factor**(levels - 1) samples"""
+    INITIAL_CAPACITY = 1024
+    """Number of items allocated in each array upon creation, doubled whenever it is full"""
+
+    def __init__(self, factor: int = DEFAULT_FACTOR, levels: int = DEFAULT_LEVELS):
+        if factor < 2:
+            raise ValueError("The factor between two levels of the pyramid must be at least 2")
+        if levels < 1:
+            raise ValueError("The pyramid must have at least one level")
+        self._factor = factor
+        """Number of buckets of a level merged in one bucket of the next level"""
+        self._levels = levels
+        """Number of levels in this pyramid, including the raw data level"""
+        self._count = 0
+        """Number of raw samples appended to this pyramid"""
+        self._raw_x = np.empty(0)
+        """X coordinates of the raw samples"""
+        self._raw_y = np.empty(0)
+        """Y coordinates of the raw samples"""
+        self._buckets: list[np.ndarray] = []
+        """
+        For each level above the raw level, array of shape (capacity, 4) in which each row
+        describes a bucket as follows : (x of min, min, x of max, max)
+        """
+        self.clear()
+
+    def clear(self):
+        """Removes all data from this pyramid"""
+        self._count = 0
+        self._raw_x = np.empty(MinMaxPyramid.INITIAL_CAPACITY)
+        self._raw_y = np.empty(MinMaxPyramid.INITIAL_CAPACITY)
+        self._buckets = [np.empty((MinMaxPyramid.INITIAL_CAPACITY, 4)) for _ in range(self._levels - 1)]
+
+    def __len__(self):
+        return self._count
+
+    def get_factor(self) -> int:
+        return self._factor
+
+    def get_levels(self) -> int:
+        return self._levels
+
+    def last_x(self) -> float | None:
+        """:return: The x coordinate of the last appended point, or None if the pyramid is empty"""
+        return self._raw_x[self._count - 1] if self._count > 0 else None
+
+    def append(self, x: float, y: float):
+        """
+        Adds a new point to the series, and updates the buckets containing it at each level
+        :param x: X coordinate of the new point. Must be greater or equal than the last one
+        :param y: Y coordinate of the new point
+        """
+        if self._count == len(self._raw_x):
+            self._raw_x = MinMaxPyramid._grow(self._raw_x)
+            self._raw_y = MinMaxPyramid._grow(self._raw_y)
+        self._raw_x[self._count] = x
+        self._raw_y[self._count] = y
+
+        bucket_size = 1
+        for buckets_idx in range(self._levels - 1):
+            bucket_size *= self._factor
+            bucket = self._count // bucket_size
+            if bucket == len(self._buckets[buckets_idx]):
+                self._buckets[buckets_idx] = MinMaxPyramid._grow(self._buckets[buckets_idx])
+            row = self._buckets[buckets_idx][bucket]
+            # first sample of this bucket
+            if self._count % bucket_size == 0:
+                row[:] = (x, y, x, y)
+            else:
+                if y < row[1]:
+                    row[0], row[1] = x, y
+                if y > row[3]:
+                    row[2], row[3] = x, y
+        self._count += 1
+
+    def select_level(self, x_min: float, x_max: float, pixel_width: int) -> int:
+        """
+        Finds the most detailed level in which the number of buckets in the given range
+        does not exceed the given pixel width
+        :param x_min: Lower bound of the visible range
+        :param x_max: Upper bound of the visible range
+        :param pixel_width: Number of pixels available to display the visible range
+        :return: The index of the level to use, 0 being the raw data
+        """
+        start, end = self._raw_range(x_min, x_max)
+        visible = end - start
+        pixel_width = max(1, int(pixel_width))
+        level = 0
+        bucket_size = 1
+        # each bucket is displayed as 2 points, hence the raw level is compared to twice the width
+        while level < self._levels - 1 and visible / bucket_size > (2 * pixel_width if level == 0 else pixel_width):
+            level += 1
+            bucket_size *= self._factor
+        return level
+
+    def get_data(self, x_min: float, x_max: float, pixel_width: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the points to display for the given visible range, using the level
+        matching the given pixel width. One point is kept on each side of the range,
+        so that the displayed line doesn't stop before the edges of the view.
+        :param x_min: Lower bound of the visible range
+        :param x_max: Upper bound of the visible range
+        :param pixel_width: Number of pixels available to display the visible range
+        :return: The x and y coordinates of the points to display
+        """
+        if self._count == 0:
+            return np.empty(0), np.empty(0)
+
+        level = self.select_level(x_min, x_max, pixel_width)
+        start, end = self._raw_range(x_min, x_max)
+        start = max(0, start - 1)
+        end = min(self._count, end + 1)
+        if level == 0:
+            return self._raw_x[start:end].copy(), self._raw_y[start:end].copy()
+
+        bucket_size = self._factor ** level
+        first_bucket = start // bucket_size
+        last_bucket = (end - 1) // bucket_size + 1
+        rows = self._buckets[level - 1][first_bucket:last_bucket]
+
+        # emit the min and the max of each bucket in the order they occurred
+        min_first = rows[:, 0] <= rows[:, 2]
+        xs = np.empty(2 * len(rows))
+        ys = np.empty(2 * len(rows))
+        xs[0::2] = np.where(min_first, rows[:, 0], rows[:, 2])
+        ys[0::2] = np.where(min_first, rows[:, 1], rows[:, 3])
+        xs[1::2] = np.where(min_first, rows[:, 2], rows[:, 0])
+        ys[1::2] = np.where(min_first, rows[:, 3], rows[:, 1])
+        return xs, ys
+
+    def get_x_bounds(self) -> tuple[float, float] | None:
+        """:return: The x coordinates of the first and last points, or None if the pyramid is empty"""
+        if self._count == 0:
+            return None
+        return self._raw_x[0], self._raw_x[self._count - 1]
+
+    def _raw_range(self, x_min: float, x_max: float) -> tuple[int, int]:
+        """:return: The start (included) and end (excluded) indexes of the raw samples in the given range"""
+        raw_x = self._raw_x[:self._count]
+        return int(np.searchsorted(raw_x, x_min, side='left')), int(np.searchsorted(raw_x, x_max, side='right'))
+
+    @staticmethod
+    def _grow(arr: np.ndarray) -> np.ndarray:
+        """:return: A copy of the given array with twice its capacity on the first axis"""
+        grown = np.empty((2 * len(arr), *arr.shape[1:]), dtype=arr.dtype)
+        grown[:len(arr)] = arr
+        return grown
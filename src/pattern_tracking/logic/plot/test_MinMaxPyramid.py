@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.pattern_tracking.logic.plot.MinMaxPyramid import MinMaxPyramid
+
+
+class TestMinMaxPyramid(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._pyramid = MinMaxPyramid(factor=4, levels=6)
+        rng = np.random.default_rng(0)
+        self._x = np.arange(5000) / 30
+        self._y = rng.normal(size=5000)
+        for x, y in zip(self._x, self._y):
+            self._pyramid.append(x, y)
+
+    def test_raw_level_when_enough_pixels(self):
+        xs, ys = self._pyramid.get_data(self._x[0], self._x[-1], 10000)
+        self.assertTrue((xs == self._x).all())
+        self.assertTrue((ys == self._y).all())
+
+    def test_rendered_points_bounded_by_pixel_width(self):
+        xs, _ = self._pyramid.get_data(self._x[0], self._x[-1], 100)
+        self.assertLessEqual(len(xs), 2 * 100 + 2 * 4)
+        self.assertTrue((np.diff(xs) >= 0).all())
+
+    def test_peaks_preserved(self):
+        _, ys = self._pyramid.get_data(self._x[0], self._x[-1], 50)
+        self.assertEqual(ys.max(), self._y.max())
+        self.assertEqual(ys.min(), self._y.min())
+
+    def test_visible_range(self):
+        xs, ys = self._pyramid.get_data(self._x[1000], self._x[1100], 1000)
+        self.assertTrue((ys[1:-1] == self._y[1000:1101]).all())
+        self.assertEqual(len(xs), 103)
+
+    def test_clear(self):
+        self._pyramid.clear()
+        self.assertEqual(len(self._pyramid), 0)
+        self.assertIsNone(self._pyramid.last_x())
+        self.assertEqual(len(self._pyramid.get_data(0, 1, 100)[0]), 0)
@@ -0,0 +1,97 @@
+import json
+import os
+
+import numpy as np
+
+from src.pattern_tracking.logic.storage.ChunkedSeriesWriter import ChunkedSeriesWriter
+
+
+class ChunkedSeriesReader:
+    """
+    Reads a series written by a ChunkedSeriesWriter.
+    Chunks are memory-mapped in read-only mode when they are first accessed,
+    so that accessing a single row never loads the whole series in memory.
+
+    The number of rows is read from the metadata file when the reader is created,
+    call refresh() to see the rows flushed since then by a writer that is still running.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        """Directory containing the series"""
+        self._name = ""
+        """Human-readable name of the series"""
+        self._columns: list[str] = []
+        """Name of each column of the series"""
+        self._chunk_rows = 0
+        """Number of rows in each chunk"""
+        self._rows = 0
+        """Number of rows readable in this series"""
+        self._chunks: dict[int, np.memmap] = {}
+        """Chunks that have been memory-mapped, by chunk index"""
+        self.refresh()
+
+    def refresh(self):
+        """Reloads the metadata of the series, to read the rows that have been flushed since"""
+        meta_path = os.path.join(self._directory, ChunkedSeriesWriter.META_FILE_NAME)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"No series found in {self._directory}")
+        with open(meta_path) as f:
+            meta = json.load(f)
+        self._name = meta["name"]
+        self._columns = meta["columns"]
+        self._chunk_rows = meta["chunk_rows"]
+        self._rows = meta["rows"]
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_columns(self) -> list[str]:
+        return self._columns
+
+    def __len__(self):
+        return self._rows
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """
+        Random access to a single row of the series
+        :param index: Index of the row, negative values are counted from the end
+        :return: The row, as a view on the memory-mapped chunk
+        """
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("Row index out of range")
+        return self._chunk(index // self._chunk_rows)[index % self._chunk_rows]
+
+    def read(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """
+        Reads a contiguous range of rows
+        :param start: First row to read
+        :param stop: Row at which to stop reading (excluded), the end of the series if None
+        :return: A new array of shape (stop - start, number of columns)
+        """
+        stop = self._rows if stop is None else min(stop, self._rows)
+        start = max(0, start)
+        result = np.empty((max(0, stop - start), len(self._columns)), dtype=np.float64)
+        row = start
+        while row < stop:
+            chunk_index, offset = divmod(row, self._chunk_rows)
+            count = min(self._chunk_rows - offset, stop - row)
+            result[row - start: row - start + count] = self._chunk(chunk_index)[offset: offset + count]
+            row += count
+        return result
+
+    def column(self, name: str, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Reads a single column of the series, see read()"""
+        return self.read(start, stop)[:, self._columns.index(name)]
+
+    def _chunk(self, chunk_index: int) -> np.memmap:
+        chunk = self._chunks.get(chunk_index)
+        if chunk is None:
+            chunk = np.load(
+                os.path.join(self._directory, ChunkedSeriesWriter.CHUNK_FILE_FORMAT.format(chunk_index)),
+                mmap_mode='r'
+            )
+            self._chunks[chunk_index] = chunk
+        return chunk
@@ -0,0 +1,168 @@
+import json
+import os
+
+import numpy as np
+
+
+class ChunkedSeriesWriter:
+    """
+    Append-only storage of a time series on disk.
+
+    The series is a table with a fixed number of float64 columns, split in chunks
+    of `chunk_rows` rows. Each chunk is a `.npy` file that is memory-mapped while it is
+    being filled, so that appending rows doesn't rewrite the previous ones.
+    A `meta.json` file describes the columns and the number of rows written,
+    it is rewritten on each flush.
+
+    Directory layout of a series :
+        <directory>/meta.json
+        <directory>/chunk_00000.npy
+        <directory>/chunk_00001.npy
+        ...
+
+    This object is not thread-safe, it is meant to be used by a single writer,
+    see SeriesRecorder for the background writer used by the application.
+    """
+
+    DEFAULT_CHUNK_ROWS = 8192
+    """Number of rows stored in a single chunk file"""
+    META_FILE_NAME = "meta.json"
+    """Name of the file describing the series"""
+    CHUNK_FILE_FORMAT = "chunk_{:05d}.npy"
+    """Format of the name of each chunk file"""
+
+    def __init__(self, directory: str, columns: list[str], name: str | None = None,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        if len(columns) == 0:
+            raise ValueError("A series must have at least one column")
+        if chunk_rows <= 0:
+            raise ValueError("The number of rows in a chunk must be positive")
+        if os.path.exists(os.path.join(directory, ChunkedSeriesWriter.META_FILE_NAME)):
+            raise FileExistsError(f"A series already exists in {directory}")
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory = directory
+        """Directory in which the chunks and the metadata of this series are written"""
+        self._name = name if name is not None else os.path.basename(directory)
+        """Human-readable name of the series"""
+        self._columns = list(columns)
+        """Name of each column of the series"""
+        self._chunk_rows = chunk_rows
+        """Number of rows in each chunk"""
+        self._rows = 0
+        """Number of rows appended to this series"""
+        self._current_chunk: np.memmap | None = None
+        """Memory-mapped chunk currently being filled"""
+        self._write_meta()
+
+    @staticmethod
+    def reopen(directory: str, rows: int | None = None) -> "ChunkedSeriesWriter":
+        """
+        Reopens an existing series to append rows to it, for example to resume an interrupted recording
+        :param directory: Directory of the series
+        :param rows: Number of rows to keep, the following ones being overwritten by the next appended rows.
+                     All the flushed rows if None
+        """
+        meta_path = os.path.join(directory, ChunkedSeriesWriter.META_FILE_NAME)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"No series found in {directory}")
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if rows is None:
+            rows = meta["rows"]
+        if not 0 <= rows <= meta["rows"]:
+            raise ValueError(f"Cannot keep {rows} rows of a series of {meta['rows']} rows")
+
+        # the constructor refuses existing series, the writer is built around the existing files instead
+        writer = ChunkedSeriesWriter.__new__(ChunkedSeriesWriter)
+        writer._directory = directory
+        writer._name = meta["name"]
+        writer._columns = meta["columns"]
+        writer._chunk_rows = meta["chunk_rows"]
+        writer._rows = rows
+        writer._current_chunk = None
+        if rows % writer._chunk_rows != 0:
+            writer._current_chunk = np.load(
+                os.path.join(directory, ChunkedSeriesWriter.CHUNK_FILE_FORMAT.format(rows // writer._chunk_rows)),
+                mmap_mode='r+'
+            )
+        writer._write_meta()
+        return writer
+
+    def get_directory(self) -> str:
+        return self._directory
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_columns(self) -> list[str]:
+        return self._columns
+
+    def __len__(self):
+        return self._rows
+
+    def append(self, row: tuple[float, ...] | np.ndarray):
+        """
+        Appends a single row to the series
+        :param row: The values of each column, in the order of the columns of this series
+        """
+        self.append_rows(np.asarray(row, dtype=np.float64).reshape(1, -1))
+
+    def append_rows(self, rows: np.ndarray):
+        """
+        Appends a batch of rows to the series, opening new chunks when required
+        :param rows: Array of shape (n, number of columns)
+        """
+        rows = np.asarray(rows, dtype=np.float64)
+        if rows.ndim != 2 or rows.shape[1] != len(self._columns):
+            raise ValueError(f"Rows must be of shape (n, {len(self._columns)})")
+
+        written = 0
+        while written < len(rows):
+            offset = self._rows % self._chunk_rows
+            if offset == 0:
+                self._open_chunk(self._rows // self._chunk_rows)
+            count = min(self._chunk_rows - offset, len(rows) - written)
+            self._current_chunk[offset: offset + count] = rows[written: written + count]
+            written += count
+            self._rows += count
+            # a full chunk will never be written again
+            if self._rows % self._chunk_rows == 0:
+                self._close_chunk()
+
+    def flush(self):
+        """Writes the pending rows and the number of rows of the series to the disk"""
+        if self._current_chunk is not None:
+            self._current_chunk.flush()
+        self._write_meta()
+
+    def close(self):
+        """Flushes this series. No more rows can be appended after this call"""
+        self._close_chunk()
+        self._write_meta()
+
+    def _open_chunk(self, chunk_index: int):
+        self._close_chunk()
+        self._current_chunk = np.lib.format.open_memmap(
+            os.path.join(self._directory, ChunkedSeriesWriter.CHUNK_FILE_FORMAT.format(chunk_index)),
+            mode='w+', dtype=np.float64, shape=(self._chunk_rows, len(self._columns))
+        )
+
+    def _close_chunk(self):
+        if self._current_chunk is not None:
+            self._current_chunk.flush()
+            # dropping the reference closes the underlying mmap
+            self._current_chunk = None
+
+    def _write_meta(self):
+        """Atomically replaces the metadata file of this series"""
+        meta = {
+            "name": self._name,
+            "columns": self._columns,
+            "chunk_rows": self._chunk_rows,
+            "rows": self._rows,
+        }
+        meta_path = os.path.join(self._directory, ChunkedSeriesWriter.META_FILE_NAME)
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)
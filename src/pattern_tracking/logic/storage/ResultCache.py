@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+from threading import Lock
+
+import numpy as np
+
+
+class ResultCache:
+    """
+    Content-addressed cache of the results of an analysis, stored on the disk.
+
+    Each entry is a NumPy array, stored in a `.npy` file named after the key of its content.
+    Keys are built by the callers from everything the result depends on, with make_key(),
+    usually including the fingerprint of the analysed video, see fingerprint_file().
+
+    The size of the cache is bounded : when an entry is added, the least recently used entries
+    are removed until the total size of the entries is below `max_bytes`. Reading an entry
+    marks it as used, by updating the modification time of its file.
+    Entries are written to a temporary file then renamed, so processes can share a cache.
+    """
+
+    ENTRY_EXTENSION = ".npy"
+    FINGERPRINTS_FILE_NAME = "fingerprints.json"
+    """File remembering the fingerprint of the files already hashed, by path, size and modification time"""
+    HASH_BLOCK_SIZE = 1 << 20
+    """Number of bytes read at once when hashing a file"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        if max_bytes <= 0:
+            raise ValueError("The maximum size of the cache must be positive")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = Lock()
+        """Held while the cache is modified, processes sharing the cache rely on atomic renames instead"""
+
+    def get_directory(self) -> str:
+        return self._directory
+
+    @staticmethod
+    def make_key(*parts: str | bytes) -> str:
+        """:return: The key of a content defined by the given parts, in their order"""
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part.encode() if isinstance(part, str) else part
+            # the length prefix prevents different splits of the same bytes from giving the same key
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def fingerprint_file(self, path: str) -> str:
+        """
+        :return: The SHA-256 of the content of a file. The fingerprint of a file is remembered by the cache,
+                 and only computed again when the size or the modification time of the file change
+        """
+        stat = os.stat(path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        fingerprints_path = os.path.join(self._directory, ResultCache.FINGERPRINTS_FILE_NAME)
+        fingerprints = {}
+        if os.path.exists(fingerprints_path):
+            with open(fingerprints_path) as file:
+                fingerprints = json.load(file)
+        known = fingerprints.get(os.path.abspath(path))
+        if known is not None and known["signature"] == signature:
+            return known["sha256"]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(ResultCache.HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        fingerprints[os.path.abspath(path)] = {"signature": signature, "sha256": digest.hexdigest()}
+        self._replace(fingerprints_path, lambda file: file.write(json.dumps(fingerprints).encode()))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> np.ndarray | None:
+        """:return: The array stored with the given key, None if it isn't in the cache"""
+        path = self._entry_path(key)
+        try:
+            array = np.load(path)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return array
+
+    def put(self, key: str, array: np.ndarray):
+        """Stores an array with the given key, then evicts the least recently used entries if the cache is too big"""
+        self._lock.acquire(blocking=True)
+        try:
+            self._replace(self._entry_path(key), lambda file: np.save(file, array))
+            self._evict()
+        finally:
+            self._lock.release()
+
+    def size(self) -> int:
+        """:return: The total size of the entries, in bytes"""
+        return sum(size for _, _, size in self._entries())
+
+    def _evict(self):
+        """Removes the least recently used entries, until the cache fits in its maximum size"""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def _entries(self) -> list[tuple[str, int, int]]:
+        """:return: The path, the time of last use and the size of each entry"""
+        entries = []
+        for name in os.listdir(self._directory):
+            if name.endswith(ResultCache.ENTRY_EXTENSION):
+                path = os.path.join(self._directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((path, stat.st_mtime_ns, stat.st_size))
+        return entries
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._directory, key + ResultCache.ENTRY_EXTENSION)
+
+    @staticmethod
+    def _replace(path: str, write):
+        """Writes a file through a temporary file, so that readers never see a partially written file"""
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            write(file)
+        os.replace(temporary_path, path)
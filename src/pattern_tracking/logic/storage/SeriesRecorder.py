@@ -0,0 +1,149 @@
+import os
+import queue
+import re
+import uuid
+from threading import Event, Thread
+
+import numpy as np
+
+from src.pattern_tracking.logic.DistanceComputer import DistanceComputer
+from src.pattern_tracking.logic.storage.ChunkedSeriesWriter import ChunkedSeriesWriter
+from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+
+
+class SeriesRecorder:
+    """
+    Streams the tracker centers and the distances computed during a session
+    to ChunkedSeriesWriter objects, from a background thread.
+
+    The record_*() methods only put the values in an unbounded queue, so they never block
+    the tracking thread. The background worker takes care of creating the series, and writes
+    the pending rows in batches every `flush_interval` seconds.
+
+    Directory layout of a session :
+        <directory>/centers/<tracker name>_<id>/     columns : frame_number, x, y
+        <directory>/distances/<plot name>_<id>/      columns : frame_number, distance
+    Undefined values (POI not found) are stored as NaN.
+    """
+
+    CENTERS_DIR = "centers"
+    """Sub-directory of the session containing the center of each tracker"""
+    DISTANCES_DIR = "distances"
+    """Sub-directory of the session containing the distance of each plot"""
+    CENTERS_COLUMNS = ["frame_number", "x", "y"]
+    DISTANCES_COLUMNS = ["frame_number", "distance"]
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    """Time in seconds between two writes of the pending rows to the disk"""
+
+    def __init__(self, directory: str, global_halt: Event, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self._directory = directory
+        """Directory of the recorded session"""
+        self._global_halt = global_halt
+        """Global event used to check whether or not to continue working. Not modified by this class"""
+        self._stop_working = Event()
+        """Local event that stops the background worker of this recorder"""
+        self._flush_interval = flush_interval
+        """Time in seconds between two writes of the pending rows"""
+        self._pending: queue.SimpleQueue[tuple[str, uuid.UUID, str, tuple[float, ...]]] = queue.SimpleQueue()
+        """Rows waiting to be written, as (sub-directory, series id, series name, row)"""
+        self._writers: dict[uuid.UUID, ChunkedSeriesWriter] = {}
+        """Series of this session, only accessed by the background worker"""
+        self._thread: Thread | None = None
+        """The thread writing the rows in the background"""
+
+    def get_directory(self) -> str:
+        return self._directory
+
+    def start(self):
+        self._thread = Thread(target=self._run)
+        self._thread.start()
+
+    def stop(self, wait: bool = False):
+        """
+        Stops the background worker once all the pending rows have been written
+        :param wait: If True, blocks until the worker has written the pending rows and closed the series
+        """
+        self._stop_working.set()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    def record_centers(self, frame_number: int, trackers: dict[uuid.UUID, AbstractTracker]):
+        """
+        Records the center of the found POI of each given tracker
+        :param frame_number: Number of the frame in which the POIs have been found
+        :param trackers: The trackers to record, by UUID
+        """
+        for tracker_id, tracker in trackers.items():
+            center = tracker.get_found_poi_center()
+            x, y = (np.nan, np.nan) if center is None else center
+            self.record_row(SeriesRecorder.CENTERS_DIR, tracker_id, tracker.get_name(), (frame_number, x, y))
+
+    def record_distances(self, frame_number: int, distances: dict[DistanceComputer, float]):
+        """
+        Records the distance computed by each given DistanceComputer
+        :param frame_number: Number of the frame from which the distances have been computed
+        :param distances: The computed distance of each DistanceComputer
+        """
+        for dist_computer, distance in distances.items():
+            if distance == DistanceComputer.ERR_DIST:
+                distance = np.nan
+            self.record_row(SeriesRecorder.DISTANCES_DIR, dist_computer.get_uuid(), dist_computer.get_name(),
+                            (frame_number, distance))
+
+    def record_row(self, sub_directory: str, series_id: uuid.UUID, name: str, row: tuple[float, ...]):
+        """
+        Records a row of a series, for values that don't come from a tracker or a DistanceComputer
+        :param sub_directory: CENTERS_DIR or DISTANCES_DIR, defines the columns of the series
+        :param series_id: UUID of the series, the series is created with its first row
+        :param name: Name of the series
+        :param row: The values of the columns of the series
+        """
+        self._pending.put((sub_directory, series_id, name, row))
+
+    def _run(self):
+        """Periodically writes all pending rows, until asked to stop"""
+        running = True
+        while running:
+            running = not self._stop_working.is_set() and not self._global_halt.is_set()
+            if running:
+                # woken up as soon as the recorder is stopped
+                self._stop_working.wait(self._flush_interval)
+            self._write_pending()
+
+        for writer in self._writers.values():
+            writer.close()
+
+    def _write_pending(self):
+        """Groups the pending rows by series, and appends each group in a single batch"""
+        batches: dict[uuid.UUID, list[tuple[float, ...]]] = {}
+        while True:
+            try:
+                sub_directory, series_id, name, row = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if series_id not in self._writers:
+                self._writers[series_id] = SeriesRecorder.create_writer(self._directory, sub_directory, series_id, name)
+            batches.setdefault(series_id, []).append(row)
+
+        for series_id, rows in batches.items():
+            writer = self._writers[series_id]
+            writer.append_rows(np.array(rows, dtype=np.float64))
+            writer.flush()
+
+    @staticmethod
+    def create_writer(directory: str, sub_directory: str, series_id: uuid.UUID, name: str) -> ChunkedSeriesWriter:
+        """
+        Creates the writer of a series, at its place in the layout of a session
+        :param directory: Directory of the session
+        :param sub_directory: CENTERS_DIR or DISTANCES_DIR, defines the columns of the series
+        :param series_id: UUID of the tracker or of the plot
+        :param name: Name of the tracker or of the plot
+        """
+        columns = SeriesRecorder.CENTERS_COLUMNS if sub_directory == SeriesRecorder.CENTERS_DIR \
+            else SeriesRecorder.DISTANCES_COLUMNS
+        # names are chosen by the user, keep them readable but valid on any file system
+        safe_name = re.sub(r"[^\w\-]", "_", name)
+        return ChunkedSeriesWriter(
+            os.path.join(directory, sub_directory, f"{safe_name}_{series_id.hex[:8]}"),
+            columns, name=name
+        )
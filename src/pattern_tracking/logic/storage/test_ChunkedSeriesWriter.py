@@ -0,0 +1,68 @@
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from src.pattern_tracking.logic.storage.ChunkedSeriesReader import ChunkedSeriesReader
+from src.pattern_tracking.logic.storage.ChunkedSeriesWriter import ChunkedSeriesWriter
+
+
+class TestChunkedSeriesWriter(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._directory = self._tmp_dir.name + "/series"
+        self._rows = np.column_stack((np.arange(250), np.arange(250) * 0.5))
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_rows_span_multiple_chunks(self):
+        writer = ChunkedSeriesWriter(self._directory, ["frame_number", "distance"], chunk_rows=64)
+        writer.append_rows(self._rows[:100])
+        for row in self._rows[100:]:
+            writer.append(row)
+        writer.close()
+
+        reader = ChunkedSeriesReader(self._directory)
+        self.assertEqual(len(reader), 250)
+        self.assertTrue((reader.read() == self._rows).all())
+        self.assertTrue((reader.read(60, 130) == self._rows[60:130]).all())
+        self.assertTrue((reader[200] == self._rows[200]).all())
+        self.assertTrue((reader[-1] == self._rows[-1]).all())
+        self.assertTrue((reader.column("distance") == self._rows[:, 1]).all())
+
+    def test_reader_only_sees_flushed_rows(self):
+        writer = ChunkedSeriesWriter(self._directory, ["frame_number", "distance"], chunk_rows=64)
+        writer.append_rows(self._rows[:10])
+        reader = ChunkedSeriesReader(self._directory)
+        self.assertEqual(len(reader), 0)
+        writer.flush()
+        reader.refresh()
+        self.assertEqual(len(reader), 10)
+        self.assertTrue((reader.read() == self._rows[:10]).all())
+
+    def test_invalid_rows(self):
+        writer = ChunkedSeriesWriter(self._directory, ["frame_number", "distance"])
+        with self.assertRaises(ValueError):
+            writer.append_rows(np.zeros((2, 3)))
+
+    def test_reopen_overwrites_the_rows_after_the_kept_ones(self):
+        writer = ChunkedSeriesWriter(self._directory, ["frame_number", "distance"], chunk_rows=64)
+        writer.append_rows(np.zeros((150, 2)))
+        writer.close()
+
+        writer = ChunkedSeriesWriter.reopen(self._directory, rows=0)
+        writer.append_rows(self._rows[:100])
+        writer.close()
+        writer = ChunkedSeriesWriter.reopen(self._directory)
+        writer.append_rows(self._rows[100:])
+        writer.close()
+
+        reader = ChunkedSeriesReader(self._directory)
+        self.assertEqual(len(reader), 250)
+        self.assertTrue((reader.read() == self._rows).all())
+        with self.assertRaises(ValueError):
+            ChunkedSeriesWriter.reopen(self._directory, rows=300)
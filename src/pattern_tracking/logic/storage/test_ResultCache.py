@@ -0,0 +1,57 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from src.pattern_tracking.logic.storage.ResultCache import ResultCache
+
+
+class TestResultCache(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._entry = np.arange(100, dtype=np.float64)
+        # room for two entries of 100 float64 and their .npy header
+        self._cache = ResultCache(self._tmp_dir.name, max_bytes=2 * (self._entry.nbytes + 128))
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_make_key_depends_on_the_split_of_the_parts(self):
+        self.assertEqual(ResultCache.make_key("ab", b"c"), ResultCache.make_key(b"ab", "c"))
+        self.assertNotEqual(ResultCache.make_key("ab", "c"), ResultCache.make_key("a", "bc"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        for key in ("first", "second"):
+            self._cache.put(key, self._entry)
+            time.sleep(0.01)
+        self.assertTrue((self._cache.get("first") == self._entry).all())
+        time.sleep(0.01)
+        self._cache.put("third", self._entry)
+
+        self.assertIsNotNone(self._cache.get("first"))
+        self.assertIsNone(self._cache.get("second"))
+        self.assertIsNotNone(self._cache.get("third"))
+        self.assertLessEqual(self._cache.size(), 2 * (self._entry.nbytes + 128))
+
+    def test_failed_put_releases_the_lock(self):
+        with patch.object(self._cache, "_replace", side_effect=IOError("disk full")):
+            with self.assertRaises(IOError):
+                self._cache.put("first", self._entry)
+        self._cache.put("first", self._entry)
+        self.assertIsNotNone(self._cache.get("first"))
+
+    def test_fingerprint_follows_the_content(self):
+        path = os.path.join(self._tmp_dir.name, "video.avi")
+        with open(path, "wb") as file:
+            file.write(b"frames")
+        fingerprint = self._cache.fingerprint_file(path)
+        self.assertEqual(fingerprint, self._cache.fingerprint_file(path))
+        with open(path, "wb") as file:
+            file.write(b"other frames")
+        self.assertNotEqual(fingerprint, self._cache.fingerprint_file(path))
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.pattern_tracking.logic.DistanceComputer import DistanceComputer
+from src.pattern_tracking.logic.MetricsEngine import MetricsEngine
+from src.pattern_tracking.logic.tracker.FixedPointTracker import FixedPointTracker
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class TestMetricsEngine(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._frame = np.zeros((480, 720, 3), dtype=np.uint8)
+        self._trackers = [FixedPointTracker(f"t{i}") for i in range(4)]
+        for i, tracker in enumerate(self._trackers[:3]):
+            tracker.set_poi(RegionOfInterest.new(self._frame, 10 + 100 * i, 50, 25 + 40 * i, 51))
+        self._engine = MetricsEngine()
+        self._pairs = [
+            DistanceComputer("a", self._trackers[0], self._trackers[1]),
+            DistanceComputer("b", self._trackers[2], self._trackers[0]),
+            DistanceComputer("c", self._trackers[1], self._trackers[3]),
+        ]
+        self._columns = [self._engine.add_pair(p) for p in self._pairs]
+
+    def test_distances_match_distance_computer(self):
+        metrics = self._engine.compute(0)
+        for pair, column in zip(self._pairs[:2], self._columns[:2]):
+            self.assertAlmostEqual(metrics.distances[column], pair.distance())
+
+    def test_undefined_tracker_gives_nan(self):
+        metrics = self._engine.compute(0)
+        self.assertEqual(self._pairs[2].distance(), DistanceComputer.ERR_DIST)
+        self.assertTrue(np.isnan(metrics.distances[self._columns[2]]))
+
+    def test_angle_displacement_velocity(self):
+        self._engine.compute(0)
+        self._trackers[1].set_poi(RegionOfInterest.new(self._frame, 110 + 6, 50, 65 + 8, 51))
+        metrics = self._engine.compute(2)
+        row = [t.get_id() for t in self._engine.get_trackers()].index(self._trackers[1].get_id())
+        self.assertAlmostEqual(metrics.displacements[row], 10)
+        self.assertTrue((metrics.velocities[row] == (3, 4)).all())
+        dx, dy = metrics.centers[row] - self._trackers[0].get_found_poi_center()
+        self.assertAlmostEqual(metrics.angles[self._columns[0]], np.degrees(np.arctan2(dy, dx)))
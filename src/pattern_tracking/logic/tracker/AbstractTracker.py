@@ -4,8 +4,9 @@ from abc import ABC, abstractmethod
 import cv2 as cv
 import numpy as np
 
-from src.pattern_tracking.shared import utils
+from src.pattern_tracking.shared import utils, constants
 from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
 
 
 class AbstractTracker(ABC):
@@ -37,6 +38,10 @@ class AbstractTracker(ABC):
         """The current frame to be displayed to the user, with the highlighted zones"""
         self._drawing_frame = np.zeros(self._base_frame.shape)
         """A copy of the base frame, that will be edited by the highlighter"""
+        self._shared_frame_data = SharedFrameData(self._base_frame)
+        """Data derived from the current frame, shared with the other trackers of the same manager"""
+        self._detection_threshold = constants.DETECTION_THRESHOLD
+        """Minimal correlation of a match with the template, for the trackers searching their template"""
         self._initialized = False
         """Whether this tracker has been initialized once
            Only used by OpenCV's trackers, to avoid computing detection
@@ -66,9 +71,47 @@ class AbstractTracker(ABC):
     def set_detection_region(self, region: RegionOfInterest):
         self._detection_region = region
 
+    def get_detection_threshold(self) -> float:
+        return self._detection_threshold
+
+    def set_detection_threshold(self, threshold: float):
+        """
+        Changes the minimal correlation of a match with the template, constants.DETECTION_THRESHOLD by default.
+        Ignored by the trackers that don't search their template
+        """
+        if not 0 <= threshold <= 1:
+            raise ValueError("The detection threshold must be between 0 and 1")
+        self._detection_threshold = threshold
+
+    def get_poi(self) -> RegionOfInterest:
+        """:return: The POI set by the user, empty if not set yet"""
+        return self._template_poi
+
     def set_poi(self, poi: RegionOfInterest):
         self._template_poi = poi
 
+    def set_shared_frame_data(self, shared_frame_data: SharedFrameData):
+        """
+        Gives this tracker the data derived from the next frame, that is shared with other trackers.
+        Called by the TrackerManager before update(), it doesn't need to be called otherwise.
+        """
+        self._shared_frame_data = shared_frame_data
+
+    def get_shared_frame_data(self) -> SharedFrameData:
+        """:return: The shared data derived from the current base frame"""
+        # when the tracker is used on its own, nobody shares data with it
+        if not self._shared_frame_data.is_for(self._base_frame):
+            self._shared_frame_data = SharedFrameData(self._base_frame)
+        return self._shared_frame_data
+
+    def get_found_poi(self) -> RegionOfInterest:
+        """:return: The region in which the POI has been found in the last frame, undefined if it wasn't found"""
+        return self._found_poi
+
+    def is_found(self) -> bool:
+        """:return: True if the POI was found in the last frame"""
+        return not self._found_poi.is_undefined()
+
     def get_found_poi_center(self) -> np.ndarray | None:
         """:return: Coordinates of the center of the location of the POI in this tracker's frame"""
         # TODO: add tests
@@ -0,0 +1,137 @@
+import uuid
+from threading import Lock
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
+
+
+class BatchedFFTMatcher:
+    """
+    Computes the normalized cross-correlation (the same score as cv.TM_CCORR_NORMED)
+    of many templates with the same frame, in the frequency domain.
+
+    Each channel of the frame is transformed with a single DFT per frame, then multiplied with
+    the spectrum of each template, which is computed once when the template is registered.
+    The channels are summed before the inverse DFT, so each template only costs one inverse DFT.
+    The local norm of the frame under the template, needed by the normalization,
+    is computed with an integral image, once for each template size.
+
+    An instance is shared by all the FFTTemplateTracker of a TrackerManager.
+    """
+
+    EPSILON = 1e-6
+    """Lower bound of the denominator of the normalization, to avoid dividing by 0 on black areas"""
+
+    def __init__(self):
+        self._templates: dict[uuid.UUID, np.ndarray] = {}
+        """The registered templates, by key"""
+        self._template_spectra: dict[uuid.UUID, list[np.ndarray]] = {}
+        """DFT of each channel of the templates, padded to self._dft_shape"""
+        self._template_norms: dict[uuid.UUID, float] = {}
+        """Square root of the sum of the squared values of each template"""
+        self._frame_shape: tuple[int, ...] | None = None
+        """Shape of the frames the spectra have been computed for"""
+        self._dft_shape: tuple[int, int] = (0, 0)
+        """Size of the DFTs, the frame size rounded up to a size that is fast to transform"""
+        self._frame_data: SharedFrameData | None = None
+        """The frame of which the confidence maps have been computed"""
+        self._confidence_maps: dict[uuid.UUID, np.ndarray] = {}
+        """The confidence maps of each template, for self._frame_data"""
+        self._lock = Lock()
+        """Templates are registered from the GUI thread, while the maps are computed by the background thread"""
+
+    def register(self, key: uuid.UUID, template: np.ndarray, frame_shape: tuple[int, ...]):
+        """
+        Adds a template to match in the next frames, or replaces the one with the same key
+        :param key: Identifier of the template, used to retrieve its confidence map
+        :param template: The image to find in the frames
+        :param frame_shape: Shape of the frames in which the template will be searched
+        """
+        if template.ndim != len(frame_shape):
+            raise ValueError("The template and the frames must have the same number of channels")
+        self._lock.acquire(blocking=True)
+        if frame_shape != self._frame_shape:
+            self._resize(frame_shape)
+        self._templates[key] = template
+        self._template_spectra[key] = self._spectra(template)
+        self._template_norms[key] = float(np.sqrt(np.square(template, dtype=np.float64).sum()))
+        self._confidence_maps.pop(key, None)
+        self._lock.release()
+
+    def unregister(self, key: uuid.UUID):
+        """Stops matching the template with the given key. Does nothing if it isn't registered"""
+        self._lock.acquire(blocking=True)
+        self._templates.pop(key, None)
+        self._template_spectra.pop(key, None)
+        self._template_norms.pop(key, None)
+        self._confidence_maps.pop(key, None)
+        self._lock.release()
+
+    def is_registered(self, key: uuid.UUID) -> bool:
+        return key in self._templates
+
+    def get_confidence_map(self, frame_data: SharedFrameData, key: uuid.UUID) -> np.ndarray:
+        """
+        Returns the correlation of the template at each location of the frame.
+        The maps of all the registered templates are computed together, on the first call for a new frame.
+        :param frame_data: The shared data of the frame in which to find the template
+        :param key: Identifier of the registered template
+        :return: The map of the scores, of the same shape as the result of cv.matchTemplate() on the whole frame
+        :raises KeyError: If no template is registered with this key
+        """
+        self._lock.acquire(blocking=True)
+        try:
+            if self._frame_data is not frame_data or key not in self._confidence_maps:
+                self._compute_all(frame_data.get_frame())
+                self._frame_data = frame_data
+            return self._confidence_maps[key]
+        finally:
+            self._lock.release()
+
+    def _resize(self, frame_shape: tuple[int, ...]):
+        """Uses DFTs of a new size, and recomputes the spectra of the templates accordingly"""
+        self._frame_shape = frame_shape
+        self._dft_shape = (cv.getOptimalDFTSize(frame_shape[0]), cv.getOptimalDFTSize(frame_shape[1]))
+        self._template_spectra = {key: self._spectra(template) for key, template in self._templates.items()}
+        self._confidence_maps = {}
+
+    def _spectra(self, image: np.ndarray) -> list[np.ndarray]:
+        """:return: The DFT of each channel of the image, zero-padded to the size of the DFTs"""
+        channels = cv.split(image) if image.ndim == 3 else [image]
+        spectra = []
+        for channel in channels:
+            padded = np.zeros(self._dft_shape, dtype=np.float32)
+            padded[:channel.shape[0], :channel.shape[1]] = channel
+            spectra.append(cv.dft(padded))
+        return spectra
+
+    def _compute_all(self, frame: np.ndarray):
+        """Computes the confidence map of every registered template in the given frame"""
+        if frame.shape != self._frame_shape:
+            self._resize(frame.shape)
+        frame_spectra = self._spectra(frame)
+        squared = np.square(frame, dtype=np.float32)
+        integral = cv.integral(squared.sum(axis=2) if frame.ndim == 3 else squared, sdepth=cv.CV_64F)
+        inverse_local_norms: dict[tuple[int, int], np.ndarray] = {}
+
+        self._confidence_maps = {}
+        height, width = frame.shape[:2]
+        for key, template_spectra in self._template_spectra.items():
+            h, w = self._templates[key].shape[:2]
+            if h > height or w > width:
+                self._confidence_maps[key] = np.zeros((0, 0), dtype=np.float32)
+                continue
+            # norm of the frame under the template at each location, shared by the templates of the same size
+            if (h, w) not in inverse_local_norms:
+                local_sums = integral[h:, w:] - integral[:-h, w:] - integral[h:, :-w] + integral[:-h, :-w]
+                inverse_local_norms[(h, w)] = (1 / np.sqrt(np.maximum(local_sums, BatchedFFTMatcher.EPSILON))) \
+                    .astype(np.float32)
+
+            product = cv.mulSpectrums(frame_spectra[0], template_spectra[0], 0, conjB=True)
+            for frame_spectrum, template_spectrum in zip(frame_spectra[1:], template_spectra[1:]):
+                product += cv.mulSpectrums(frame_spectrum, template_spectrum, 0, conjB=True)
+            correlation = cv.idft(product, flags=cv.DFT_REAL_OUTPUT | cv.DFT_SCALE)[:height - h + 1, :width - w + 1]
+            norm = max(self._template_norms[key], BatchedFFTMatcher.EPSILON)
+            self._confidence_maps[key] = correlation * inverse_local_norms[(h, w)] / norm
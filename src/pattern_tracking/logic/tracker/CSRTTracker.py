@@ -0,0 +1,17 @@
+import cv2 as cv
+
+from src.pattern_tracking.logic.tracker.OpenCVTracker import OpenCVTracker
+
+
+class CSRTTracker(OpenCVTracker):
+    """
+    Usage of the cv.TrackerCSRT object (Discriminative Correlation Filter with Channel and Spatial Reliability).
+    More accurate than KCF, but a few times slower. Only available with the contrib modules of OpenCV
+    """
+
+    def _create_base_tracker(self) -> cv.Tracker:
+        return cv.TrackerCSRT_create()
+
+    @staticmethod
+    def is_available() -> bool:
+        return hasattr(cv, "TrackerCSRT_create")
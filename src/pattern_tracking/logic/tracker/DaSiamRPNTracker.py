@@ -0,0 +1,32 @@
+import os
+
+import cv2 as cv
+
+from src.pattern_tracking.logic.tracker.OpenCVTracker import OpenCVTracker
+from src.pattern_tracking.shared import constants
+
+
+class DaSiamRPNTracker(OpenCVTracker):
+    """
+    Usage of the cv.TrackerDaSiamRPN object, a siamese region proposal network.
+    More robust than NanoTrack, but much heavier on the CPU.
+    Requires the ONNX models of DaSiamRPN in constants.TRACKER_MODELS_DIR
+    """
+    MODEL_FILE = "dasiamrpn_model.onnx"
+    KERNEL_CLS1_FILE = "dasiamrpn_kernel_cls1.onnx"
+    KERNEL_R1_FILE = "dasiamrpn_kernel_r1.onnx"
+
+    def _create_base_tracker(self) -> cv.Tracker:
+        params = cv.TrackerDaSiamRPN_Params()
+        params.model = os.path.join(constants.TRACKER_MODELS_DIR, DaSiamRPNTracker.MODEL_FILE)
+        params.kernel_cls1 = os.path.join(constants.TRACKER_MODELS_DIR, DaSiamRPNTracker.KERNEL_CLS1_FILE)
+        params.kernel_r1 = os.path.join(constants.TRACKER_MODELS_DIR, DaSiamRPNTracker.KERNEL_R1_FILE)
+        return cv.TrackerDaSiamRPN_create(params)
+
+    @staticmethod
+    def is_available() -> bool:
+        return hasattr(cv, "TrackerDaSiamRPN_create") and all(
+            os.path.isfile(os.path.join(constants.TRACKER_MODELS_DIR, file))
+            for file in (DaSiamRPNTracker.MODEL_FILE, DaSiamRPNTracker.KERNEL_CLS1_FILE,
+                         DaSiamRPNTracker.KERNEL_R1_FILE)
+        )
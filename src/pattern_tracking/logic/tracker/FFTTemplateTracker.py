@@ -0,0 +1,79 @@
+import numpy as np
+import cv2 as cv
+
+from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+from src.pattern_tracking.logic.tracker.BatchedFFTMatcher import BatchedFFTMatcher
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class FFTTemplateTracker(AbstractTracker):
+    """
+    Same detection as the TemplateTracker, but the correlation is computed by a BatchedFFTMatcher.
+    When the matcher is shared by many trackers (the TrackerManager does it), the frame is only
+    transformed once for all of them, which is faster than one cv.matchTemplate() call per tracker.
+
+    The detection region doesn't make the search faster, the correlation being computed
+    on the whole frame : it only limits the locations at which the template can be found.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._matcher = BatchedFFTMatcher()
+        """Computes the correlation of the template. Replaced by the shared one of the TrackerManager"""
+
+    # -- Methods
+    def update(self, base_frame: np.ndarray, drawing_frame: np.ndarray):
+        super().update(base_frame, drawing_frame)
+        if not self._template_poi.is_undefined():
+            self._found_poi = self._find_poi()
+
+            # Determine what we have to draw
+            if self._detection_region.is_undefined():
+                if not self._found_poi.is_undefined():
+                    self._draw_poi(self._found_poi.get_coords())
+            else:
+                if self._detection_region.intersects(self._template_poi):
+                    self._draw_poi(self._found_poi.get_coords())
+
+    def _find_poi(self) -> RegionOfInterest:
+        """:return: The location of the template in the base frame, or an empty region if not found"""
+        if not self._matcher.is_registered(self._id):
+            self._matcher.register(self._id, self._template_poi.get_image().copy(), self._base_frame.shape)
+        confidence_map = self._matcher.get_confidence_map(self.get_shared_frame_data(), self._id)
+
+        template_size = np.array(self._template_poi.get_image().shape[1::-1])
+        offset = np.zeros(2, dtype=int)
+        if not self._detection_region.is_undefined():
+            # only keep the locations where the template is entirely in the detection region
+            (x_min, y_min), (x_max, y_max) = self._detection_region.get_coords()
+            confidence_map = confidence_map[y_min: y_max - template_size[1] + 1, x_min: x_max - template_size[0] + 1]
+            offset = np.array((x_min, y_min))
+        if confidence_map.size == 0:
+            return RegionOfInterest.new_empty()
+
+        _, max_val, _, top_left = cv.minMaxLoc(confidence_map)
+        if max_val < self._detection_threshold:
+            return RegionOfInterest.new_empty()
+        top_left = np.array(top_left) + offset
+        return RegionOfInterest.from_points(self._base_frame, top_left, top_left + template_size)
+
+    def set_matcher(self, matcher: BatchedFFTMatcher):
+        """
+        Makes this tracker use the given matcher, usually shared with other trackers
+        :param matcher: The matcher in which the template of this tracker will be registered
+        """
+        self._matcher.unregister(self._id)
+        self._matcher = matcher
+        if not self._template_poi.is_undefined():
+            self._matcher.register(self._id, self._template_poi.get_image().copy(),
+                                   self._template_poi.get_parent_image().shape)
+
+    def release_matcher(self):
+        """Removes the template of this tracker from its matcher, called when the tracker is deleted"""
+        self._matcher.unregister(self._id)
+
+    # -- Overrides
+    def set_poi(self, poi: RegionOfInterest):
+        super().set_poi(poi)
+        # the spectrum of the template is computed here once, instead of at each frame
+        self._matcher.register(self._id, poi.get_image().copy(), poi.get_parent_image().shape)
@@ -0,0 +1,77 @@
+import cv2 as cv
+
+from src.pattern_tracking.shared import utils, constants
+from src.pattern_tracking.logic.tracker.KCFTracker import KCFTracker
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class HybridTracker(KCFTracker):
+    """
+    KCF tracker that is regularly corrected by a template detection.
+
+    The KCF tracker runs at every frame. The template is searched again, like the TemplateTracker does,
+    every REDETECTION_INTERVAL frames, or as soon as the KCF tracker loses the POI or its location doesn't
+    look like the template anymore (correlation below the detection threshold).
+    When the template is found somewhere else, the KCF tracker is re-initialized in place on it.
+
+    The template is first searched around the location given by KCF, then in the detection
+    region or the whole frame, so a re-detection is usually as cheap as a few KCF updates.
+    """
+    REDETECTION_INTERVAL = 15
+    """Maximum number of frames between two template detections"""
+
+    def __init__(self, name: str, redetection_interval: int = REDETECTION_INTERVAL):
+        super().__init__(name)
+        self._redetection_interval = redetection_interval
+        """Maximum number of frames between two template detections"""
+        self._frames_since_detection = 0
+        """Number of frames tracked by KCF alone since the last template detection"""
+
+    def _locate_poi(self) -> RegionOfInterest | None:
+        tracked = self._track()
+        self._frames_since_detection += 1
+        if not tracked.is_undefined() \
+                and self._frames_since_detection < self._redetection_interval \
+                and self._confidence(tracked) >= self._detection_threshold:
+            return tracked
+
+        self._frames_since_detection = 0
+        detected = self._detect(tracked)
+        if detected.is_undefined():
+            return detected
+        if tracked.is_undefined() or (detected.get_coords(0) != tracked.get_coords(0)).any():
+            self._init_base_tracker(detected)
+        return detected
+
+    def _confidence(self, region: RegionOfInterest) -> float:
+        """:return: The correlation of the template with the given region of the base frame, 0 if they can't match"""
+        template = self._template_poi.get_image()
+        patch = region.get_image()
+        if patch.shape != template.shape:
+            return 0.0
+        return float(cv.matchTemplate(patch, template, cv.TM_CCORR_NORMED)[0, 0])
+
+    def _detect(self, tracked: RegionOfInterest) -> RegionOfInterest:
+        """
+        Searches the template around the location given by KCF, then in the detection region
+        :param tracked: The location given by KCF, or an empty region if it lost the POI
+        :return: The location of the template, or an empty region if not found
+        """
+        template = self._template_poi.get_image()
+        if not tracked.is_undefined():
+            search_window = utils.compute_search_window(
+                self._base_frame, utils.middle_of(*tracked.get_coords()), template.shape,
+                constants.SEARCH_WINDOW_MARGIN, self._detection_region
+            )
+            if not search_window.is_undefined():
+                found = utils.find_template_in_image(self._base_frame, template, self._detection_threshold,
+                                                     detection_bounds=search_window)
+                if not found.is_undefined():
+                    return found
+        return utils.find_template_in_image(self._base_frame, template, self._detection_threshold,
+                                            detection_bounds=self._detection_region)
+
+    # -- Overrides
+    def set_poi(self, poi: RegionOfInterest):
+        super().set_poi(poi)
+        self._frames_since_detection = 0
@@ -0,0 +1,17 @@
+import cv2 as cv
+
+from src.pattern_tracking.logic.tracker.OpenCVTracker import OpenCVTracker
+
+
+class MILTracker(OpenCVTracker):
+    """
+    Usage of the cv.TrackerMIL object (Multiple Instance Learning).
+    Available in all builds of OpenCV, but slower than the correlation filters
+    """
+
+    def _create_base_tracker(self) -> cv.Tracker:
+        return cv.TrackerMIL_create()
+
+    @staticmethod
+    def is_available() -> bool:
+        return hasattr(cv, "TrackerMIL_create")
@@ -0,0 +1,18 @@
+import cv2 as cv
+
+from src.pattern_tracking.logic.tracker.OpenCVTracker import OpenCVTracker
+
+
+class MOSSETracker(OpenCVTracker):
+    """
+    Usage of the cv.legacy.TrackerMOSSE object (Minimum Output Sum of Squared Error).
+    The fastest correlation filter of OpenCV, it works on grayscale images.
+    Only available in the legacy API of the contrib modules of OpenCV
+    """
+
+    def _create_base_tracker(self) -> cv.Tracker:
+        return cv.legacy.TrackerMOSSE_create()
+
+    @staticmethod
+    def is_available() -> bool:
+        return hasattr(cv, "legacy") and hasattr(cv.legacy, "TrackerMOSSE_create")
@@ -0,0 +1,53 @@
+import numpy as np
+
+
+class MotionPredictor:
+    """
+    Predicts the next position of a tracked point from its recent motion,
+    using a constant-velocity alpha-beta filter (a steady-state Kalman filter).
+
+    The tracked points of a beating cell only move of a few pixels between two frames,
+    so the predicted position is used by the trackers to only search a small window
+    around it, instead of the whole frame.
+    """
+
+    DEFAULT_ALPHA = 1.0
+    """Weight of the measured position against the predicted one. 1 trusts the measure entirely"""
+    DEFAULT_BETA = 0.5
+    """Weight of the prediction error in the update of the velocity"""
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA, beta: float = DEFAULT_BETA):
+        self._alpha = alpha
+        self._beta = beta
+        self._position: np.ndarray | None = None
+        """Estimated position of the point, None if unknown"""
+        self._velocity = np.zeros(2)
+        """Estimated velocity of the point, in pixels per frame"""
+
+    def reset(self):
+        """Forgets the motion of the point, the next prediction will be unknown"""
+        self._position = None
+        self._velocity = np.zeros(2)
+
+    def predict(self) -> np.ndarray | None:
+        """:return: The expected position of the point in the next frame, or None if unknown"""
+        if self._position is None:
+            return None
+        return self._position + self._velocity
+
+    def update(self, measured: np.ndarray | None):
+        """
+        Corrects the estimated motion with the position measured in the current frame
+        :param measured: The position at which the point has been found, None if it was lost
+        """
+        if measured is None:
+            self.reset()
+            return
+        measured = np.asarray(measured, dtype=float)
+        if self._position is None:
+            self._position = measured
+            return
+        predicted = self._position + self._velocity
+        error = measured - predicted
+        self._position = predicted + self._alpha * error
+        self._velocity = self._velocity + self._beta * error
@@ -0,0 +1,28 @@
+import os
+
+import cv2 as cv
+
+from src.pattern_tracking.logic.tracker.OpenCVTracker import OpenCVTracker
+from src.pattern_tracking.shared import constants
+
+
+class NanoTracker(OpenCVTracker):
+    """
+    Usage of the cv.TrackerNano object, a lightweight siamese network running on the CPU.
+    Requires the ONNX models of NanoTrack in constants.TRACKER_MODELS_DIR
+    """
+    BACKBONE_FILE = "nanotrack_backbone_sim.onnx"
+    NECKHEAD_FILE = "nanotrack_head_sim.onnx"
+
+    def _create_base_tracker(self) -> cv.Tracker:
+        params = cv.TrackerNano_Params()
+        params.backbone = os.path.join(constants.TRACKER_MODELS_DIR, NanoTracker.BACKBONE_FILE)
+        params.neckhead = os.path.join(constants.TRACKER_MODELS_DIR, NanoTracker.NECKHEAD_FILE)
+        return cv.TrackerNano_create(params)
+
+    @staticmethod
+    def is_available() -> bool:
+        return hasattr(cv, "TrackerNano_create") and all(
+            os.path.isfile(os.path.join(constants.TRACKER_MODELS_DIR, file))
+            for file in (NanoTracker.BACKBONE_FILE, NanoTracker.NECKHEAD_FILE)
+        )
@@ -0,0 +1,141 @@
+from abc import abstractmethod
+from threading import Lock
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+from src.pattern_tracking.shared import utils
+
+
+class OpenCVTracker(AbstractTracker):
+    """
+    Usage of the trackers of OpenCV (cv.Tracker objects), but with this app's architecture.
+    Each backend extends this class, and creates its OpenCV tracker in _create_base_tracker()
+
+    dev note: Everytime the POI and/or detection region changes, you need to call
+    OpenCV's tracker init() method (in place, see _init_base_tracker()), and you need to keep
+    track of which image to use when the method self.update() is getting called (either the full frame,
+    or the image of the detection region). These two checks are done independently, but they are strongly linked !
+    """
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._base_tracker = self._create_base_tracker()
+        """The base object from the OpenCV API"""
+        self._init_lock = Lock()
+        """Lock used to not update the tracker while it is being renewed (reinitialized)"""
+        self._found_in_last_frame = False
+        """False when the last update kept the location of the previous frame, see _locate_poi()"""
+
+    def update(self, base_frame: np.ndarray, drawing_frame: np.ndarray):
+        super().update(base_frame, drawing_frame)
+        if self._initialized:
+            found_poi = self._locate_poi()
+            self._found_in_last_frame = found_poi is not None and not found_poi.is_undefined()
+            if found_poi is not None:
+                self._found_poi = found_poi
+                if not found_poi.is_undefined():
+                    self._draw_poi(self._found_poi)
+
+    def _locate_poi(self) -> RegionOfInterest | None:
+        """
+        Finds the POI in the current base frame
+        :return: The location of the POI, an empty region if it was lost,
+                 or None to keep the location found in the previous frame
+        """
+        found_poi = self._track()
+        return None if found_poi.is_undefined() else found_poi
+
+    def _track(self) -> RegionOfInterest:
+        """
+        Updates the OpenCV tracker with the current base frame
+        :return: The location of the POI found by the OpenCV tracker, or an empty region if it wasn't found
+        """
+        # use either the full image, or limit to  detection region
+        try:
+            frame, offset = utils.compute_detection_offset(self._base_frame, self._template_poi.get_image(), self._detection_region)
+        except IndexError:
+            return RegionOfInterest.new_empty()
+
+        # don't do anything if detection bounds is defined, but not valid
+        if not self._detection_region.is_undefined() and (self._detection_region.get_xywh()[2:] <= self._template_poi.get_xywh()[2:]).any():
+            return RegionOfInterest.new_empty()
+
+        # compute the location of the POI
+        self._init_lock.acquire()
+        found, bbox = self._base_tracker.update(frame)
+        self._init_lock.release()
+        if not found:
+            return RegionOfInterest.new_empty()
+
+        # convert OpenCV bounding box into something usable
+        xywh = np.array([int(v) for v in bbox])
+        # apply the offset (see utils.compute_detection_offset docs for explanations)
+        xywh[:2] += offset
+        x, y, w, h = xywh
+        # Important note :
+        # Since we applied the offset, the given coordinates are now attached to the base frame's plane
+        # This is why it becomes the parent image in this RegionOfInterest object
+        return RegionOfInterest.new(self._base_frame, x, w, y, h)
+
+    # -- Overrides
+    def set_poi(self, poi: RegionOfInterest):
+        super().set_poi(poi)
+        self._reset_base_tracker()
+        self._initialized = True
+
+    def set_detection_region(self, region: RegionOfInterest):
+        # reset the base tracker
+        # only possible if a POI is set !
+        if not self._template_poi.is_undefined() and not (region.get_xywh()[2:] <= self._template_poi.get_xywh()[2:]).any():
+            poi_w, poi_h = self._template_poi.get_xywh()[2:]
+            if sum((poi_w, poi_h)) <= sum(region.get_xywh()[2:]):
+                self._detection_region = region
+                self._reset_base_tracker()
+
+    def is_found(self) -> bool:
+        return self._found_in_last_frame
+
+    def get_base_tracker(self) -> cv.Tracker:
+        """:return: The OpenCV tracker, to use it directly on frames without this app's architecture"""
+        return self._base_tracker
+
+    @abstractmethod
+    def _create_base_tracker(self) -> cv.Tracker:
+        """:return: A new OpenCV tracker, only called once by the constructor"""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def is_available() -> bool:
+        """:return: True if the OpenCV build (and the model files, if any) provides this backend"""
+        pass
+
+    def _reset_base_tracker(self):
+        self._init_base_tracker(self._template_poi)
+
+    def _init_base_tracker(self, poi: RegionOfInterest):
+        """
+        Re-initializes the OpenCV tracker in place, to track the given region of the base frame.
+        OpenCV's init() resets the whole model of the tracker, so it doesn't need to be rebuilt
+        :param poi: The region to track from now on
+        """
+        self._init_lock.acquire()
+        if self._detection_region.is_undefined():
+            self._base_tracker.init(
+                self._base_frame,
+                poi.get_xywh()
+            )
+
+        else:
+            poi_w, poi_h = poi.get_xywh()[2:]
+            poi_offset_x, poi_offset_y = poi.offset(self._detection_region.get_xywh()[:2], reverse=True)
+            self._base_tracker.init(
+                self._detection_region.get_image(),
+                (poi_offset_x, poi_offset_y, poi_w, poi_h)
+            )
+        self._init_lock.release()
+
+    def _draw_poi(self, rect: RegionOfInterest | np.ndarray):
+        super()._draw_poi(rect)
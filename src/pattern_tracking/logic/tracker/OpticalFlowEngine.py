@@ -0,0 +1,155 @@
+import uuid
+from threading import Lock
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
+
+
+class OpticalFlowEngine:
+    """
+    Tracks a set of points with the pyramidal Lucas-Kanade sparse optical flow.
+    All the points are moved by a single cv.calcOpticalFlowPyrLK() call per frame,
+    whatever their number.
+
+    Each point is tracked forward to the new frame, then backward to the previous one :
+    a point is only considered as found if it comes back close to where it started.
+    Lost points are re-seeded around their last position, moved by the median motion of
+    the other points, on the strongest corner of the neighbourhood, and tracked again from
+    the next frame.
+
+    An instance is shared by all the OpticalFlowTracker of a TrackerManager.
+    """
+
+    LK_PARAMETERS = dict(
+        winSize=(21, 21),
+        maxLevel=3,
+        criteria=(cv.TERM_CRITERIA_EPS | cv.TERM_CRITERIA_COUNT, 30, 0.01)
+    )
+    """Parameters of cv.calcOpticalFlowPyrLK()"""
+    MAX_FORWARD_BACKWARD_ERROR = 1.0
+    """Maximum distance in pixels between a point and its position tracked forward then backward"""
+    RESEED_RADIUS = 10
+    """Half size of the neighbourhood in which a lost point is re-seeded"""
+    RESEED_QUALITY = 0.01
+    """Minimal quality of a corner to re-seed a point on it, see cv.goodFeaturesToTrack()"""
+
+    def __init__(self):
+        self._keys: list[uuid.UUID] = []
+        """Identifier of each point, in the order of the rows of self._points"""
+        self._points = np.zeros((0, 2), dtype=np.float32)
+        """Position of each point in the last frame"""
+        self._found = np.zeros(0, dtype=bool)
+        """Whether each point has been found in the last frame"""
+        self._previous_gray: np.ndarray | None = None
+        """Grayscale version of the last frame"""
+        self._frame_data: SharedFrameData | None = None
+        """The last frame the points have been tracked in"""
+        self._lock = Lock()
+        """Points are added from the GUI thread, while they are tracked by the background thread"""
+
+    def set_point(self, key: uuid.UUID, position: np.ndarray | tuple[float, float]):
+        """
+        Adds a point to track, or moves the point with the same key
+        :param key: Identifier of the point
+        :param position: xy position of the point in the last frame
+        """
+        self._lock.acquire(blocking=True)
+        position = np.asarray(position, dtype=np.float32).reshape(1, 2)
+        if key in self._keys:
+            index = self._keys.index(key)
+            self._points[index] = position
+            self._found[index] = True
+        else:
+            self._keys.append(key)
+            self._points = np.concatenate((self._points, position))
+            self._found = np.append(self._found, True)
+        self._lock.release()
+
+    def remove_point(self, key: uuid.UUID):
+        """Stops tracking the point with the given key. Does nothing if it isn't tracked"""
+        self._lock.acquire(blocking=True)
+        if key in self._keys:
+            index = self._keys.index(key)
+            self._keys.pop(index)
+            self._points = np.delete(self._points, index, axis=0)
+            self._found = np.delete(self._found, index)
+        self._lock.release()
+
+    def get_position(self, key: uuid.UUID) -> np.ndarray | None:
+        """:return: The xy position of the point in the last frame, or None if it wasn't found"""
+        self._lock.acquire(blocking=True)
+        try:
+            if key not in self._keys:
+                return None
+            index = self._keys.index(key)
+            return self._points[index].copy() if self._found[index] else None
+        finally:
+            self._lock.release()
+
+    def update(self, frame_data: SharedFrameData):
+        """
+        Tracks all the points in a new frame. Does nothing if they already have been tracked in this frame,
+        so every tracker sharing this engine can call it.
+        :param frame_data: The shared data of the new frame
+        """
+        self._lock.acquire(blocking=True)
+        if frame_data is not self._frame_data:
+            self._frame_data = frame_data
+            gray = frame_data.get_gray()
+            if self._previous_gray is not None and self._previous_gray.shape == gray.shape and len(self._keys) > 0:
+                self._track(self._previous_gray, gray)
+            self._previous_gray = gray
+        self._lock.release()
+
+    def _track(self, previous_gray: np.ndarray, gray: np.ndarray):
+        """Moves the points from the previous frame to the new one, then re-seeds the lost ones"""
+        start = self._points.reshape(-1, 1, 2)
+        forward, status, _ = cv.calcOpticalFlowPyrLK(previous_gray, gray, start, None,
+                                                     **OpticalFlowEngine.LK_PARAMETERS)
+        backward, back_status, _ = cv.calcOpticalFlowPyrLK(gray, previous_gray, forward, None,
+                                                           **OpticalFlowEngine.LK_PARAMETERS)
+        forward, backward = forward.reshape(-1, 2), backward.reshape(-1, 2)
+        height, width = gray.shape
+        found = (status.ravel() == 1) & (back_status.ravel() == 1) \
+            & (np.linalg.norm(backward - self._points, axis=1) <= OpticalFlowEngine.MAX_FORWARD_BACKWARD_ERROR) \
+            & (forward[:, 0] >= 0) & (forward[:, 0] < width) & (forward[:, 1] >= 0) & (forward[:, 1] < height)
+
+        motion = np.median(forward[found] - self._points[found], axis=0) if found.any() else np.zeros(2)
+        for index in np.flatnonzero(~found):
+            forward[index] = self._reseed(gray, self._points[index] + motion)
+        self._points = forward.astype(np.float32)
+        self._found = found
+
+    @staticmethod
+    def _reseed(gray: np.ndarray, position: np.ndarray) -> np.ndarray:
+        """:return: The strongest corner around the given position, or the position itself if there is none"""
+        height, width = gray.shape
+        x, y = np.clip(position, 0, (width - 1, height - 1)).astype(int)
+        x_min, y_min = max(0, x - OpticalFlowEngine.RESEED_RADIUS), max(0, y - OpticalFlowEngine.RESEED_RADIUS)
+        window = gray[y_min: y + OpticalFlowEngine.RESEED_RADIUS + 1, x_min: x + OpticalFlowEngine.RESEED_RADIUS + 1]
+        corners = cv.goodFeaturesToTrack(window, 1, OpticalFlowEngine.RESEED_QUALITY, 1)
+        if corners is None:
+            return np.array((x, y), dtype=np.float32)
+        return corners.reshape(2) + (x_min, y_min)
+
+    @staticmethod
+    def find_seeds(gray: np.ndarray, x: int, width: int, y: int, height: int,
+                   max_points: int, min_distance: int) -> np.ndarray:
+        """
+        Finds the corners of a region that are good candidates to be tracked
+        :param gray: Grayscale image in which to find the points
+        :param x: X coordinate of the top-left corner of the region
+        :param width: Width of the region
+        :param y: Y coordinate of the top-left corner of the region
+        :param height: Height of the region
+        :param max_points: Maximum number of points returned
+        :param min_distance: Minimal distance in pixels between two returned points
+        :return: The xy position of each point, in the image
+        """
+        corners = cv.goodFeaturesToTrack(gray[y: y + height, x: x + width], max_points,
+                                         OpticalFlowEngine.RESEED_QUALITY, min_distance)
+        if corners is None:
+            return np.zeros((0, 2), dtype=np.float32)
+        return corners.reshape(-1, 2) + (x, y)
@@ -0,0 +1,75 @@
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+from src.pattern_tracking.logic.tracker.OpticalFlowEngine import OpticalFlowEngine
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class OpticalFlowTracker(AbstractTracker):
+    """
+    Tracks the center of its POI with the sparse optical flow.
+    The point is moved by an OpticalFlowEngine, that tracks the points of all the
+    trackers of this type at once when it is shared (the TrackerManager does it).
+
+    The found POI keeps the size of the POI set by the user, centered on the tracked point,
+    so this tracker can be used like the others to compute distances.
+    When a detection region is set, the point is considered lost when it leaves it.
+    """
+    POINT_RADIUS = 3
+    """Radius of the disk drawn on the tracked point"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._engine = OpticalFlowEngine()
+        """Tracks the point. Replaced by the shared one of the TrackerManager"""
+
+    # -- Methods
+    def update(self, base_frame: np.ndarray, drawing_frame: np.ndarray):
+        super().update(base_frame, drawing_frame)
+        if self._template_poi.is_undefined():
+            return
+        self._engine.update(self.get_shared_frame_data())
+        position = self._engine.get_position(self._id)
+        self._found_poi = RegionOfInterest.new_empty()
+        if position is None:
+            return
+        x, y = np.round(position).astype(int)
+        if not self._detection_region.is_undefined():
+            (x_min, y_min), (x_max, y_max) = self._detection_region.get_coords()
+            if not (x_min <= x < x_max and y_min <= y < y_max):
+                return
+        width, height = self._template_poi.get_width(), self._template_poi.get_height()
+        self._found_poi = RegionOfInterest.new(self._base_frame, x - width // 2, width, y - height // 2, height)
+        self._draw_point((x, y))
+
+    def _draw_point(self, point: tuple[int, int]):
+        """Draws a disk on the tracked point, lighter than a rectangle when hundreds of points are tracked"""
+        cv.circle(self._drawing_frame, point, OpticalFlowTracker.POINT_RADIUS, self._poi_color, -1)
+
+    def get_engine(self) -> OpticalFlowEngine:
+        return self._engine
+
+    def set_engine(self, engine: OpticalFlowEngine):
+        """
+        Makes this tracker use the given engine, usually shared with other trackers
+        :param engine: The engine in which the point of this tracker will be tracked
+        """
+        self._engine.remove_point(self._id)
+        self._engine = engine
+        if not self._template_poi.is_undefined():
+            self._engine.set_point(self._id, self._poi_center(self._template_poi))
+
+    def release_engine(self):
+        """Stops tracking the point of this tracker, called when the tracker is deleted"""
+        self._engine.remove_point(self._id)
+
+    @staticmethod
+    def _poi_center(poi: RegionOfInterest) -> np.ndarray:
+        x, width, y, height = poi.get_xwyh()
+        return np.array((x + width / 2, y + height / 2))
+
+    # -- Overrides
+    def set_poi(self, poi: RegionOfInterest):
+        super().set_poi(poi)
+        self._engine.set_point(self._id, self._poi_center(poi))
@@ -0,0 +1,113 @@
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class PhaseCorrelationTracker(AbstractTracker):
+    """
+    Follows the translation of the POI with a phase correlation, like cv.phaseCorrelate().
+
+    The patch of the frame at the last known location of the POI is compared with the template :
+    the peak of the inverse DFT of their normalized cross-power spectrum gives their shift, refined
+    to a sub-pixel precision with a weighted centroid around the peak. Its height is the confidence.
+    The Hanning window and the spectrum of the template are computed once, when the POI is set,
+    so each frame only costs the DFT of one patch and one inverse DFT.
+
+    Suited for the rigid drift of the whole image, for example when the stage moves.
+    """
+    MIN_CONFIDENCE = 0.1
+    """Height of the correlation peak under which the POI is considered lost"""
+    CENTROID_RADIUS = 2
+    """Half size of the neighbourhood of the peak used to refine its location"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._window = np.zeros((0, 0), dtype=np.float32)
+        """Hanning window applied to the template and to the patches"""
+        self._template_spectrum = np.zeros((0, 0, 2), dtype=np.float32)
+        """DFT of the windowed template"""
+        self._position = np.zeros(2)
+        """Sub-pixel xy location of the top-left corner of the POI in the last frame"""
+        self._confidence = 0.0
+        """Height of the correlation peak of the last frame"""
+
+    # -- Methods
+    def update(self, base_frame: np.ndarray, drawing_frame: np.ndarray):
+        super().update(base_frame, drawing_frame)
+        if self._template_poi.is_undefined():
+            return
+        self._found_poi = self._find_poi()
+        if not self._found_poi.is_undefined():
+            self._draw_poi(self._found_poi.get_coords())
+
+    def _find_poi(self) -> RegionOfInterest:
+        """:return: The location of the POI in the base frame, or an empty region if it was lost"""
+        gray = self.get_shared_frame_data().get_gray()
+        height, width = self._window.shape
+        x, y = np.round(self._position).astype(int)
+        if x < 0 or y < 0 or x + width > gray.shape[1] or y + height > gray.shape[0]:
+            self._confidence = 0.0
+            return RegionOfInterest.new_empty()
+
+        shift, self._confidence = self._phase_correlate(gray[y: y + height, x: x + width])
+        if self._confidence < PhaseCorrelationTracker.MIN_CONFIDENCE:
+            return RegionOfInterest.new_empty()
+        self._position = np.array((x, y)) + shift
+
+        x, y = np.round(self._position).astype(int)
+        if not self._detection_region.is_undefined():
+            (x_min, y_min), (x_max, y_max) = self._detection_region.get_coords()
+            if x < x_min or y < y_min or x + width > x_max or y + height > y_max:
+                return RegionOfInterest.new_empty()
+        return RegionOfInterest.new(self._base_frame, x, width, y, height)
+
+    def _phase_correlate(self, patch: np.ndarray) -> tuple[np.ndarray, float]:
+        """
+        :param patch: Grayscale image of the size of the template
+        :return: The xy shift of the content of the patch relative to the template, and the confidence
+        """
+        spectrum = cv.dft(patch.astype(np.float32) * self._window, flags=cv.DFT_COMPLEX_OUTPUT)
+        cross_power = cv.mulSpectrums(spectrum, self._template_spectrum, 0, conjB=True)
+        magnitude = np.linalg.norm(cross_power, axis=2, keepdims=True)
+        cross_power /= np.maximum(magnitude, np.finfo(np.float32).eps)
+        correlation = cv.idft(cross_power, flags=cv.DFT_REAL_OUTPUT | cv.DFT_SCALE)
+
+        _, confidence, _, (peak_x, peak_y) = cv.minMaxLoc(correlation)
+        # weighted centroid around the peak, the correlation being periodic
+        radius = PhaseCorrelationTracker.CENTROID_RADIUS
+        offsets = np.arange(-radius, radius + 1)
+        rows = (peak_y + offsets) % correlation.shape[0]
+        cols = (peak_x + offsets) % correlation.shape[1]
+        neighbourhood = np.maximum(correlation[np.ix_(rows, cols)], 0)
+        total = neighbourhood.sum()
+        shift = np.array((peak_x, peak_y), dtype=float)
+        if total > 0:
+            shift += (neighbourhood.sum(axis=0) @ offsets / total, neighbourhood.sum(axis=1) @ offsets / total)
+
+        # shifts beyond half the size of the patch are negative shifts
+        size = np.array(correlation.shape[1::-1])
+        shift = np.where(shift > size / 2, shift - size, shift)
+        return shift, float(confidence)
+
+    def get_confidence(self) -> float:
+        """:return: The height of the correlation peak in the last frame, between 0 and 1"""
+        return self._confidence
+
+    def get_subpixel_center(self) -> np.ndarray | None:
+        """:return: The sub-pixel xy location of the center of the POI, or None if it wasn't found"""
+        if self._found_poi.is_undefined():
+            return None
+        return self._position + np.array(self._window.shape[1::-1]) / 2
+
+    # -- Overrides
+    def set_poi(self, poi: RegionOfInterest):
+        super().set_poi(poi)
+        template = poi.get_image()
+        if template.ndim == 3:
+            template = cv.cvtColor(template, cv.COLOR_BGR2GRAY)
+        self._window = cv.createHanningWindow(template.shape[1::-1], cv.CV_32F)
+        self._template_spectrum = cv.dft(template.astype(np.float32) * self._window, flags=cv.DFT_COMPLEX_OUTPUT)
+        self._position = np.array((poi.get_x(), poi.get_y()), dtype=float)
+        self._found_poi = poi
@@ -2,6 +2,7 @@ import numpy as np
 
 from src.pattern_tracking.shared import utils, constants
 from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+from src.pattern_tracking.logic.tracker.MotionPredictor import MotionPredictor
 from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
 
 
@@ -9,10 +10,26 @@ class TemplateTracker(AbstractTracker):
     """
     In charge of detecting & tracking a template image in a given
     detection region, or in a whole frame if the detection region is undefined
+
+    With the adaptive search enabled (default), the next position of the POI is predicted
+    from its recent motion, and the template is first searched in a small window around
+    this prediction. The search is only extended to the detection region, or to the whole frame,
+    when the match in the window is below the detection threshold.
+
+    With the pyramid matching enabled, this extended search is done coarse-to-fine
+    on the pyramid of the frame shared by all trackers, see utils.find_template_in_pyramid()
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, adaptive_search: bool = True, pyramid_matching: bool = False):
         super().__init__(name)
+        self._adaptive_search = adaptive_search
+        """Whether to search around the predicted position first"""
+        self._motion_predictor = MotionPredictor()
+        """Predicts the position of the POI in the next frame"""
+        self._pyramid_matching = pyramid_matching
+        """Whether to search the whole detection region coarse-to-fine"""
+        self._template_pyramid: list[np.ndarray] = []
+        """The template at each level of the pyramid, computed when the POI is set"""
 
     # -- Methods
     def update(self, base_frame: np.ndarray, drawing_frame: np.ndarray):
@@ -24,14 +41,10 @@ class TemplateTracker(AbstractTracker):
         # Find location of POI if it is defined
         if not self._template_poi.is_undefined():
             try:
-                self._found_poi = utils.find_template_in_image(
-                    self._base_frame,
-                    self._template_poi.get_image(),
-                    constants.DETECTION_THRESHOLD,
-                    detection_bounds=self._detection_region
-                )
+                self._found_poi = self._find_poi()
             except AssertionError:
                 self._found_poi = RegionOfInterest.new_empty()
+            self._motion_predictor.update(self.get_found_poi_center())
 
             # Determine what we have to draw
             if self._detection_region.is_undefined():
@@ -40,3 +53,57 @@ class TemplateTracker(AbstractTracker):
             else:
                 if self._detection_region.intersects(self._template_poi):
                     self._draw_poi(self._found_poi.get_coords())
+
+    def _find_poi(self) -> RegionOfInterest:
+        """
+        Searches the template around its predicted position if possible,
+        then in the detection region (or the whole frame) if it wasn't found
+        :return: The location of the template in the base frame, or an empty region if not found
+        """
+        template = self._template_poi.get_image()
+        predicted_center = self._motion_predictor.predict() if self._adaptive_search else None
+        if predicted_center is not None:
+            search_window = utils.compute_search_window(
+                self._base_frame, predicted_center, template.shape,
+                constants.SEARCH_WINDOW_MARGIN, self._detection_region
+            )
+            if not search_window.is_undefined():
+                found = utils.find_template_in_image(
+                    self._base_frame, template, self._detection_threshold,
+                    detection_bounds=search_window
+                )
+                if not found.is_undefined():
+                    return found
+
+        if self._pyramid_matching:
+            return utils.find_template_in_pyramid(
+                self.get_shared_frame_data(),
+                self._template_pyramid,
+                self._detection_threshold,
+                detection_bounds=self._detection_region
+            )
+        return utils.find_template_in_image(
+            self._base_frame,
+            template,
+            self._detection_threshold,
+            detection_bounds=self._detection_region
+        )
+
+    def set_adaptive_search(self, enabled: bool):
+        """Enables or disables the search around the predicted position of the POI"""
+        self._adaptive_search = enabled
+        self._motion_predictor.reset()
+
+    def set_pyramid_matching(self, enabled: bool):
+        """Enables or disables the coarse-to-fine search in the detection region"""
+        self._pyramid_matching = enabled
+
+    # -- Overrides
+    def set_poi(self, poi: RegionOfInterest):
+        super().set_poi(poi)
+        self._template_pyramid = utils.build_template_pyramid(poi.get_image().copy())
+        self._motion_predictor.reset()
+
+    def set_detection_region(self, region: RegionOfInterest):
+        super().set_detection_region(region)
+        self._motion_predictor.reset()
@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class TrackerCost(Enum):
+    """
+    Expected computation time of a tracker for each frame, at the resolution of the display.
+    Used to pick a tracker fast enough for the frame rate of the feed
+    """
+    LOW = 1
+    """About a millisecond or less : suited for high frame rates, or many trackers"""
+    MEDIUM = 2
+    """A few milliseconds"""
+    HIGH = 3
+    """Tens of milliseconds : only a few trackers can run in real time"""
+
+    def label(self) -> str:
+        return self.name.lower()
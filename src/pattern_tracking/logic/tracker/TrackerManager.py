@@ -1,12 +1,20 @@
 import uuid
 from threading import Lock
 
+import cv2 as cv
 import numpy as np
-from PySide6.QtGui import QAction
 
 from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
+from src.pattern_tracking.logic.tracker.BatchedFFTMatcher import BatchedFFTMatcher
+from src.pattern_tracking.logic.tracker.FFTTemplateTracker import FFTTemplateTracker
+from src.pattern_tracking.logic.tracker.FixedPointTracker import FixedPointTracker
+from src.pattern_tracking.logic.tracker.OpticalFlowEngine import OpticalFlowEngine
+from src.pattern_tracking.logic.tracker.OpticalFlowTracker import OpticalFlowTracker
+from src.pattern_tracking.logic.tracker.TrackerCost import TrackerCost
 from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
 from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
+from src.pattern_tracking.shared import constants
 
 
 class TrackerManager:
@@ -26,8 +34,10 @@ class TrackerManager:
         Any modification operation MUST get the lock before modifying the collection of this manager
         Otherwise, the program might run into a RuntimeError because the collection would change while it's being read
         """
-
-        self._qt_actions: dict[str, QAction] = {}
+        self._fft_matcher = BatchedFFTMatcher()
+        """Computes the correlation of the templates of all FFTTemplateTracker at once"""
+        self._optical_flow_engine = OpticalFlowEngine()
+        """Tracks the points of all OpticalFlowTracker at once"""
 
     def get_tracker(self, tracker_id: uuid.UUID) -> AbstractTracker | None:
         """
@@ -54,17 +64,57 @@ class TrackerManager:
 
         self._collection_mutex.acquire(blocking=True)
         tracker = tracker_type.value.constructor(name)
+        self._attach_shared_engines(tracker)
 
         self._collection[tracker.get_id()] = tracker
         self._collection_mutex.release()
 
         return self._collection[tracker.get_id()]
 
+    def create_point_group(self, name: str, region: RegionOfInterest,
+                           max_points: int = constants.POINT_GROUP_MAX_POINTS) -> list[AbstractTracker]:
+        """
+        Creates an OpticalFlowTracker on each of the best points to track in a region.
+        The trackers are named after the given name, followed by their index in the group
+        :param name: The base name of the trackers of the group
+        :param region: The region in which to place the points, its parent image being the current frame
+        :param max_points: Maximum number of points in the group
+        :return: The created trackers
+        :raise KeyError: If the name of one of the trackers is already taken, no tracker is created then
+        """
+        if region.is_undefined():
+            raise ValueError("The region in which to place the points is undefined")
+        if len(name.strip()) == 0:
+            raise ValueError("The tracker's name cannot be empty !")
+        frame = region.get_parent_image()
+        gray = frame if frame.ndim == 2 else cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        seeds = OpticalFlowEngine.find_seeds(gray, *region.get_xwyh(), max_points, constants.POINT_GROUP_MIN_DISTANCE)
+        names = [f"{name.strip()} {index}" for index in range(len(seeds))]
+        taken = {t.get_name() for t in self._collection.values()}
+        if any(tracker_name in taken for tracker_name in names):
+            raise KeyError("All trackers must have different names." +
+                           "Please input a different name for the new point group")
+
+        # the trackers are only added to the collection once they are all ready, so none is updated before
+        trackers = []
+        for tracker_name, (x, y) in zip(names, np.round(seeds).astype(int)):
+            tracker = TrackerType.OPTICAL_FLOW_TRACKER.value.constructor(tracker_name)
+            self._attach_shared_engines(tracker)
+            tracker.set_poi(RegionOfInterest.new(frame, x - constants.POI_WIDTH // 2, constants.POI_WIDTH,
+                                                 y - constants.POI_HEIGHT // 2, constants.POI_HEIGHT))
+            trackers.append(tracker)
+        self._collection_mutex.acquire(blocking=True)
+        for tracker in trackers:
+            self._collection[tracker.get_id()] = tracker
+        self._collection_mutex.release()
+        return trackers
+
     def add_tracker(self, tracker: AbstractTracker):
         """
         Add a tracker to this manager
         :param tracker: The tracker to add
         """
+        self._attach_shared_engines(tracker)
         self._collection[tracker.get_id()] = tracker
 
     def remove_tracker(self, tracker_id: uuid.UUID) -> bool:
@@ -77,10 +127,25 @@ class TrackerManager:
         has_tracker = tracker_id in self._collection.keys()
         if has_tracker:
             self._collection_mutex.acquire(blocking=True)
-            self._collection.pop(tracker_id)
+            self._detach_shared_engines(self._collection.pop(tracker_id))
             self._collection_mutex.release()
         return has_tracker
 
+    def _attach_shared_engines(self, tracker: AbstractTracker):
+        """Gives the tracker the engines that compute its detection together with other trackers"""
+        if isinstance(tracker, FFTTemplateTracker):
+            tracker.set_matcher(self._fft_matcher)
+        elif isinstance(tracker, OpticalFlowTracker):
+            tracker.set_engine(self._optical_flow_engine)
+
+    @staticmethod
+    def _detach_shared_engines(tracker: AbstractTracker):
+        """Removes the data of a deleted tracker from the shared engines"""
+        if isinstance(tracker, FFTTemplateTracker):
+            tracker.release_matcher()
+        elif isinstance(tracker, OpticalFlowTracker):
+            tracker.release_engine()
+
     def update_trackers(self, live_frame: np.ndarray, drawing_sheet: np.ndarray) -> np.ndarray:
         """
         Updates all trackers with the new live framed passed in parameter,
@@ -92,13 +157,37 @@ class TrackerManager:
         """
         # Wait for any modification operation to end
         self._collection_mutex.acquire(blocking=True)
+        # derived data (pyramid, grayscale...) is only computed once for all trackers
+        shared_frame_data = SharedFrameData(live_frame)
         for tr in self._collection.values():
+            tr.set_shared_frame_data(shared_frame_data)
             tr.update(live_frame, drawing_sheet)
             drawing_sheet = tr.get_edited_frame()
 
         self._collection_mutex.release()
         return drawing_sheet
 
+    def get_regions_hint(self) -> list[tuple[int, int, int, int]] | None:
+        """
+        Lists the regions of the frame read by the trackers, so that the frame providers can skip the rest
+        :return: The (x, y, width, height) regions, or None if a tracker may read anywhere in the frame :
+                 when there is no tracker, or when one has no POI or no detection region
+        """
+        self._collection_mutex.acquire(blocking=True)
+        regions = []
+        for tracker in self._collection.values():
+            if tracker.get_poi().is_undefined():
+                regions = None
+                break
+            # a fixed point only reads its POI, it has no detection region
+            region = tracker.get_poi() if isinstance(tracker, FixedPointTracker) else tracker.get_detection_region()
+            if region.is_undefined():
+                regions = None
+                break
+            regions.append(tuple(int(value) for value in region.get_xywh()))
+        self._collection_mutex.release()
+        return regions if regions is not None and len(regions) > 0 else None
+
     def set_active_tracker(self, tracker_id: uuid.UUID):
         tracker = self._collection.get(tracker_id)
         if tracker is None:
@@ -123,8 +212,16 @@ class TrackerManager:
         return {identifier: tracker for (identifier, tracker) in self._collection.items()}
 
     @staticmethod
-    def available_tracker_types() -> list[TrackerType]:
-        return [v[1] for v in enumerate(TrackerType)]
+    def available_tracker_types(max_cost: TrackerCost | None = None) -> list[TrackerType]:
+        """
+        Lists the types of tracker that can be created with the installed OpenCV build
+        :param max_cost: If set, only the types at most this expensive are listed, see TrackerCost
+        :return: The available types, cheapest first
+        """
+        types = [t for t in TrackerType if t.value.is_available()]
+        if max_cost is not None:
+            types = [t for t in types if t.value.cost.value <= max_cost.value]
+        return sorted(types, key=lambda t: t.value.cost.value)
 
 
 if __name__ == '__main__':
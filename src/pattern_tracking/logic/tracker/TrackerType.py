@@ -1,11 +1,45 @@
 from collections import namedtuple
 from enum import Enum
+from functools import partial
 
+from src.pattern_tracking.logic.tracker.CSRTTracker import CSRTTracker
+from src.pattern_tracking.logic.tracker.DaSiamRPNTracker import DaSiamRPNTracker
+from src.pattern_tracking.logic.tracker.FFTTemplateTracker import FFTTemplateTracker
 from src.pattern_tracking.logic.tracker.FixedPointTracker import FixedPointTracker
+from src.pattern_tracking.logic.tracker.HybridTracker import HybridTracker
 from src.pattern_tracking.logic.tracker.KCFTracker import KCFTracker
+from src.pattern_tracking.logic.tracker.MILTracker import MILTracker
+from src.pattern_tracking.logic.tracker.MOSSETracker import MOSSETracker
+from src.pattern_tracking.logic.tracker.NanoTracker import NanoTracker
+from src.pattern_tracking.logic.tracker.OpticalFlowTracker import OpticalFlowTracker
+from src.pattern_tracking.logic.tracker.PhaseCorrelationTracker import PhaseCorrelationTracker
 from src.pattern_tracking.logic.tracker.TemplateTracker import TemplateTracker
+from src.pattern_tracking.logic.tracker.TrackerCost import TrackerCost
+from src.pattern_tracking.shared import constants
 
-TrackerTypeData = namedtuple("TrackerTypeData", "name constructor")
+
+def _always_available() -> bool:
+    return True
+
+
+TrackerTypeData = namedtuple(
+    "TrackerTypeData",
+    "name constructor cost thread_safe grayscale downscaled is_available warmup_frames",
+    defaults=(TrackerCost.MEDIUM, True, False, False, _always_available, constants.SEGMENT_WARMUP_FRAMES)
+)
+"""
+Description of a type of tracker :
+    - name: Name displayed to the user
+    - constructor: Creates a tracker of this type, given its name
+    - cost: Expected computation time per frame, see TrackerCost
+    - thread_safe: Whether trackers of this type can be updated in parallel threads,
+                   False if they share state with other trackers or if the backend isn't re-entrant
+    - grayscale: Whether the tracker works on grayscale images, colour frames being converted
+    - downscaled: Whether the tracker works as well on downscaled frames, than on frames of native resolution
+    - is_available: Returns False if the tracker cannot be created with the installed OpenCV build or files
+    - warmup_frames: Number of frames after which the result of the tracker doesn't depend on where it started,
+                     0 if each frame is tracked independently of the previous ones
+"""
 
 
 class TrackerType(Enum):
@@ -14,6 +48,38 @@ class TrackerType(Enum):
     Their data is accessible by name, and are defined by the named tuple TrackerTypeData,
     located in the same file as this class.
     """
-    TEMPLATE_TRACKER = TrackerTypeData("Template tracker", TemplateTracker)
-    KCF_TRACKER = TrackerTypeData("KCF Tracker", KCFTracker)
-    FIXED_POINT_TRACKER = TrackerTypeData("Fixed Point tracker", FixedPointTracker)
\ No newline at end of file
+    TEMPLATE_TRACKER = TrackerTypeData("Template tracker", TemplateTracker,
+                                       cost=TrackerCost.MEDIUM, downscaled=True, warmup_frames=2)
+    PYRAMID_TEMPLATE_TRACKER = TrackerTypeData("Template tracker (pyramid)",
+                                               partial(TemplateTracker, pyramid_matching=True),
+                                               cost=TrackerCost.LOW, thread_safe=False, downscaled=True,
+                                               warmup_frames=2)
+    FFT_TEMPLATE_TRACKER = TrackerTypeData("Template tracker (batched FFT)", FFTTemplateTracker,
+                                           cost=TrackerCost.MEDIUM, thread_safe=False, warmup_frames=0)
+    KCF_TRACKER = TrackerTypeData("KCF Tracker", KCFTracker,
+                                  cost=TrackerCost.LOW, downscaled=True, is_available=KCFTracker.is_available)
+    HYBRID_TRACKER = TrackerTypeData("Hybrid tracker (KCF + template)", HybridTracker,
+                                     cost=TrackerCost.LOW, downscaled=True, is_available=HybridTracker.is_available)
+    MOSSE_TRACKER = TrackerTypeData("MOSSE Tracker", MOSSETracker,
+                                    cost=TrackerCost.LOW, grayscale=True, downscaled=True,
+                                    is_available=MOSSETracker.is_available)
+    CSRT_TRACKER = TrackerTypeData("CSRT Tracker", CSRTTracker,
+                                   cost=TrackerCost.HIGH, is_available=CSRTTracker.is_available)
+    MIL_TRACKER = TrackerTypeData("MIL Tracker", MILTracker,
+                                  cost=TrackerCost.HIGH, grayscale=True, is_available=MILTracker.is_available)
+    NANO_TRACKER = TrackerTypeData("NanoTrack (neural network)", NanoTracker,
+                                   cost=TrackerCost.MEDIUM, thread_safe=False, downscaled=True,
+                                   is_available=NanoTracker.is_available)
+    DASIAMRPN_TRACKER = TrackerTypeData("DaSiamRPN (neural network)", DaSiamRPNTracker,
+                                        cost=TrackerCost.HIGH, thread_safe=False, downscaled=True,
+                                        is_available=DaSiamRPNTracker.is_available)
+    PHASE_CORRELATION_TRACKER = TrackerTypeData("Phase correlation tracker", PhaseCorrelationTracker,
+                                                cost=TrackerCost.LOW, grayscale=True)
+    OPTICAL_FLOW_TRACKER = TrackerTypeData("Optical flow point tracker", OpticalFlowTracker,
+                                           cost=TrackerCost.LOW, thread_safe=False, grayscale=True)
+    FIXED_POINT_TRACKER = TrackerTypeData("Fixed Point tracker", FixedPointTracker,
+                                          cost=TrackerCost.LOW, warmup_frames=0)
+
+    def __reduce_ex__(self, protocol):
+        # pickled by name, the constructor of some types (a partial) cannot be compared to find the member by value
+        return TrackerType.__getitem__, (self.name,)
@@ -0,0 +1,46 @@
+import uuid
+from unittest import TestCase
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.tracker.BatchedFFTMatcher import BatchedFFTMatcher
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
+
+
+class TestBatchedFFTMatcher(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(0)
+        self._frame = cv.GaussianBlur(rng.integers(0, 256, (120, 160, 3), dtype=np.uint8), (5, 5), 0)
+        self._matcher = BatchedFFTMatcher()
+        self._templates = {
+            uuid.uuid4(): self._frame[10:30, 20:40].copy(),
+            uuid.uuid4(): self._frame[60:85, 100:131].copy(),
+        }
+        for key, template in self._templates.items():
+            self._matcher.register(key, template, self._frame.shape)
+
+    def test_same_scores_as_match_template(self):
+        frame_data = SharedFrameData(self._frame)
+        for key, template in self._templates.items():
+            expected = cv.matchTemplate(self._frame, template, cv.TM_CCORR_NORMED)
+            confidence_map = self._matcher.get_confidence_map(frame_data, key)
+            self.assertEqual(expected.shape, confidence_map.shape)
+            np.testing.assert_allclose(confidence_map, expected, atol=1e-4)
+
+    def test_maps_follow_the_frame(self):
+        key = next(iter(self._templates))
+        moved = np.roll(self._frame, (7, -5), axis=(0, 1))
+        self._matcher.get_confidence_map(SharedFrameData(self._frame), key)
+        confidence_map = self._matcher.get_confidence_map(SharedFrameData(moved), key)
+        y, x = np.unravel_index(np.argmax(confidence_map), confidence_map.shape)
+        self.assertEqual((17, 15), (y, x))
+
+    def test_unregister(self):
+        key = next(iter(self._templates))
+        self._matcher.unregister(key)
+        self.assertFalse(self._matcher.is_registered(key))
+        with self.assertRaises(KeyError):
+            self._matcher.get_confidence_map(SharedFrameData(self._frame), key)
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.tracker.HybridTracker import HybridTracker
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class MILHybridTracker(HybridTracker):
+    """The KCF tracker is only available in the contrib builds of OpenCV, MIL is used instead"""
+
+    def __init__(self, name: str, redetection_interval: int = HybridTracker.REDETECTION_INTERVAL):
+        super().__init__(name, redetection_interval)
+        self.inits = 0
+
+    def _create_base_tracker(self) -> cv.Tracker:
+        return cv.TrackerMIL_create()
+
+    def _init_base_tracker(self, poi: RegionOfInterest):
+        self.inits += 1
+        super()._init_base_tracker(poi)
+
+
+class TestHybridTracker(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(0)
+        # sharp noise : the TM_CCORR_NORMED score of unrelated patches stays far from the threshold
+        self._frame = rng.integers(0, 256, (200, 260, 3), dtype=np.uint8)
+        self._tracker = MILHybridTracker("hybrid", redetection_interval=5)
+        self._tracker.update(self._frame, self._frame.copy())
+        self._tracker.set_poi(RegionOfInterest.new(self._frame, 100, 40, 80, 40))
+
+    def _update(self, dx: int, dy: int) -> np.ndarray:
+        frame = np.roll(self._frame, (dy, dx), axis=(0, 1))
+        self._tracker.update(frame, frame.copy())
+        return self._tracker.get_found_poi().get_coords(0)
+
+    def test_follows_smooth_motion(self):
+        for step in range(1, 11):
+            location = self._update(step, step)
+        np.testing.assert_array_equal(location, (110, 90))
+
+    def test_recovers_from_a_jump(self):
+        self._update(1, 0)
+        inits = self._tracker.inits
+        # too far for the base tracker, the template detection finds the POI again
+        location = self._update(60, 50)
+        np.testing.assert_array_equal(location, (160, 130))
+        self.assertEqual(inits + 1, self._tracker.inits)
+        np.testing.assert_array_equal(self._update(61, 50), (161, 130))
@@ -0,0 +1,46 @@
+import uuid
+from unittest import TestCase
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.tracker.OpticalFlowEngine import OpticalFlowEngine
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
+
+
+class TestOpticalFlowEngine(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(0)
+        self._frame = cv.GaussianBlur(rng.integers(0, 256, (240, 320), dtype=np.uint8), (7, 7), 0)
+        self._engine = OpticalFlowEngine()
+        self._points = {uuid.uuid4(): p for p in OpticalFlowEngine.find_seeds(self._frame, 40, 240, 40, 160, 20, 10)}
+        for key, point in self._points.items():
+            self._engine.set_point(key, point)
+        self._engine.update(SharedFrameData(self._frame))
+
+    def test_points_follow_the_motion(self):
+        shifted = np.roll(self._frame, (2, 3), axis=(0, 1))
+        self._engine.update(SharedFrameData(shifted))
+        for key, point in self._points.items():
+            np.testing.assert_allclose(self._engine.get_position(key), point + (3, 2), atol=0.1)
+
+    def test_update_once_per_frame(self):
+        frame_data = SharedFrameData(np.roll(self._frame, (2, 3), axis=(0, 1)))
+        self._engine.update(frame_data)
+        self._engine.update(frame_data)
+        key, point = next(iter(self._points.items()))
+        np.testing.assert_allclose(self._engine.get_position(key), point + (3, 2), atol=0.1)
+
+    def test_inconsistent_points_are_lost(self):
+        # the content of the frame changes entirely, no point can be tracked back
+        other = cv.GaussianBlur(np.random.default_rng(1).integers(0, 256, (240, 320), dtype=np.uint8), (7, 7), 0)
+        self._engine.update(SharedFrameData(other))
+        lost = [self._engine.get_position(key) is None for key in self._points]
+        self.assertGreater(sum(lost), len(lost) // 2)
+
+    def test_remove_point(self):
+        key = next(iter(self._points))
+        self._engine.remove_point(key)
+        self.assertIsNone(self._engine.get_position(key))
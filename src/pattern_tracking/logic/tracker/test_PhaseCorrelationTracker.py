@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.tracker.PhaseCorrelationTracker import PhaseCorrelationTracker
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class TestPhaseCorrelationTracker(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(0)
+        self._frame = cv.GaussianBlur(rng.integers(0, 256, (240, 320, 3), dtype=np.uint8), (7, 7), 0)
+        self._tracker = PhaseCorrelationTracker("phase")
+        self._tracker.set_poi(RegionOfInterest.new(self._frame, 100, 50, 80, 50))
+
+    def _translated(self, dx: float, dy: float) -> np.ndarray:
+        return cv.warpAffine(self._frame, np.float32([[1, 0, dx], [0, 1, dy]]), self._frame.shape[1::-1])
+
+    def test_follows_subpixel_translation(self):
+        for step in range(1, 6):
+            frame = self._translated(1.5 * step, -0.75 * step)
+            self._tracker.update(frame, frame.copy())
+        np.testing.assert_allclose(self._tracker.get_subpixel_center(), (125 + 7.5, 105 - 3.75), atol=0.3)
+        self.assertGreater(self._tracker.get_confidence(), 0.3)
+
+    def test_lost_on_unrelated_content(self):
+        other = cv.GaussianBlur(np.random.default_rng(1).integers(0, 256, (240, 320, 3), dtype=np.uint8), (7, 7), 0)
+        self._tracker.update(other, other.copy())
+        self.assertIsNone(self._tracker.get_found_poi_center())
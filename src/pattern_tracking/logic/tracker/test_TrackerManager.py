@@ -0,0 +1,46 @@
+import pickle
+from unittest import TestCase
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.tracker.TrackerCost import TrackerCost
+from src.pattern_tracking.logic.tracker.TrackerManager import TrackerManager
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
+from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+
+
+class TestTrackerManager(TestCase):
+
+    def test_available_tracker_types_can_be_created(self):
+        manager = TrackerManager()
+        for i, tracker_type in enumerate(TrackerManager.available_tracker_types()):
+            tracker = manager.create_tracker(f"tracker {i}", tracker_type)
+            self.assertIs(tracker, manager.get_tracker(tracker.get_id()))
+
+    def test_unavailable_tracker_types_are_hidden(self):
+        available = TrackerManager.available_tracker_types()
+        for tracker_type in TrackerType:
+            self.assertEqual(tracker_type.value.is_available(), tracker_type in available)
+
+    def test_tracker_types_can_be_pickled(self):
+        # the configurations are sent to worker processes
+        for tracker_type in TrackerType:
+            self.assertIs(tracker_type, pickle.loads(pickle.dumps(tracker_type)))
+
+    def test_filter_by_cost(self):
+        cheap = TrackerManager.available_tracker_types(max_cost=TrackerCost.LOW)
+        self.assertIn(TrackerType.FIXED_POINT_TRACKER, cheap)
+        self.assertTrue(all(t.value.cost == TrackerCost.LOW for t in cheap))
+        costs = [t.value.cost.value for t in TrackerManager.available_tracker_types()]
+        self.assertEqual(sorted(costs), costs)
+
+    def test_point_group_name_collision_creates_nothing(self):
+        manager = TrackerManager()
+        frame = cv.GaussianBlur(np.random.default_rng(0).integers(0, 256, (240, 320), dtype=np.uint8), (7, 7), 0)
+        region = RegionOfInterest.new(frame, 40, 200, 40, 120)
+        existing = manager.create_tracker("group 3", TrackerType.FIXED_POINT_TRACKER)
+        with self.assertRaises(KeyError):
+            manager.create_point_group("group", region)
+        self.assertEqual([existing.get_id()], list(manager.alive_trackers()))
+        self.assertGreater(len(manager.create_point_group("other", region)), 3)
@@ -1,9 +1,15 @@
+import time
 from abc import ABC, abstractmethod
-from queue import Queue
-from threading import Event
+from threading import Event, local
 
+import cv2 as cv
 import numpy as np
 
+from src.pattern_tracking.logic.video.FrameBufferPool import FrameBufferPool
+from src.pattern_tracking.logic.video.FrameQueue import FrameQueue
+from src.pattern_tracking.objects.CompactFrame import CompactFrame
+from src.pattern_tracking.shared import constants
+
 
 class AbstractFrameProvider(ABC):
     """
@@ -16,9 +22,19 @@ class AbstractFrameProvider(ABC):
 
     2. Override the `self.grab_frame()` method to return a new frame. See the documentation of this method
     for more information about this choice.
+
+    The queue is bounded both by a number of frames and by their total size. To queue smaller frames,
+    they can be downscaled and converted to grayscale when acquired, see set_ingest() : the implementations
+    pass each acquired frame to self._ingest() before putting it in the queue.
+    Frames can also be skipped, see set_decimation() : the implementations ask self._skips() whether
+    to provide each frame, before converting it. The frame numbers of the provided frames stay the numbers
+    of the frames in the feed, so that their times remain frame_number / fps.
+    When told which regions the trackers search in (see set_regions_hint()), _ingest() returns CompactFrame
+    objects instead of arrays : the consumers must check the type of the frames they grab.
     """
 
-    def __init__(self, global_halt: Event, is_video: bool, max_frames_in_queue: int = 30):
+    def __init__(self, global_halt: Event, is_video: bool, max_frames_in_queue: int = 30,
+                 max_queue_bytes: int = constants.FRAME_QUEUE_MAX_BYTES):
         self._global_halt = global_halt
         """Global event used to check whether or not to continue working. Not modified by this class"""
         self._stop_working: Event = Event()
@@ -29,8 +45,24 @@ class AbstractFrameProvider(ABC):
         """
         self._is_video = is_video
         """True if the feed is a static video, false if it is live"""
-        self._frames_queue: Queue[tuple[int, np.ndarray] | None] = Queue(max_frames_in_queue)
+        self._frames_queue = FrameQueue(max_frames_in_queue, max_queue_bytes)
         """The queue containing all the frames grabbed by the reader"""
+        self._buffer_pool = FrameBufferPool()
+        """Arrays reused to store the frames, given back by the consumers with release_frame()"""
+        self._ingest_size: tuple[int, int] | None = None
+        """Width and height to which the frames are downscaled before being queued, None to keep their size"""
+        self._ingest_grayscale = False
+        """True to convert the frames to grayscale before they are queued"""
+        self._ingest_scratch = local()
+        """Grayscale image of each acquiring thread, before it is downscaled"""
+        self._frame_stride = 1
+        """Only one frame out of frame_stride is provided, for video files"""
+        self._min_frame_interval = 0.0
+        """Minimum time in seconds between two frames provided, for live feeds"""
+        self._last_live_frame_time = float("-inf")
+        """Clock time at which the last frame of a live feed was provided"""
+        self._regions_hint: tuple[list[tuple[int, int, int, int]], tuple[int, int]] | None = None
+        """Merged regions searched by the trackers, and the width and height of the frame they are relative to"""
 
     @abstractmethod
     def start(self):
@@ -56,6 +88,100 @@ class AbstractFrameProvider(ABC):
         """
         return self._frames_queue.get(block, timeout)
 
+    def set_ingest(self, size: tuple[int, int] | None = None, grayscale: bool = False):
+        """
+        Converts the acquired frames before they are queued, so that they take less memory
+        :param size: Width and height of the queued frames, None to keep the size of the feed
+        :param grayscale: Whether to convert the frames to grayscale
+        """
+        self._ingest_size = size
+        self._ingest_grayscale = grayscale
+
+    def set_decimation(self, frame_stride: int = 1, min_frame_interval: float = 0.0):
+        """
+        Provides fewer frames, when the motion is slow relative to the frame rate
+        :param frame_stride: For a video file, provides one frame out of frame_stride
+        :param min_frame_interval: For a live feed, minimum time in seconds between two frames provided
+        :raise ValueError: If the stride isn't positive or the interval is negative
+        """
+        if frame_stride < 1 or min_frame_interval < 0:
+            raise ValueError("The frame stride must be positive, and the interval between frames not negative")
+        self._frame_stride = frame_stride
+        self._min_frame_interval = min_frame_interval
+
+    def _skips(self, frame_number: int, origin: int = 0) -> bool:
+        """
+        Tells whether a frame is skipped, according to set_decimation(). A frame of a live feed that isn't skipped
+        is considered provided
+        :param frame_number: Number of the frame in the feed
+        :param origin: For a video file, number of the frame from which one frame out of frame_stride is provided
+        """
+        if self._is_video:
+            return (frame_number - origin) % self._frame_stride != 0
+        now = time.monotonic()
+        if now - self._last_live_frame_time < self._min_frame_interval:
+            return True
+        self._last_live_frame_time = now
+        return False
+
+    def set_regions_hint(self, regions: list[tuple[int, int, int, int]] | None, size: tuple[int, int]):
+        """
+        Tells the provider which regions of the frames are read by the trackers, the next frames being then
+        queued as CompactFrame objects. Ignored when the regions cover most of the frame, see CompactFrame.merge_regions()
+        :param regions: The (x, y, width, height) regions, None if the trackers need the whole frame
+        :param size: Width and height of the frames read by the trackers, the regions being relative to them
+        """
+        merged = None if regions is None or len(regions) == 0 \
+            else CompactFrame.merge_regions(regions, size, constants.REGIONS_HINT_MARGIN)
+        self._regions_hint = None if merged is None else (merged, size)
+
+    def _ingest(self, frame: np.ndarray) -> np.ndarray | CompactFrame:
+        """
+        Converts an acquired frame as set by set_ingest(), into a buffer of the pool,
+        or crops it to the regions given to set_regions_hint().
+        A frame of the pool given to this method is released once converted
+        :return: The converted frame, or the frame itself if there is nothing to convert
+        """
+        regions_hint = self._regions_hint
+        if regions_hint is not None:
+            compact = CompactFrame.from_frame(frame, *regions_hint)
+            self._buffer_pool.release(frame)
+            return compact.to_grayscale() if self._ingest_grayscale else compact
+
+        size, grayscale = self._ingest_size, self._ingest_grayscale and frame.ndim == 3
+        if (size is None or size == frame.shape[1::-1]) and not grayscale:
+            return frame
+
+        width, height = size if size is not None else frame.shape[1::-1]
+        converted = self._buffer_pool.acquire((height, width) if grayscale or frame.ndim == 2
+                                              else (height, width, frame.shape[2]), frame.dtype)
+        source = frame
+        if grayscale:
+            code = cv.COLOR_BGRA2GRAY if frame.shape[2] == 4 else cv.COLOR_BGR2GRAY
+            if size is None:
+                cv.cvtColor(frame, code, dst=converted)
+                self._buffer_pool.release(frame)
+                return converted
+            scratch = getattr(self._ingest_scratch, "image", None)
+            if scratch is None or scratch.shape != frame.shape[:2]:
+                scratch = np.empty(frame.shape[:2], dtype=frame.dtype)
+                self._ingest_scratch.image = scratch
+            source = cv.cvtColor(frame, code, dst=scratch)
+        cv.resize(source, (width, height), dst=converted, interpolation=cv.INTER_AREA)
+        self._buffer_pool.release(frame)
+        return converted
+
+    def get_queued_bytes(self) -> int:
+        """:return: The memory taken by the frames waiting in the queue, in bytes"""
+        return self._frames_queue.get_bytes()
+
+    def release_frame(self, frame: np.ndarray):
+        """
+        Tells that a frame returned by grab_frame() isn't used anymore, so that its array can store another frame.
+        The frame must not be read after this call
+        """
+        self._buffer_pool.release(frame)
+
     def get_global_halt_event(self):
         return self._global_halt
 
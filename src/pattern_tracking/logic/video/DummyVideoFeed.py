@@ -1,12 +1,13 @@
 import os
 import queue
-import time
 from threading import Thread, Event
 
 import numpy as np
 from PIL import Image
 
 from src.pattern_tracking.logic.video.AbstractFrameProvider import AbstractFrameProvider
+from src.pattern_tracking.logic.video.PlaybackPacer import PlaybackPacer
+from src.pattern_tracking.shared import constants
 
 
 class DummyVideoFeed(AbstractFrameProvider):
@@ -19,10 +20,12 @@ class DummyVideoFeed(AbstractFrameProvider):
     PAUSE_BEFORE_NEXT_FRAME = 0.25
     ASSETS_DIR = os.path.abspath('assets/dummy_feed_frames/')
 
-    def __init__(self, global_halt: Event):
-        super().__init__(global_halt, False)
+    def __init__(self, global_halt: Event, max_queue_bytes: int = constants.FRAME_QUEUE_MAX_BYTES):
+        super().__init__(global_halt, False, max_queue_bytes=max_queue_bytes)
         self._static_frames: list[np.ndarray] = []
         self._thread: Thread | None = None
+        self._pacer = PlaybackPacer()
+        """Shows a new frame every PAUSE_BEFORE_NEXT_FRAME seconds"""
 
     def _load_static_frames(self):
         directory = os.listdir(DummyVideoFeed.ASSETS_DIR)
@@ -36,14 +39,21 @@ class DummyVideoFeed(AbstractFrameProvider):
     def _run(self):
         frame_num = 0
         current_frame_index = 0
+        # number of pauses waited, frames may be dropped when the queue is full
+        ticks = 0
+        self._pacer.restart()
         while not self._stop_working.is_set() and not self._global_halt.is_set():
-            time.sleep(DummyVideoFeed.PAUSE_BEFORE_NEXT_FRAME)
+            ticks += 1
+            if not self._pacer.wait(1000 * DummyVideoFeed.PAUSE_BEFORE_NEXT_FRAME * ticks, self._stop_working):
+                break
+            frame = self._ingest(self._static_frames[current_frame_index])
             try:
                 self._frames_queue.put(
-                    (frame_num, self._static_frames[current_frame_index]),
+                    (frame_num, frame),
                     block=False, timeout=0.5
                 )
             except queue.Full:
+                self._buffer_pool.release(frame)
                 continue
             frame_num += 1
             current_frame_index = 0 if current_frame_index >= len(self._static_frames) - 1 else current_frame_index + 1
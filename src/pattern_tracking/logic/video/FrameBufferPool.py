@@ -0,0 +1,90 @@
+import weakref
+from threading import RLock
+
+import numpy as np
+
+
+class FrameBufferPool:
+    """
+    Recycles the arrays in which the frames are decoded, so that a provider doesn't allocate
+    a new multi-megabyte array for each frame.
+
+    A provider acquires a buffer, decodes a frame into it and puts it in its queue. The consumer
+    releases the frame once done with it. Each buffer has a reference count : retain() lets one more
+    consumer keep the frame, and the buffer goes back to the pool when all its holders released it.
+    A buffer that is never released isn't lost, it is garbage collected as any array.
+
+    Only the buffers of the last MAX_SHAPES shapes acquired are kept : a frame may be decoded in a buffer,
+    then downscaled in a buffer of another shape. The buffers of older shapes are left to the garbage collector.
+    """
+
+    DEFAULT_MAX_FREE = 64
+    """Maximum number of buffers of a shape kept in the pool, the extra ones are left to the garbage collector"""
+    MAX_SHAPES = 2
+    """Number of shapes of buffers kept in the pool"""
+
+    def __init__(self, max_free: int = DEFAULT_MAX_FREE):
+        self._max_free = max_free
+        self._free: dict[tuple[tuple[int, ...], np.dtype], list[np.ndarray]] = {}
+        """Buffers ready to be reused by shape and type, the most recently acquired shape last"""
+        self._in_use: dict[int, list] = {}
+        """Weak reference and reference count of each buffer handed out, by id of the buffer"""
+        self._lock = RLock()
+        """
+        Held while the pool is modified, buffers are acquired and released by different threads.
+        Reentrant, as the garbage collector may call _forget() from a thread holding it
+        """
+
+    def acquire(self, shape: tuple[int, ...], dtype: np.dtype = np.uint8) -> np.ndarray:
+        """:return: An array of the given shape and type, its content is undefined. Its reference count is 1"""
+        key = (tuple(shape), np.dtype(dtype))
+        self._lock.acquire(blocking=True)
+        free = self._free.pop(key, [])
+        self._free[key] = free
+        if len(self._free) > FrameBufferPool.MAX_SHAPES:
+            del self._free[next(iter(self._free))]
+        buffer = free.pop() if len(free) > 0 else np.empty(*key)
+        buffer_id = id(buffer)
+        self._in_use[buffer_id] = [weakref.ref(buffer, lambda _: self._forget(buffer_id)), 1]
+        self._lock.release()
+        return buffer
+
+    def retain(self, buffer: np.ndarray):
+        """Increments the reference count of a buffer of this pool, ignores the other arrays"""
+        self._lock.acquire(blocking=True)
+        entry = self._entry(buffer)
+        if entry is not None:
+            entry[1] += 1
+        self._lock.release()
+
+    def release(self, buffer: np.ndarray):
+        """Decrements the reference count of a buffer of this pool, ignores the other arrays"""
+        self._lock.acquire(blocking=True)
+        entry = self._entry(buffer)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._in_use[id(buffer)]
+                free = self._free.get((buffer.shape, buffer.dtype))
+                if free is not None and len(free) < self._max_free:
+                    free.append(buffer)
+        self._lock.release()
+
+    def get_free_count(self) -> int:
+        """:return: The number of buffers ready to be reused"""
+        return sum(len(free) for free in self._free.values())
+
+    def _entry(self, buffer: np.ndarray) -> list | None:
+        """:return: The weak reference and the reference count of the buffer, None if it's not handed out by this pool"""
+        entry = self._in_use.get(id(buffer))
+        if entry is None or entry[0]() is not buffer:
+            return None
+        return entry
+
+    def _forget(self, buffer_id: int):
+        """Called when a buffer still in use is garbage collected"""
+        self._lock.acquire(blocking=True)
+        entry = self._in_use.get(buffer_id)
+        if entry is not None and entry[0]() is None:
+            del self._in_use[buffer_id]
+        self._lock.release()
@@ -0,0 +1,125 @@
+import json
+import os
+
+import cv2 as cv
+import numpy as np
+
+
+class FrameCache:
+    """
+    The decoded frames of a video, stored once on the disk and memory-mapped,
+    so that a video analysed many times is only decoded once.
+
+    The frames can be stored at a reduced resolution and in grayscale, which reduces
+    the size of the cache and the work of the trackers.
+
+    Directory layout of a cache :
+        <directory>/meta.json       source video with its size and modification time, number of frames,
+                                    shape of a frame
+        <directory>/frames.bin      raw uint8 frames, one after the other
+    """
+
+    META_FILE_NAME = "meta.json"
+    FRAMES_FILE_NAME = "frames.bin"
+
+    def __init__(self, directory: str):
+        """
+        Opens an existing cache, see build() to create one
+        :raise FileNotFoundError: If there is no cache in the directory
+        """
+        meta_path = os.path.join(directory, FrameCache.META_FILE_NAME)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"No frame cache found in {directory}")
+        with open(meta_path) as file:
+            meta = json.load(file)
+        self._directory = directory
+        self._video_path: str = meta["video"]
+        """Path of the video the frames have been decoded from"""
+        self._source_size: tuple[int, int] = tuple(meta["source_size"])
+        """Width and height of the frames of the video"""
+        self._frame_shape: tuple[int, ...] = tuple(meta["frame_shape"])
+        """Shape of a stored frame, (height, width) in grayscale, (height, width, 3) otherwise"""
+        self._frames = np.memmap(os.path.join(directory, FrameCache.FRAMES_FILE_NAME), dtype=np.uint8, mode='r',
+                                 shape=(meta["frames"],) + self._frame_shape) if meta["frames"] > 0 \
+            else np.empty((0,) + self._frame_shape, dtype=np.uint8)
+        """All the frames, memory-mapped in read-only mode"""
+
+    @staticmethod
+    def build(video_path: str, directory: str, frame_size: tuple[int, int] | None = None,
+              grayscale: bool = False) -> "FrameCache":
+        """
+        Decodes a whole video into a new cache, or opens the cache if it has already been built with the same options
+        from the same video, unchanged since then (same size and modification time)
+        :param video_path: Path of the video file
+        :param directory: Directory of the cache
+        :param frame_size: Width and height of the stored frames, the size of the video if None
+        :param grayscale: Whether to store the frames in grayscale
+        :raise IOError: If the video cannot be read
+        """
+        meta_path = os.path.join(directory, FrameCache.META_FILE_NAME)
+        stat = os.stat(video_path) if os.path.exists(video_path) else None
+        if os.path.exists(meta_path):
+            cache = FrameCache(directory)
+            stored_size = cache.get_frame_size()
+            with open(meta_path) as file:
+                meta = json.load(file)
+            unchanged = stat is not None and meta.get("video_size") == stat.st_size \
+                and meta.get("video_mtime_ns") == stat.st_mtime_ns
+            if unchanged and cache.get_video_path() == os.path.abspath(video_path) and cache.is_grayscale() == grayscale \
+                    and stored_size == (frame_size if frame_size is not None else cache.get_source_size()):
+                return cache
+
+            os.remove(meta_path)
+
+        capture = cv.VideoCapture(video_path)
+        if not capture.isOpened():
+            raise IOError(f"Cannot open the video file {video_path}")
+        os.makedirs(directory, exist_ok=True)
+        source_size = (int(capture.get(cv.CAP_PROP_FRAME_WIDTH)), int(capture.get(cv.CAP_PROP_FRAME_HEIGHT)))
+        width, height = frame_size if frame_size is not None else source_size
+        frame_shape = (height, width) if grayscale else (height, width, 3)
+
+        frames = 0
+        with open(os.path.join(directory, FrameCache.FRAMES_FILE_NAME), "wb") as file:
+            success, frame = capture.read()
+            while success:
+                if frame_size is not None:
+                    frame = cv.resize(frame, frame_size, interpolation=cv.INTER_AREA)
+                if grayscale:
+                    frame = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+                file.write(np.ascontiguousarray(frame).tobytes())
+                frames += 1
+                success, frame = capture.read()
+        capture.release()
+
+        # the metadata is written last, an interrupted build leaves no readable cache
+        with open(meta_path + ".tmp", "w") as file:
+            json.dump({"video": os.path.abspath(video_path), "video_size": stat.st_size,
+                       "video_mtime_ns": stat.st_mtime_ns, "frames": frames,
+                       "source_size": source_size, "frame_shape": frame_shape}, file)
+        os.replace(meta_path + ".tmp", meta_path)
+        return FrameCache(directory)
+
+    def get_directory(self) -> str:
+        return self._directory
+
+    def get_video_path(self) -> str:
+        return self._video_path
+
+    def get_source_size(self) -> tuple[int, int]:
+        """:return: The width and height of the frames of the video"""
+        return self._source_size
+
+    def get_frame_size(self) -> tuple[int, int]:
+        """:return: The width and height of the stored frames"""
+        return self._frame_shape[1], self._frame_shape[0]
+
+    def is_grayscale(self) -> bool:
+        return len(self._frame_shape) == 2
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """:return: A frame, as a read-only view on the memory-mapped file"""
+        return self._frames[index]
@@ -0,0 +1,96 @@
+import bisect
+import json
+import os
+
+import cv2 as cv
+
+
+class FrameIndex:
+    """
+    Timestamp of each frame of a video file, and the numbers of its key frames,
+    to find frames by number or by time without relying on the estimations of the backend.
+
+    Building the index decodes the whole video once, it is then cached next to the video
+    (<video>.index.json) and rebuilt when the size or the modification time of the video change.
+    """
+
+    FILE_SUFFIX = ".index.json"
+    VERSION = 1
+    """Version of the format of the cached index, an index of another version is rebuilt"""
+
+    def __init__(self, timestamps: list[float], keyframes: list[int]):
+        self._timestamps = timestamps
+        """Presentation time of each frame, in milliseconds"""
+        self._keyframes = keyframes if len(keyframes) > 0 and keyframes[0] == 0 else [0] + keyframes
+        """Numbers of the frames that can be decoded without the previous ones, in increasing order"""
+
+    @staticmethod
+    def load(video_path: str) -> "FrameIndex":
+        """
+        Reads the cached index of a video, or builds it and tries to cache it if it's missing or outdated
+        :raise IOError: If the video cannot be read
+        """
+        index_path = video_path + FrameIndex.FILE_SUFFIX
+        stat = os.stat(video_path)
+        try:
+            with open(index_path) as file:
+                cached = json.load(file)
+            if cached["version"] == FrameIndex.VERSION and cached["video_size"] == stat.st_size \
+                    and cached["video_mtime_ns"] == stat.st_mtime_ns:
+                return FrameIndex(cached["timestamps"], cached["keyframes"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        index = FrameIndex.build(video_path)
+        try:
+            with open(index_path + ".tmp", "w") as file:
+                json.dump({"version": FrameIndex.VERSION, "video_size": stat.st_size,
+                           "video_mtime_ns": stat.st_mtime_ns, "timestamps": index._timestamps,
+                           "keyframes": index._keyframes}, file)
+            os.replace(index_path + ".tmp", index_path)
+        except OSError:
+            # the directory of the video may be read-only, the index is then only kept in memory
+            pass
+        return index
+
+    @staticmethod
+    def build(video_path: str) -> "FrameIndex":
+        """
+        Decodes the whole video to index its frames
+        :raise IOError: If the video cannot be read
+        """
+        capture = cv.VideoCapture(video_path)
+        if not capture.isOpened():
+            raise IOError(f"Cannot open the video file {video_path}")
+        timestamps, keyframes = [], []
+        # grab() decodes the frames without converting them to BGR
+        while capture.grab():
+            if capture.get(cv.CAP_PROP_LRF_HAS_KEY_FRAME) != 0:
+                keyframes.append(len(timestamps))
+            timestamps.append(capture.get(cv.CAP_PROP_POS_MSEC))
+        capture.release()
+        return FrameIndex(timestamps, keyframes)
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def get_timestamp(self, frame_number: int) -> float:
+        """:return: The presentation time of the frame, in milliseconds"""
+        return self._timestamps[frame_number]
+
+    def get_keyframes(self) -> list[int]:
+        return self._keyframes
+
+    def get_frame_duration(self) -> float:
+        """:return: The mean duration of a frame in milliseconds, 0 if the video has less than two frames"""
+        if len(self._timestamps) < 2:
+            return 0.0
+        return (self._timestamps[-1] - self._timestamps[0]) / (len(self._timestamps) - 1)
+
+    def keyframe_before(self, frame_number: int) -> int:
+        """:return: The number of the last key frame at or before the given frame"""
+        return self._keyframes[bisect.bisect_right(self._keyframes, frame_number) - 1]
+
+    def frame_at(self, timestamp: float) -> int:
+        """:return: The number of the frame displayed at the given time, in milliseconds"""
+        return max(0, bisect.bisect_right(self._timestamps, timestamp) - 1)
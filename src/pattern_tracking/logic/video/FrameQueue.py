@@ -0,0 +1,86 @@
+import queue
+import time
+from collections import deque
+from threading import Condition, Lock
+
+import numpy as np
+
+
+class FrameQueue:
+    """
+    Queue of (frame_number, frame) items, bounded by a number of items and by the total size of the frames,
+    so that the memory taken by a queue doesn't depend on the resolution of the feed.
+
+    Same interface as queue.Queue for put(), get() and qsize(), raising queue.Full and queue.Empty.
+    A frame larger than the whole budget is still accepted when the queue is empty, otherwise it would never be.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int):
+        if max_items <= 0 or max_bytes <= 0:
+            raise ValueError("The queue must be able to hold at least one frame")
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._items: deque[tuple[int, np.ndarray] | None] = deque()
+        self._bytes = 0
+        """Total size of the frames in the queue"""
+        lock = Lock()
+        self._not_empty = Condition(lock)
+        """Notified when an item is put"""
+        self._not_full = Condition(lock)
+        """Notified when an item is taken"""
+
+    @staticmethod
+    def _size(item: tuple[int, np.ndarray] | None) -> int:
+        """:return: The number of bytes of the frame of an item"""
+        return 0 if item is None else getattr(item[1], "nbytes", 0)
+
+    def put(self, item: tuple[int, np.ndarray] | None, block: bool = True, timeout: float | None = None):
+        """
+        Adds an item at the end of the queue, waiting for enough room if block is True
+        :raise queue.Full: If there is not enough room, after the timeout if block is True
+        """
+        size = FrameQueue._size(item)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_full:
+            while len(self._items) > 0 and (len(self._items) >= self._max_items
+                                            or self._bytes + size > self._max_bytes):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise queue.Full
+                self._not_full.wait(remaining)
+            self._items.append(item)
+            self._bytes += size
+            self._not_empty.notify()
+
+    def put_nowait(self, item: tuple[int, np.ndarray] | None):
+        self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> tuple[int, np.ndarray] | None:
+        """
+        Removes and returns the oldest item, waiting for one if block is True
+        :raise queue.Empty: If there is no item, after the timeout if block is True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_empty:
+            while len(self._items) == 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise queue.Empty
+                self._not_empty.wait(remaining)
+            item = self._items.popleft()
+            self._bytes -= FrameQueue._size(item)
+            self._not_full.notify()
+            return item
+
+    def get_nowait(self) -> tuple[int, np.ndarray] | None:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def get_bytes(self) -> int:
+        """:return: The total size of the frames in the queue"""
+        return self._bytes
+
+    def get_max_bytes(self) -> int:
+        return self._max_bytes
@@ -4,6 +4,7 @@ import zmq
 
 from src.comm_protocol.Packet import Packet
 from src.pattern_tracking.logic.video.AbstractFrameProvider import AbstractFrameProvider
+from src.pattern_tracking.shared import constants
 
 
 class FramesFromZMQSocket(AbstractFrameProvider):
@@ -16,8 +17,9 @@ class FramesFromZMQSocket(AbstractFrameProvider):
     DEFAULT_PORT = 47828
 
     def __init__(self, ip_address: str, port: int,
-                 global_halt: Event, max_frames_in_queue: int = 30):
-        super().__init__(global_halt, False, max_frames_in_queue)
+                 global_halt: Event, max_frames_in_queue: int = 30,
+                 max_queue_bytes: int = constants.FRAME_QUEUE_MAX_BYTES):
+        super().__init__(global_halt, False, max_frames_in_queue, max_queue_bytes)
         self._zmq_context = zmq.Context()
         self._socket = self._zmq_context.socket(zmq.SUB)
         self._socket.setsockopt_string(zmq.SUBSCRIBE, "")
@@ -31,10 +33,14 @@ class FramesFromZMQSocket(AbstractFrameProvider):
 
     def _read_socket_data(self):
         while self._running and not self._global_halt.is_set():
-            raw_data = self._socket.recv()
-            packet = Packet.deserialize(raw_data)
+            # the message is read from the buffer of ZMQ, without copying it to a bytes object first
+            raw_data = self._socket.recv(copy=False)
+            # the skipped messages aren't even deserialized
+            if self._skips(0):
+                continue
+            packet = Packet.deserialize(raw_data.buffer)
             if packet is not None:
-                self._frames_queue.put((packet.frame_number, packet.payload))
+                self._frames_queue.put((packet.frame_number, self._ingest(packet.payload)))
 
         self._zmq_context.destroy()
         self._running = False
@@ -1,6 +1,7 @@
 from threading import Lock
 
 from src.pattern_tracking.logic.video.AbstractFrameProvider import AbstractFrameProvider
+from src.pattern_tracking.logic.video.PlaybackPacer import PlaybackPacer
 
 
 class LiveFeedWrapper:
@@ -13,9 +14,20 @@ class LiveFeedWrapper:
     and replaces it with a new instance of `AbstractFrameProvider`
     """
 
-    def __init__(self, feed: AbstractFrameProvider):
+    def __init__(self, feed: AbstractFrameProvider, ingest_size: tuple[int, int] | None = None):
+        """
+        :param feed: The first video input
+        :param ingest_size: Size to which the frames of all the feeds are downscaled before being queued,
+        see AbstractFrameProvider.set_ingest()
+        """
+        self._ingest_size = ingest_size
         self._feed = feed
+        self._feed.set_ingest(ingest_size)
+        self._decimation = (1, 0.0)
+        """Frame stride and minimum interval between frames, applied to all the feeds, see set_decimation()"""
         self._reset_feed_mutex = Lock()
+        self._pacer = PlaybackPacer()
+        """Pacer of the video files, kept when the feed changes so that the playback speed is kept too"""
 
     def start(self):
         self._feed.start()
@@ -27,6 +39,30 @@ class LiveFeedWrapper:
         """Wrapper for AbstractFrameProvider.grab_frame() instance method"""
         return self._feed.grab_frame(block, timeout)
 
+    def release_frame(self, frame):
+        """Wrapper for AbstractFrameProvider.release_frame() instance method"""
+        self._feed.release_frame(frame)
+
+    def set_regions_hint(self, regions: list[tuple[int, int, int, int]] | None, size: tuple[int, int]):
+        """Wrapper for AbstractFrameProvider.set_regions_hint() instance method"""
+        self._feed.set_regions_hint(regions, size)
+
+    def set_decimation(self, frame_stride: int = 1, min_frame_interval: float = 0.0):
+        """Wrapper for AbstractFrameProvider.set_decimation() instance method, also applied to the next feeds"""
+        self._feed.set_decimation(frame_stride, min_frame_interval)
+        self._decimation = (frame_stride, min_frame_interval)
+
+    def get_decimation(self) -> tuple[int, float]:
+        """:return: The frame stride of the video files, and the minimum interval between frames of the live feeds"""
+        return self._decimation
+
+    def get_queued_bytes(self) -> int:
+        """Wrapper for AbstractFrameProvider.get_queued_bytes() instance method"""
+        return self._feed.get_queued_bytes()
+
+    def get_pacer(self) -> PlaybackPacer:
+        return self._pacer
+
     def get_global_halt_event(self):
         return self._feed.get_global_halt_event()
 
@@ -38,6 +74,8 @@ class LiveFeedWrapper:
         self._reset_feed_mutex.acquire()
         self._feed.stop()
         self._feed = feed
+        self._feed.set_ingest(self._ingest_size)
+        self._feed.set_decimation(*self._decimation)
         self._feed.start()
         # Wait for the feed to start working
         # Technically we don't need it, it's just extra precaution steps
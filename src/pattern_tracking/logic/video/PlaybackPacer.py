@@ -0,0 +1,103 @@
+import time
+from threading import Event, Lock
+
+
+class PlaybackPacer:
+    """
+    Times the frames of a video file on a monotonic clock, from their presentation timestamps,
+    so that a video is played at its real speed whatever the time taken to decode it.
+
+    The first frame (or the first frame after restart()) is due immediately, each next frame is due
+    when the time elapsed since then reaches the difference of their timestamps, divided by the speed.
+    A frame that is late by more than MAX_LATENESS should be skipped by the provider, so that playback
+    catches up with real time instead of drifting. Frames are never duplicated : the consumers handle
+    each frame number once, so a frame stays displayed until the next one is due.
+
+    In unthrottled mode, the frames are due immediately and never skipped, to measure the throughput.
+    The speed can be changed from any thread while a video is being played.
+    """
+
+    MIN_SPEED = 0.25
+    MAX_SPEED = 8.0
+    MAX_LATENESS = 0.1
+    """Delay in seconds after which a frame is late, and should be skipped"""
+
+    def __init__(self, speed: float = 1.0, unthrottled: bool = False):
+        self._speed = 1.0
+        """Factor applied to the real speed of the video"""
+        self._unthrottled = unthrottled
+        """True to provide the frames as fast as possible"""
+        self._origin: tuple[float, float] | None = None
+        """Clock time and timestamp in milliseconds of the frame from which the next ones are timed"""
+        self._last_timestamp: float | None = None
+        """Timestamp of the last frame provided"""
+        self._lock = Lock()
+        """Held while the origin is read or changed, the speed is changed from the GUI thread"""
+        self.set_speed(speed)
+
+    def get_speed(self) -> float:
+        return self._speed
+
+    def set_speed(self, speed: float):
+        """
+        Changes the playback speed, from the last frame provided
+        :raise ValueError: If the speed is not between MIN_SPEED and MAX_SPEED
+        """
+        if not PlaybackPacer.MIN_SPEED <= speed <= PlaybackPacer.MAX_SPEED:
+            raise ValueError(f"The playback speed must be between {PlaybackPacer.MIN_SPEED} "
+                             f"and {PlaybackPacer.MAX_SPEED}")
+        self._lock.acquire(blocking=True)
+        self._speed = speed
+        self._reanchor()
+        self._lock.release()
+
+    def is_unthrottled(self) -> bool:
+        return self._unthrottled
+
+    def set_unthrottled(self, unthrottled: bool):
+        self._lock.acquire(blocking=True)
+        self._unthrottled = unthrottled
+        self._reanchor()
+        self._lock.release()
+
+    def restart(self):
+        """The next frame is due immediately, call it when the video starts, loops, or after a seek"""
+        self._lock.acquire(blocking=True)
+        self._origin = None
+        self._last_timestamp = None
+        self._lock.release()
+
+    def is_late(self, timestamp: float) -> bool:
+        """:return: True if the frame of the given timestamp, in milliseconds, should be skipped"""
+        if self._unthrottled:
+            return False
+        return time.monotonic() - self._due_time(timestamp) > PlaybackPacer.MAX_LATENESS
+
+    def wait(self, timestamp: float, stop: Event) -> bool:
+        """
+        Waits until the frame of the given timestamp, in milliseconds, is due, and marks it as provided
+        :param stop: Event interrupting the wait
+        :return: False if interrupted by the event
+        """
+        if not self._unthrottled:
+            delay = self._due_time(timestamp) - time.monotonic()
+            if delay > 0 and stop.wait(delay):
+                return False
+        self._lock.acquire(blocking=True)
+        self._last_timestamp = timestamp
+        self._lock.release()
+        return True
+
+    def _due_time(self, timestamp: float) -> float:
+        """:return: The clock time at which the frame is due, the first frame being due now"""
+        self._lock.acquire(blocking=True)
+        if self._origin is None:
+            self._origin = (time.monotonic(), timestamp)
+        origin_time, origin_timestamp = self._origin
+        due_time = origin_time + (timestamp - origin_timestamp) / 1000 / self._speed
+        self._lock.release()
+        return due_time
+
+    def _reanchor(self):
+        """Times the next frames from the last frame provided, as if it had just been provided. Hold the lock"""
+        self._origin = None if self._last_timestamp is None else (time.monotonic(), self._last_timestamp)
@@ -0,0 +1,277 @@
+import queue
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event, Lock, Thread, local
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.logic.video.AbstractFrameProvider import AbstractFrameProvider
+from src.pattern_tracking.logic.video.FrameIndex import FrameIndex
+from src.pattern_tracking.logic.video.PlaybackPacer import PlaybackPacer
+from src.pattern_tracking.objects.CompactFrame import CompactFrame
+from src.pattern_tracking.shared import constants
+
+
+class SeekableVideoReader(AbstractFrameProvider):
+    """
+    Reads the frames of a video file, with random access by frame number.
+
+    The frames are decoded ahead by chunks of consecutive frames, each chunk by one of
+    `decode_threads` threads (OpenCV releases the GIL while decoding), and are put in the queue
+    in the order of the video. Each decode thread has its own VideoCapture, that is only moved
+    when the chunk doesn't follow the last frame it decoded : it decodes forward when no key frame
+    separates its position from the chunk, and seeks otherwise.
+
+    The FrameIndex of the video tells where the key frames are, and the timestamp of each frame
+    is checked after seeking : when the backend seeks to the wrong frame, the video is decoded
+    from its beginning instead.
+
+    The frames are timed by a PlaybackPacer from the timestamps of the index, late frames being skipped.
+
+    At the end of the video, the reader loops if asked to, otherwise it waits for a seek() until it is stopped.
+    """
+
+    DEFAULT_DECODE_THREADS = 2
+    CHUNK_FRAMES = 16
+    """Number of consecutive frames decoded at once by a decode thread"""
+    PUT_TIMEOUT = 0.05
+    """Time waited for a free spot in the queue before checking again for a seek or a stop request"""
+
+    def __init__(self, video_path: str,
+                 global_halt_event: Event,
+                 max_frames_in_queue: int = 30,
+                 max_queue_bytes: int = constants.FRAME_QUEUE_MAX_BYTES,
+                 loop_video: bool = False,
+                 decode_threads: int = DEFAULT_DECODE_THREADS,
+                 pacer: PlaybackPacer | None = None):
+        super().__init__(global_halt_event, True, max_frames_in_queue, max_queue_bytes)
+        if decode_threads <= 0:
+            raise ValueError("At least one decode thread is required")
+        self._video_path = video_path
+        self._index = FrameIndex.load(video_path)
+        """Timestamps and key frames of the video"""
+        if len(self._index) == 0:
+            raise IOError("Couldn't read any frame of the video !")
+        self._loop = loop_video
+        """Set to True if we want the video to serve forever"""
+        self._decode_threads = decode_threads
+        self._pacer = pacer if pacer is not None else PlaybackPacer()
+        """Times the frames put in the queue"""
+        self._thread: Thread | None = None
+        """The thread putting the decoded frames in the queue, in order"""
+
+        self._thread_captures = local()
+        """VideoCapture of each decode thread, a capture cannot be used by several threads"""
+        self._captures: list[cv.VideoCapture] = []
+        """All the captures opened, released when the reader stops"""
+        self._captures_lock = Lock()
+        self._random_access_capture: cv.VideoCapture | None = None
+        """Capture used by read_frame()"""
+        self._random_access_lock = Lock()
+
+        self._seek_request: int | None = None
+        """Number of the frame from which to continue reading, set by seek()"""
+        self._seek_lock = Lock()
+        """Held while a frame is put in the queue, so that no frame from before a seek follows it"""
+
+        self._frames_shape = self.read_frame(0).shape
+        """The shape of the frames of the video, before their conversion set by set_ingest()"""
+
+    def start(self):
+        """Start a thread, decodes & places the frames in the self._frames_queue attribute"""
+        self._thread = Thread(target=self._run)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_working.set()
+
+    def get_shape(self):
+        return self._frames_shape
+
+    def get_pacer(self) -> PlaybackPacer:
+        return self._pacer
+
+    def get_index(self) -> FrameIndex:
+        return self._index
+
+    def get_frame_count(self) -> int:
+        return len(self._index)
+
+    def seek(self, frame_number: int):
+        """
+        The frames of the queue are dropped, and the reader continues from the given frame
+        :raise ValueError: If the video has no such frame
+        """
+        if not 0 <= frame_number < len(self._index):
+            raise ValueError(f"Frame {frame_number} out of the video, that has {len(self._index)} frames")
+        self._seek_lock.acquire(blocking=True)
+        self._seek_request = frame_number
+        try:
+            while True:
+                self._buffer_pool.release(self._frames_queue.get_nowait()[1])
+        except queue.Empty:
+            pass
+        self._seek_lock.release()
+
+    def read_frame(self, frame_number: int) -> np.ndarray | CompactFrame:
+        """
+        Decodes one frame, independently of the frames being read in the background, and converts it as queued frames
+        :raise ValueError: If the video has no such frame
+        """
+        if not 0 <= frame_number < len(self._index):
+            raise ValueError(f"Frame {frame_number} out of the video, that has {len(self._index)} frames")
+        self._random_access_lock.acquire(blocking=True)
+        try:
+            if self._random_access_capture is None:
+                self._random_access_capture = self._open_capture()
+            self._random_access_capture, frame = self._read_at(self._random_access_capture, frame_number)
+            return self._ingest(frame)
+        finally:
+            self._random_access_lock.release()
+
+    def _run(self):
+        """
+        Submits the chunks of frames to decode, and puts their frames in the queue in order
+
+        Data format of the items that are written to the queue are as follows :
+        tuple[int, cv.Mat | np.ndarray] | None
+        """
+        executor = ThreadPoolExecutor(max_workers=self._decode_threads)
+        self._pacer.restart()
+        # chunks being decoded in the order of the video, and the first frame of the next chunk to submit
+        pending: deque[Future] = deque()
+        next_chunk = 0
+        try:
+            while not self._global_halt.is_set() and not self._stop_working.is_set():
+                self._seek_lock.acquire(blocking=True)
+                if self._seek_request is not None:
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                    next_chunk, self._seek_request = self._seek_request, None
+                    self._pacer.restart()
+                self._seek_lock.release()
+
+                # one more chunk than threads, so that a thread never waits for the queue to be emptied
+                while len(pending) <= self._decode_threads and next_chunk < len(self._index):
+                    # a chunk provides CHUNK_FRAMES frames, one out of frame_stride from its first one
+                    stop = min(next_chunk + SeekableVideoReader.CHUNK_FRAMES * self._frame_stride, len(self._index))
+                    pending.append(executor.submit(self._decode_chunk, next_chunk, stop))
+                    next_chunk = stop
+                if len(pending) == 0:
+                    if self._loop:
+                        next_chunk = 0
+                        self._pacer.restart()
+                    else:
+                        # the end of the video, the reader still serves the frames of the next seek
+                        self._stop_working.wait(SeekableVideoReader.PUT_TIMEOUT)
+                    continue
+
+                frames = pending.popleft().result()
+                for position, (frame_number, frame) in enumerate(frames):
+                    timestamp = self._index.get_timestamp(frame_number)
+                    if self._pacer.is_late(timestamp):
+                        self._buffer_pool.release(frame)
+                    elif not self._pacer.wait(timestamp, self._stop_working) or not self._put((frame_number, frame)):
+                        # the frames of the chunk following a seek are dropped
+                        for _, dropped in frames[position:]:
+                            self._buffer_pool.release(dropped)
+                        break
+        finally:
+            # a chunk that couldn't be decoded ends the stream, the decode threads and the captures being released
+            self._stop_working.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._captures_lock.acquire(blocking=True)
+            try:
+                for capture in self._captures:
+                    capture.release()
+            finally:
+                self._captures_lock.release()
+
+    def _put(self, item: tuple[int, np.ndarray]) -> bool:
+        """:return: True if the frame was put in the queue, False if a seek or a stop was requested before"""
+        while not self._global_halt.is_set() and not self._stop_working.is_set():
+            self._seek_lock.acquire(blocking=True)
+            try:
+                if self._seek_request is not None:
+                    return False
+                self._frames_queue.put(item, timeout=SeekableVideoReader.PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+            finally:
+                self._seek_lock.release()
+            # let seek() take the lock
+            time.sleep(0)
+        return False
+
+    def _decode_chunk(self, start: int, stop: int) -> list[tuple[int, np.ndarray]]:
+        """
+        :return: The number and the frame of the frames from start to stop (excluded) that aren't skipped,
+                 the skipped frames are only grabbed
+        """
+        capture = getattr(self._thread_captures, "capture", None)
+        if capture is None:
+            capture = self._open_capture()
+        capture, frame = self._read_at(capture, start, self._buffer_pool.acquire(self._frames_shape))
+        self._thread_captures.capture = capture
+        # the frames are converted on the decode threads, in parallel
+        frames = [(start, self._ingest(frame))]
+        for frame_number in range(start + 1, stop):
+            if self._skips(frame_number, origin=start):
+                if not capture.grab():
+                    break
+                continue
+            buffer = self._buffer_pool.acquire(self._frames_shape)
+            success, frame = capture.read(buffer)
+            if not success:
+                self._buffer_pool.release(buffer)
+                break
+            frames.append((frame_number, self._ingest(frame)))
+        return frames
+
+    def _open_capture(self) -> cv.VideoCapture:
+        capture = cv.VideoCapture(self._video_path)
+        if not capture.isOpened():
+            raise IOError("Couldn't open video feed !")
+        self._captures_lock.acquire(blocking=True)
+        self._captures.append(capture)
+        self._captures_lock.release()
+        return capture
+
+    def _reopen_capture(self, capture: cv.VideoCapture) -> cv.VideoCapture:
+        """Releases a capture, and opens a new one at the beginning of the video"""
+        self._captures_lock.acquire(blocking=True)
+        self._captures.remove(capture)
+        self._captures_lock.release()
+        capture.release()
+        return self._open_capture()
+
+    def _read_at(self, capture: cv.VideoCapture, frame_number: int,
+                 buffer: np.ndarray | None = None) -> tuple[cv.VideoCapture, np.ndarray]:
+        """
+        Reads a frame, moving the capture if needed
+        :param buffer: The array in which to decode the frame, a new one if None
+        :return: The capture to use from now on, replaced if the seek failed, and the frame
+        """
+        # number of the next frame the capture decodes
+        position = int(capture.get(cv.CAP_PROP_POS_FRAMES))
+        if position <= frame_number and self._index.keyframe_before(frame_number) <= position:
+            for _ in range(frame_number - position):
+                capture.grab()
+        else:
+            capture.set(cv.CAP_PROP_POS_FRAMES, frame_number)
+
+        success, frame = capture.read(buffer)
+        tolerance = self._index.get_frame_duration() / 2
+        if not success or abs(capture.get(cv.CAP_PROP_POS_MSEC) - self._index.get_timestamp(frame_number)) > tolerance:
+            # the backend didn't seek to the right frame, decoding from the beginning is always right
+            capture = self._reopen_capture(capture)
+            for _ in range(frame_number):
+                capture.grab()
+            success, frame = capture.read(buffer)
+            if not success:
+                raise IOError(f"Couldn't read the frame {frame_number} of the video !")
+        return capture, frame
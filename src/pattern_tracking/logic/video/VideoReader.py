@@ -1,9 +1,10 @@
-import time
 from threading import Thread, Event
 
 import cv2 as cv
 
 from src.pattern_tracking.logic.video.AbstractFrameProvider import AbstractFrameProvider
+from src.pattern_tracking.logic.video.PlaybackPacer import PlaybackPacer
+from src.pattern_tracking.shared import constants
 
 
 class VideoReader(AbstractFrameProvider):
@@ -16,8 +17,10 @@ class VideoReader(AbstractFrameProvider):
                  is_video: bool,
                  global_halt_event: Event,
                  max_frames_in_queue: int = 30,
-                 loop_video: bool = False):
-        super().__init__(global_halt_event, is_video, max_frames_in_queue)
+                 max_queue_bytes: int = constants.FRAME_QUEUE_MAX_BYTES,
+                 loop_video: bool = False,
+                 pacer: PlaybackPacer | None = None):
+        super().__init__(global_halt_event, is_video, max_frames_in_queue, max_queue_bytes)
 
         self._video_feed: cv.VideoCapture = None
         """Video feed"""
@@ -29,6 +32,8 @@ class VideoReader(AbstractFrameProvider):
         """Set to True if we want the video to serve forever"""
         self._thread: Thread | None = None
         """The thread used to process frames in the background"""
+        self._pacer = pacer if pacer is not None else PlaybackPacer()
+        """Times the frames of a video file, unused for live feeds"""
 
         self._initialize_reader()
 
@@ -55,16 +60,35 @@ class VideoReader(AbstractFrameProvider):
         capturing = True
         while capturing:
             frame_id = 0
+            self._pacer.restart()
             while self._video_feed.isOpened() and not self._global_halt.is_set() \
                     and not self._stop_working.is_set():
-                ret, frame = self._video_feed.read()
+                if not self._video_feed.grab():
+                    break
+                # the skipped frames are only grabbed, never converted
+                if self._skips(frame_id):
+                    frame_id += 1
+                    continue
+                if self._is_video:
+                    timestamp = self._video_feed.get(cv.CAP_PROP_POS_MSEC)
+                    # late frames are skipped before being converted, to hold real time
+                    if self._pacer.is_late(timestamp):
+                        frame_id += 1
+                        continue
+                buffer = self._buffer_pool.acquire(self._frames_shape)
+                ret, frame = self._video_feed.retrieve(buffer)
+                if frame is not buffer:
+                    # the shape of the frames changed, OpenCV allocated a new array
+                    self._buffer_pool.release(buffer)
                 if not ret:
                     break
+                frame = self._ingest(frame)
+                if self._is_video and not self._pacer.wait(timestamp, self._stop_working):
+                    self._buffer_pool.release(frame)
+                    break
 
                 self._frames_queue.put((frame_id, frame))
                 frame_id += 1
-                if self._is_video:
-                    time.sleep(0.05)
 
             # enable looping if requested, and if not tasked to stop work
             if self._loop:
@@ -76,6 +100,9 @@ class VideoReader(AbstractFrameProvider):
                 capturing = False
         self._video_feed.release()
 
+    def get_pacer(self) -> PlaybackPacer:
+        return self._pacer
+
     def get_shape(self):
         return self._frames_shape
 
@@ -0,0 +1,43 @@
+import gc
+from unittest import TestCase
+
+import numpy as np
+
+from src.pattern_tracking.logic.video.FrameBufferPool import FrameBufferPool
+
+
+class TestFrameBufferPool(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._pool = FrameBufferPool()
+
+    def test_released_buffer_is_reused(self):
+        buffer = self._pool.acquire((240, 320, 3))
+        self._pool.release(buffer)
+        self.assertIs(buffer, self._pool.acquire((240, 320, 3)))
+
+    def test_reference_count(self):
+        buffer = self._pool.acquire((240, 320, 3))
+        self._pool.retain(buffer)
+        self._pool.release(buffer)
+        self.assertEqual(0, self._pool.get_free_count())
+        self._pool.release(buffer)
+        self.assertEqual(1, self._pool.get_free_count())
+        # releasing it again, or releasing an array of another origin, has no effect
+        self._pool.release(buffer)
+        self._pool.release(np.empty((240, 320, 3), dtype=np.uint8))
+        self.assertEqual(1, self._pool.get_free_count())
+
+    def test_oldest_shape_is_dropped(self):
+        self._pool.release(self._pool.acquire((240, 320, 3)))
+        self._pool.release(self._pool.acquire((480, 640, 3)))
+        self.assertEqual(2, self._pool.get_free_count())
+        buffer = self._pool.acquire((120, 160))
+        self.assertEqual((120, 160), buffer.shape)
+        self.assertEqual(1, self._pool.get_free_count())
+
+    def test_lost_buffer_is_forgotten(self):
+        self._pool.acquire((240, 320, 3))
+        gc.collect()
+        self.assertEqual({}, self._pool._in_use)
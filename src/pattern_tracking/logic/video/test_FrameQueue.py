@@ -0,0 +1,34 @@
+import queue
+from unittest import TestCase
+
+import numpy as np
+
+from src.pattern_tracking.logic.video.FrameQueue import FrameQueue
+
+
+class TestFrameQueue(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        self._queue = FrameQueue(max_items=10, max_bytes=2 * self._frame.nbytes)
+
+    def test_byte_budget(self):
+        self._queue.put((0, self._frame))
+        self._queue.put((1, self._frame))
+        self.assertEqual(2 * self._frame.nbytes, self._queue.get_bytes())
+        with self.assertRaises(queue.Full):
+            self._queue.put((2, self._frame), timeout=0.01)
+        self.assertEqual(0, self._queue.get()[0])
+        self._queue.put((2, self._frame), block=False)
+        self.assertEqual(2, self._queue.qsize())
+
+    def test_large_frame_accepted_when_empty(self):
+        large = np.zeros((1000, 1000, 3), dtype=np.uint8)
+        self._queue.put((0, large), block=False)
+        with self.assertRaises(queue.Full):
+            self._queue.put((1, self._frame), block=False)
+        self.assertIs(large, self._queue.get()[1])
+        self.assertEqual(0, self._queue.get_bytes())
+        with self.assertRaises(queue.Empty):
+            self._queue.get(timeout=0.01)
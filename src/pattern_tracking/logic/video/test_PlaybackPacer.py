@@ -0,0 +1,44 @@
+import time
+from threading import Event
+from unittest import TestCase
+
+from src.pattern_tracking.logic.video.PlaybackPacer import PlaybackPacer
+
+
+class TestPlaybackPacer(TestCase):
+
+    def test_real_time(self):
+        pacer, stop = PlaybackPacer(speed=2.0), Event()
+        start = time.monotonic()
+        for timestamp in (1000, 1100, 1200):
+            self.assertTrue(pacer.wait(timestamp, stop))
+        # 200 ms of video at twice the real speed
+        self.assertAlmostEqual(0.1, time.monotonic() - start, delta=0.03)
+
+    def test_late_frames(self):
+        pacer = PlaybackPacer()
+        pacer.wait(0, Event())
+        time.sleep(PlaybackPacer.MAX_LATENESS + 0.05)
+        self.assertTrue(pacer.is_late(0))
+        self.assertFalse(pacer.is_late(1000))
+        pacer.set_unthrottled(True)
+        self.assertFalse(pacer.is_late(0))
+
+    def test_unthrottled(self):
+        pacer, stop = PlaybackPacer(unthrottled=True), Event()
+        start = time.monotonic()
+        for timestamp in range(0, 10000, 100):
+            pacer.wait(timestamp, stop)
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    def test_stop_interrupts(self):
+        pacer, stop = PlaybackPacer(), Event()
+        pacer.wait(0, stop)
+        stop.set()
+        self.assertFalse(pacer.wait(10000, stop))
+
+    def test_speed_bounds(self):
+        with self.assertRaises(ValueError):
+            PlaybackPacer(speed=16)
+        with self.assertRaises(ValueError):
+            PlaybackPacer().set_speed(0.1)
@@ -0,0 +1,111 @@
+import os
+import tempfile
+from threading import Event
+from unittest import TestCase
+from unittest.mock import patch
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.benchmark.SyntheticFeed import SyntheticFeed
+from src.pattern_tracking.logic.video.FrameIndex import FrameIndex
+from src.pattern_tracking.logic.video.PlaybackPacer import PlaybackPacer
+from src.pattern_tracking.logic.video.SeekableVideoReader import SeekableVideoReader
+
+
+class TestSeekableVideoReader(TestCase):
+    FRAMES = 60
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._directory = tempfile.TemporaryDirectory()
+        # MPEG-4 part 2 has a key frame every 12 frames, the other frames depend on the previous ones
+        self._video_path = os.path.join(self._directory.name, "feed.mp4")
+        feed = SyntheticFeed(320, 240, 2, seed=0)
+        writer = cv.VideoWriter(self._video_path, cv.VideoWriter_fourcc(*"mp4v"), 30, (320, 240))
+        for _ in range(TestSeekableVideoReader.FRAMES):
+            writer.write(feed.next_frame()[0])
+        writer.release()
+        capture = cv.VideoCapture(self._video_path)
+        self._frames = [capture.read()[1] for _ in range(TestSeekableVideoReader.FRAMES)]
+        capture.release()
+        self._halt = Event()
+
+    def tearDown(self) -> None:
+        self._halt.set()
+        self._directory.cleanup()
+        super().tearDown()
+
+    def test_index_is_cached(self):
+        index = FrameIndex.load(self._video_path)
+        self.assertEqual(TestSeekableVideoReader.FRAMES, len(index))
+        self.assertEqual([0, 12, 24, 36, 48], index.get_keyframes())
+        self.assertEqual(12, index.keyframe_before(23))
+        self.assertEqual(30, index.frame_at(index.get_timestamp(30) + 1))
+
+        index_path = self._video_path + FrameIndex.FILE_SUFFIX
+        mtime = os.stat(index_path).st_mtime_ns
+        self.assertEqual(index.get_keyframes(), FrameIndex.load(self._video_path).get_keyframes())
+        self.assertEqual(mtime, os.stat(index_path).st_mtime_ns)
+
+    def test_random_access(self):
+        reader = SeekableVideoReader(self._video_path, self._halt)
+        for frame_number in (40, 3, 59, 13, 12, 0):
+            np.testing.assert_array_equal(self._frames[frame_number], reader.read_frame(frame_number))
+        with self.assertRaises(ValueError):
+            reader.read_frame(TestSeekableVideoReader.FRAMES)
+
+    def test_failed_seeks_release_their_capture(self):
+        reader = SeekableVideoReader(self._video_path, self._halt)
+        # every timestamp check fails, so each read decodes the video from its beginning with a new capture
+        with patch.object(reader.get_index(), "get_timestamp", return_value=-1000.0):
+            for frame_number in (30, 5, 50):
+                np.testing.assert_array_equal(self._frames[frame_number], reader.read_frame(frame_number))
+        self.assertEqual(1, len(reader._captures))
+
+    def test_frames_in_order_then_seek(self):
+        reader = SeekableVideoReader(self._video_path, self._halt, decode_threads=3,
+                                     pacer=PlaybackPacer(unthrottled=True))
+        reader.start()
+        for frame_number in range(40):
+            number, frame = reader.grab_frame(timeout=5)
+            self.assertEqual(frame_number, number)
+            np.testing.assert_array_equal(self._frames[frame_number], frame)
+
+        reader.seek(17)
+        number, frame = reader.grab_frame(timeout=5)
+        self.assertEqual(17, number)
+        np.testing.assert_array_equal(self._frames[17], frame)
+        reader.stop()
+
+    def test_decode_error_ends_the_stream(self):
+        reader = SeekableVideoReader(self._video_path, self._halt, pacer=PlaybackPacer(unthrottled=True))
+        # the error is reported by the thread, not by the test
+        with patch.object(reader, "_decode_chunk", side_effect=cv.error("corrupted chunk")), \
+                patch("threading.excepthook"):
+            reader.start()
+            reader._thread.join(timeout=5)
+        self.assertFalse(reader._thread.is_alive())
+        self.assertTrue(reader._stop_working.is_set())
+
+    def test_ingest_conversion(self):
+        reader = SeekableVideoReader(self._video_path, self._halt, pacer=PlaybackPacer(unthrottled=True))
+        reader.set_ingest((160, 120), grayscale=True)
+        reader.start()
+        _, frame = reader.grab_frame(timeout=5)
+        self.assertEqual((120, 160), frame.shape)
+        self.assertGreater(reader.get_queued_bytes(), 0)
+        reader.stop()
+
+    def test_frame_stride(self):
+        reader = SeekableVideoReader(self._video_path, self._halt, decode_threads=2,
+                                     pacer=PlaybackPacer(unthrottled=True))
+        reader.set_decimation(frame_stride=5)
+        reader.start()
+        for frame_number in range(0, TestSeekableVideoReader.FRAMES, 5):
+            number, frame = reader.grab_frame(timeout=5)
+            self.assertEqual(frame_number, number)
+            np.testing.assert_array_equal(self._frames[frame_number], frame)
+        reader.stop()
+        with self.assertRaises(ValueError):
+            reader.set_decimation(frame_stride=0)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import cv2 as cv
+import numpy as np
+
+
+class CompactFrame:
+    """
+    A frame reduced to what the trackers read : the crops of the regions they search in,
+    at the resolution of the tracking, and a low resolution version of the whole frame for the display.
+
+    The frame providers build it when given the regions of the trackers (see AbstractFrameProvider.set_regions_hint()),
+    so that the rest of the frame isn't resized, copied and queued for nothing. compose() gives back a frame of the
+    tracking size, sharp inside the regions and blurry elsewhere.
+    """
+
+    PREVIEW_DOWNSCALE = 4
+    """Factor by which the whole frame is downscaled for the display"""
+    MAX_COVERAGE = 0.5
+    """Fraction of the frame above which the regions are not worth cropping, the whole frame being used instead"""
+
+    def __init__(self, size: tuple[int, int], preview: np.ndarray, crops: list[tuple[int, int, np.ndarray]]):
+        self.size = size
+        """Width and height of the composed frame"""
+        self.preview = preview
+        """The whole frame, downscaled by PREVIEW_DOWNSCALE"""
+        self.crops = crops
+        """Xy location of the top-left corner of each region in the composed frame, and its image"""
+
+    @property
+    def nbytes(self) -> int:
+        """The memory taken by the images, like numpy.ndarray.nbytes"""
+        return self.preview.nbytes + sum(crop.nbytes for _, _, crop in self.crops)
+
+    @staticmethod
+    def from_frame(frame: np.ndarray, regions: list[tuple[int, int, int, int]],
+                   size: tuple[int, int]) -> CompactFrame:
+        """
+        :param frame: The frame, of any size
+        :param regions: The (x, y, width, height) regions to keep, in the coordinates of a frame of the given size
+        :param size: Width and height of the frame read by the trackers
+        """
+        width, height = size
+        scale_x, scale_y = frame.shape[1] / width, frame.shape[0] / height
+        preview = cv.resize(frame, (max(1, width // CompactFrame.PREVIEW_DOWNSCALE),
+                                    max(1, height // CompactFrame.PREVIEW_DOWNSCALE)), interpolation=cv.INTER_AREA)
+        crops = []
+        for x, y, region_width, region_height in regions:
+            # only the pixels of the region are read in the frame
+            source = frame[int(y * scale_y): int(round((y + region_height) * scale_y)),
+                           int(x * scale_x): int(round((x + region_width) * scale_x))]
+            crops.append((x, y, cv.resize(source, (region_width, region_height), interpolation=cv.INTER_AREA)))
+        return CompactFrame(size, preview, crops)
+
+    def compose(self) -> np.ndarray:
+        """:return: A frame of the tracking size, the preview upscaled with the crops pasted over it"""
+        frame = cv.resize(self.preview, self.size, interpolation=cv.INTER_LINEAR)
+        for x, y, crop in self.crops:
+            frame[y: y + crop.shape[0], x: x + crop.shape[1]] = crop
+        return frame
+
+    def to_grayscale(self) -> CompactFrame:
+        """:return: The same frame, its images converted from BGR to grayscale"""
+        if self.preview.ndim == 2:
+            return self
+        return CompactFrame(self.size, cv.cvtColor(self.preview, cv.COLOR_BGR2GRAY),
+                            [(x, y, cv.cvtColor(crop, cv.COLOR_BGR2GRAY)) for x, y, crop in self.crops])
+
+    @staticmethod
+    def merge_regions(regions: list[tuple[int, int, int, int]], size: tuple[int, int],
+                      margin: int = 0) -> list[tuple[int, int, int, int]] | None:
+        """
+        Merges the overlapping regions into their bounding boxes, until no two regions overlap
+        :param regions: The (x, y, width, height) regions
+        :param size: Width and height of the frame, the regions are clipped to it
+        :param margin: Number of pixels added around each region
+        :return: The merged regions, or None if they cover more than MAX_COVERAGE of the frame
+        """
+        width, height = size
+        # (x_min, y_min, x_max, y_max) boxes, clipped to the frame
+        boxes = [(max(0, x - margin), max(0, y - margin), min(width, x + w + margin), min(height, y + h + margin))
+                 for x, y, w, h in regions]
+        boxes = [box for box in boxes if box[0] < box[2] and box[1] < box[3]]
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(boxes)):
+                for j in range(i + 1, len(boxes)):
+                    a, b = boxes[i], boxes[j]
+                    if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                        boxes[i] = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                        del boxes[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+        area = sum((x_max - x_min) * (y_max - y_min) for x_min, y_min, x_max, y_max in boxes)
+        if area > CompactFrame.MAX_COVERAGE * width * height:
+            return None
+        return [(x_min, y_min, x_max - x_min, y_max - y_min) for x_min, y_min, x_max, y_max in boxes]
@@ -0,0 +1,43 @@
+import cv2 as cv
+import numpy as np
+
+
+class SharedFrameData:
+    """
+    Data derived from a frame, that can be used by multiple trackers.
+    Each item is computed lazily the first time a tracker asks for it, then
+    reused by all other trackers updated with the same frame.
+
+    The TrackerManager creates a single instance for each frame and gives it
+    to all its trackers before updating them.
+    """
+
+    def __init__(self, frame: np.ndarray):
+        self._frame = frame
+        """The frame from which the data is derived"""
+        self._pyramid: list[np.ndarray] = [frame]
+        """Levels of the gaussian pyramid computed so far, the level 0 being the frame itself"""
+        self._gray: np.ndarray | None = None
+        """Grayscale version of the frame"""
+
+    def get_frame(self) -> np.ndarray:
+        return self._frame
+
+    def is_for(self, frame: np.ndarray) -> bool:
+        """:return: True if this data has been derived from the given frame object"""
+        return self._frame is frame
+
+    def get_pyramid_level(self, level: int) -> np.ndarray:
+        """
+        Returns the frame downscaled `level` times by a factor 2, using cv.pyrDown()
+        :param level: The level of the pyramid, 0 is the frame itself
+        """
+        while len(self._pyramid) <= level:
+            self._pyramid.append(cv.pyrDown(self._pyramid[-1]))
+        return self._pyramid[level]
+
+    def get_gray(self) -> np.ndarray:
+        """Returns the grayscale version of the frame. OpenCV's BGR order is assumed"""
+        if self._gray is None:
+            self._gray = self._frame if self._frame.ndim == 2 else cv.cvtColor(self._frame, cv.COLOR_BGR2GRAY)
+        return self._gray
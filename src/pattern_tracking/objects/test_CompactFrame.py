@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+import cv2 as cv
+import numpy as np
+
+from src.pattern_tracking.objects.CompactFrame import CompactFrame
+
+
+class TestCompactFrame(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(0)
+        self._frame = rng.integers(0, 256, (960, 1440, 3), dtype=np.uint8)
+        """Frame of twice the tracking size"""
+        self._size = (720, 480)
+
+    def test_merge_regions(self):
+        merged = CompactFrame.merge_regions([(10, 10, 50, 50), (40, 40, 50, 50), (300, 300, 20, 20)], self._size)
+        self.assertEqual([(10, 10, 80, 80), (300, 300, 20, 20)], merged)
+        # clipped to the frame
+        self.assertEqual([(0, 0, 25, 25)], CompactFrame.merge_regions([(5, 5, 10, 10)], self._size, margin=10))
+        # not worth cropping
+        self.assertIsNone(CompactFrame.merge_regions([(0, 0, 700, 400)], self._size))
+
+    def test_crops_match_the_resized_frame(self):
+        regions = [(100, 50, 60, 40), (400, 300, 100, 80)]
+        compact = CompactFrame.from_frame(self._frame, regions, self._size)
+        composed = compact.compose()
+        resized = cv.resize(self._frame, self._size, interpolation=cv.INTER_AREA)
+        self.assertEqual(resized.shape, composed.shape)
+        for x, y, width, height in regions:
+            np.testing.assert_array_equal(resized[y: y + height, x: x + width], composed[y: y + height, x: x + width])
+        self.assertLess(compact.nbytes, resized.nbytes / 4)
@@ -1,8 +1,10 @@
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QMainWindow
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QMainWindow, QLabel
 
+from src.pattern_tracking.logic.analysis.DenseMotionAnalyzer import DenseMotionAnalyzer
 from src.pattern_tracking.logic.video.LiveFeedWrapper import LiveFeedWrapper
 from src.pattern_tracking.qt_gui.dock_widgets.LivePlotterDockWidget import LivePlotterDockWidget
+from src.pattern_tracking.qt_gui.top_menu_bar.analysis.AnalysisMenu import AnalysisMenu
 from src.pattern_tracking.qt_gui.top_menu_bar.plot.PlotMenu import PlotMenu
 from src.pattern_tracking.qt_gui.top_menu_bar.trackers.TrackersMenu import TrackersMenu
 from src.pattern_tracking.logic.tracker import TrackerManager
@@ -16,27 +18,45 @@ class AppMainWindow(QMainWindow):
     with the different menus, sidebar menus and buttons
     """
 
-    def __init__(self, tracker_manager: TrackerManager, live_feed: LiveFeedWrapper):
+    STATUS_REFRESH_INTERVAL_MS = 1000
+    """Time between two updates of the status bar"""
+
+    def __init__(self, tracker_manager: TrackerManager, live_feed: LiveFeedWrapper,
+                 dense_motion_analyzer: DenseMotionAnalyzer):
         super().__init__()
         self.setWindowTitle("Anytrack")
         # -- Attributes
         self._TRACKER_MANAGER = tracker_manager
+        self._LIVE_FEED = live_feed
 
         # -- Widgets
         self._FRAME_DISPLAY = FrameDisplayWidget(tracker_manager)
         self._PLOTS_CONTAINER_WIDGET = LivePlotterDockWidget(self)
 
+        self._QUEUE_MEMORY_LABEL = QLabel()
+        """Memory taken by the frames waiting to be processed"""
+        self._STATUS_TIMER = QTimer(self)
+        """Updates the status bar periodically"""
+
         # -- Menus
         self._VIDEO_MENU = VideoMenu(live_feed)
         self._TRACKERS_MENU = TrackersMenu(tracker_manager, parent=self)
         self._PLOTS_MENU = PlotMenu(tracker_manager, self._PLOTS_CONTAINER_WIDGET)
+        self._ANALYSIS_MENU = AnalysisMenu(dense_motion_analyzer, self._FRAME_DISPLAY)
 
         # -- Assignments
         self.menuBar().addMenu(self._VIDEO_MENU)
         self.menuBar().addMenu(self._TRACKERS_MENU)
         self.menuBar().addMenu(self._PLOTS_MENU)
+        self.menuBar().addMenu(self._ANALYSIS_MENU)
         self.addDockWidget(Qt.RightDockWidgetArea, self._PLOTS_CONTAINER_WIDGET)
         self.setCentralWidget(self._FRAME_DISPLAY)
+        self.statusBar().addPermanentWidget(self._QUEUE_MEMORY_LABEL)
+        self._STATUS_TIMER.timeout.connect(self._update_status)
+        self._STATUS_TIMER.start(AppMainWindow.STATUS_REFRESH_INTERVAL_MS)
+
+    def _update_status(self):
+        self._QUEUE_MEMORY_LABEL.setText(f"Frame queue : {self._LIVE_FEED.get_queued_bytes() / (1 << 20):.1f} MB")
 
     def get_frame_display_widget(self) -> FrameDisplayWidget:
         """:return: the current frame display widget"""
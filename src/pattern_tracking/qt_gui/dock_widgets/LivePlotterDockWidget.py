@@ -3,7 +3,11 @@ from threading import Lock
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QDockWidget, QWidget, QLabel, QHBoxLayout, QVBoxLayout, QPushButton
 
+import numpy as np
+
 from src.pattern_tracking.logic.DistanceComputer import DistanceComputer
+from src.pattern_tracking.logic.MetricsEngine import MetricsEngine
+from src.pattern_tracking.logic.analysis.BeatRateAnalyzer import BeatRateAnalyzer
 from src.pattern_tracking.qt_gui.widgets.DistancePlotWidget import DistancePlotWidget
 
 
@@ -11,6 +15,11 @@ class LivePlotterDockWidget(QDockWidget):
     """
     Dock widget that contains a collection of PlotWidget objects, alongside their
     affected DistanceComputer object that give them the additional data to plot to the user
+
+    The distances of all plots are computed at once by a MetricsEngine,
+    each plot reads its own column of the result.
+    Each distance series is also given to a BeatRateAnalyzer, whose live
+    BPM and amplitude of the active plot are displayed in the control bar
     """
 
     WIDGET_SIZE = 800, 240
@@ -20,6 +29,10 @@ class LivePlotterDockWidget(QDockWidget):
         self._mutex = Lock()
 
         self._plots: dict[DistanceComputer, DistancePlotWidget] = {}
+        self._metrics_engine = MetricsEngine()
+        """Computes the distances of all plots in a single pass"""
+        self._analyzers: dict[DistancePlotWidget, BeatRateAnalyzer] = {}
+        """Live beat rate estimation of the series displayed by each plot"""
         self._active_plot: DistancePlotWidget | None = None
         self._current_frame_number = 0
         # Empty widget displayed when there is no plot available
@@ -39,22 +52,38 @@ class LivePlotterDockWidget(QDockWidget):
         """Create a new PlotWidget to be displayed, and updated in real-time"""
         set_new_as_active = len(self._plots) == 0
         plot_widget = DistancePlotWidget(feed_fps, plot_title=title)
+        # don't add a plot while the distances of the current frame are being read
+        self._mutex.acquire()
+        self._metrics_engine.add_pair(dist_computer)
         self._plots[dist_computer] = plot_widget
+        self._analyzers[plot_widget] = BeatRateAnalyzer(feed_fps)
+        self._mutex.release()
         if set_new_as_active:
             self.change_active_plot(self._plots[dist_computer])
 
-    def update_plots(self, frame_number: int):
-        """Updates all the current plots with new data from their trackers"""
+    def update_plots(self, frame_number: int) -> dict[DistanceComputer, float]:
+        """
+        Updates all the current plots with new data from their trackers
+        :return: The distance computed for each plot, DistanceComputer.ERR_DIST if it couldn't be computed
+        """
         super().update()
         # Here, this mutex was required because of the self._current_frame_number attribute
         # it only changes when called by the update_plots() method.
         self._mutex.acquire()
         self._current_frame_number = frame_number
+        distances = {}
+        metrics = self._metrics_engine.compute(frame_number)
         for (dist_computer, plot_widget) in self._plots.items():
-            distance = dist_computer.distance()
-            if distance != DistanceComputer.ERR_DIST:
+            distance = metrics.distances[self._metrics_engine.get_column(dist_computer)]
+            self._analyzers[plot_widget].add_sample(distance, frame_number)
+            if np.isnan(distance):
+                distances[dist_computer] = DistanceComputer.ERR_DIST
+            else:
+                distances[dist_computer] = float(distance)
                 plot_widget.plot_new_point(plot_widget.get_feed_fps(), distance, frame_number)
         self._mutex.release()
+        self._update_beat_rate_label()
+        return distances
 
     def change_active_plot(self, plot_widget: DistancePlotWidget):
         self._active_plot = plot_widget
@@ -69,11 +98,27 @@ class LivePlotterDockWidget(QDockWidget):
         self._mutex.acquire()
         for (dist_computer, dist_plot_widget) in self._plots.items():
             dist_plot_widget.clear_data()
+            self._reset_analyzer(dist_plot_widget)
         self._mutex.release()
 
     def clear_active_plot(self):
         if self._active_plot is not None:
             self._active_plot.clear_data()
+            self._reset_analyzer(self._active_plot)
+
+    def _reset_analyzer(self, plot_widget: DistancePlotWidget):
+        """Forgets the samples given to the analyzer of the given plot"""
+        self._analyzers[plot_widget] = BeatRateAnalyzer(plot_widget.get_feed_fps())
+
+    def _update_beat_rate_label(self):
+        """Displays the live beat rate and amplitude of the active plot"""
+        analyzer = self._analyzers.get(self._active_plot)
+        bpm = None if analyzer is None else analyzer.get_bpm()
+        amplitude = None if analyzer is None else analyzer.get_amplitude()
+        self._beat_rate_label.setText(
+            ("BPM : --" if bpm is None else f"BPM : {bpm:.1f}") + "  |  " +
+            ("Amplitude : --" if amplitude is None else f"Amplitude : {amplitude:.1f} px")
+        )
 
     def _init_control_bar_sublayout(self):
         layout_control_bar = QHBoxLayout()
@@ -89,6 +134,9 @@ class LivePlotterDockWidget(QDockWidget):
         button_clear.setText("Clear graph")
         button_clear.clicked.connect(self.clear_active_plot)
         layout_control_bar.addWidget(button_clear)
+        self._beat_rate_label = QLabel()
+        """Live beat rate and amplitude of the active plot"""
+        layout_control_bar.addWidget(self._beat_rate_label)
         self._control_bar_layout = layout_control_bar
 
     def _pause_current_plot(self):
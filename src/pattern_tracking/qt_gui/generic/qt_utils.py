@@ -0,0 +1,28 @@
+"""
+Conversions between the images of the logic (NumPy arrays) and the ones of Qt.
+Kept out of shared/utils.py, so that the logic of the application never imports PySide6
+"""
+import numpy as np
+from PySide6.QtGui import QImage, QPixmap
+
+
+def ndarray_to_qimage(image: np.ndarray,
+                      swap_rgb: bool = False,
+                      as_qpixmap: bool = False) -> QImage | QPixmap:
+    """
+    Converts a NumPy array representing an RGB image
+    into a QImage or a QPixmap.
+
+    Almost everything has been taken from here : https://stackoverflow.com/a/35857856
+    :param image The image to convert
+    :param swap_rgb If True, swaps the order of colors
+    :param as_qpixmap If True, converts the result into a QPixmap object
+    """
+    height, width, _ = image.shape
+    bytes_per_line = 3 * width
+    q_img = QImage(image.data, width, height, bytes_per_line, QImage.Format_RGB888)
+
+    if swap_rgb:
+        q_img = q_img.rgbSwapped()
+
+    return q_img if not as_qpixmap else QPixmap(q_img)
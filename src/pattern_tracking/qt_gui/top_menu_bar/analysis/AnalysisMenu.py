@@ -0,0 +1,29 @@
+from PySide6.QtWidgets import QMenu, QWidget
+
+from src.pattern_tracking.logic.analysis.DenseMotionAnalyzer import DenseMotionAnalyzer
+from src.pattern_tracking.qt_gui.top_menu_bar.analysis.ResetDenseMotionReferenceAction import \
+    ResetDenseMotionReferenceAction
+from src.pattern_tracking.qt_gui.top_menu_bar.analysis.ToggleDenseMotionAction import ToggleDenseMotionAction
+from src.pattern_tracking.qt_gui.top_menu_bar.analysis.ToggleHeatMapAction import ToggleHeatMapAction
+from src.pattern_tracking.qt_gui.widgets.FrameDisplayWidget import FrameDisplayWidget
+
+
+class AnalysisMenu(QMenu):
+    """
+    Displays the actions related to the analysis of the whole frame
+    """
+
+    def __init__(self, dense_motion_analyzer: DenseMotionAnalyzer,
+                 frame_display_widget: FrameDisplayWidget,
+                 parent: QWidget | None = None):
+        super().__init__(parent)
+        self._TOGGLE_DENSE_MOTION_ACTION = ToggleDenseMotionAction(dense_motion_analyzer)
+        """Enables or disables the dense motion analysis"""
+        self._TOGGLE_HEAT_MAP_ACTION = ToggleHeatMapAction(frame_display_widget)
+        """Shows or hides the heat map over the frames"""
+        self._RESET_REFERENCE_ACTION = ResetDenseMotionReferenceAction(dense_motion_analyzer)
+        """Measures the displacements from the next frame"""
+        self.addAction(self._TOGGLE_DENSE_MOTION_ACTION)
+        self.addAction(self._TOGGLE_HEAT_MAP_ACTION)
+        self.addAction(self._RESET_REFERENCE_ACTION)
+        self.setTitle("Analysis")
@@ -0,0 +1,15 @@
+from PySide6.QtGui import QAction
+
+from src.pattern_tracking.logic.analysis.DenseMotionAnalyzer import DenseMotionAnalyzer
+
+
+class ResetDenseMotionReferenceAction(QAction):
+    """
+    Makes the next frame the reference from which the dense motion is measured,
+    typically when the tissue is relaxed
+    """
+
+    def __init__(self, dense_motion_analyzer: DenseMotionAnalyzer):
+        super().__init__()
+        self.setText("Use next frame as reference")
+        self.triggered.connect(dense_motion_analyzer.reset_reference)
@@ -0,0 +1,17 @@
+from PySide6.QtGui import QAction
+
+from src.pattern_tracking.logic.analysis.DenseMotionAnalyzer import DenseMotionAnalyzer
+
+
+class ToggleDenseMotionAction(QAction):
+    """
+    Checkable button that enables or disables the analysis of the motion of the whole frame
+    """
+
+    def __init__(self, dense_motion_analyzer: DenseMotionAnalyzer):
+        super().__init__()
+        self._DENSE_MOTION_ANALYZER = dense_motion_analyzer
+        self.setText("Dense motion analysis")
+        self.setCheckable(True)
+        self.setChecked(dense_motion_analyzer.is_enabled())
+        self.toggled.connect(dense_motion_analyzer.set_enabled)
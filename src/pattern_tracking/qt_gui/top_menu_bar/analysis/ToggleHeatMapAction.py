@@ -0,0 +1,16 @@
+from PySide6.QtGui import QAction
+
+from src.pattern_tracking.qt_gui.widgets.FrameDisplayWidget import FrameDisplayWidget
+
+
+class ToggleHeatMapAction(QAction):
+    """
+    Checkable button that shows or hides the heat map of the dense motion over the displayed frames
+    """
+
+    def __init__(self, frame_display_widget: FrameDisplayWidget):
+        super().__init__()
+        self.setText("Show displacement heat map")
+        self.setCheckable(True)
+        self.setChecked(frame_display_widget.is_heat_map_visible())
+        self.toggled.connect(frame_display_widget.set_heat_map_visible)
@@ -0,0 +1,54 @@
+from typing import Callable
+
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QWidget, QInputDialog
+
+from src.pattern_tracking.logic.tracker import AbstractTracker
+from src.pattern_tracking.logic.tracker import TrackerManager
+from src.pattern_tracking.qt_gui.generic.GenericAssets import GenericAssets
+
+
+class CreatePointGroupAction(QAction):
+    """
+    QAction object that places a group of optical flow trackers
+    on the best points to track of the detection region of the active tracker.
+
+    dev note: like CreateTrackerAction, this class has a callback attribute to update
+    the GUI that displays the trackers, called once for each created tracker.
+    """
+
+    def __init__(self, tracker_manager: TrackerManager,
+                 gui_callback: Callable[[AbstractTracker], None],
+                 top_level_parent: QWidget = None):
+        super().__init__()
+        self._TOP_LEVEL_PARENT = top_level_parent
+        self._tracker_manager = tracker_manager
+        """The manager to which the new trackers will be added to"""
+        self._on_creation_complete_callback = gui_callback
+        """Will be called for each new tracker"""
+
+        self.setText("New group of points in detection region")
+        self.triggered.connect(self._new_point_group)
+
+    def _new_point_group(self):
+        """Asks the name of the group, then creates its trackers in the detection region of the active tracker"""
+        try:
+            region = self._tracker_manager.get_active_selected_tracker().get_detection_region()
+        except ValueError:
+            GenericAssets.popup_message("Error : No active tracker",
+                                        "Create a tracker and draw its detection region first", is_error=True)
+            return
+
+        name, accepted = QInputDialog.getText(self._TOP_LEVEL_PARENT, "Create a group of points", "Group name")
+        if not accepted:
+            return
+
+        try:
+            trackers = self._tracker_manager.create_point_group(name, region)
+        except (ValueError, KeyError) as err:
+            GenericAssets.popup_message("Error : Cannot create the group", str(err), is_error=True)
+            return
+
+        for tracker in trackers:
+            self._on_creation_complete_callback(tracker)
+        GenericAssets.popup_message("Success", f"{len(trackers)} points placed in the group {name}", is_error=False)
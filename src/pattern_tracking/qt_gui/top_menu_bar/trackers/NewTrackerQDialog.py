@@ -1,9 +1,10 @@
-from PySide6.QtCore import QSize
+from PySide6.QtCore import QSize, Qt
 from PySide6.QtWidgets import QDialog, QWidget, QLineEdit, QApplication, QVBoxLayout, QLabel, QComboBox, \
     QDialogButtonBox
 
 from src.pattern_tracking.logic.tracker.AbstractTracker import AbstractTracker
 from src.pattern_tracking.logic.tracker.TrackerManager import TrackerManager
+from src.pattern_tracking.logic.tracker.TrackerType import TrackerType
 from src.pattern_tracking.qt_gui.generic.GenericAssets import GenericAssets
 
 
@@ -15,7 +16,7 @@ class NewTrackerQDialog(QDialog):
     parameters are not valid
     """
 
-    dialog_size = QSize(240, 160)
+    dialog_size = QSize(320, 160)
     """Fixed size of the dialog window"""
     window_title = "Create a new tracker"
     """Title of the popup window"""
@@ -39,8 +40,14 @@ class NewTrackerQDialog(QDialog):
         self.layout.addWidget(QLabel("Type of the tracker"))
 
         self._trackers_combobox = QComboBox(self)
+        # the cheapest types first, with their cost, to pick a fast one for high frame rate feeds
         for t in TrackerManager.available_tracker_types():
-            self._trackers_combobox.addItem(t.value.name, t)
+            self._trackers_combobox.addItem(f"{t.value.name} (cost: {t.value.cost.label()})", t)
+            self._trackers_combobox.setItemData(
+                self._trackers_combobox.count() - 1,
+                NewTrackerQDialog._describe(t),
+                Qt.ItemDataRole.ToolTipRole
+            )
 
         self.layout.addWidget(self._trackers_combobox)
 
@@ -97,6 +104,15 @@ class NewTrackerQDialog(QDialog):
             self._created_tracker = new_tracker
             self.accept()
 
+    @staticmethod
+    def _describe(tracker_type: TrackerType) -> str:
+        """:return: The capabilities of the given type of tracker, displayed in the tooltip of its item"""
+        data = tracker_type.value
+        return (f"Cost per frame: {data.cost.label()}\n"
+                f"Input: {'grayscale' if data.grayscale else 'colour'}, "
+                f"{'downscaled frames supported' if data.downscaled else 'native resolution preferred'}\n"
+                f"Can be updated in parallel: {'yes' if data.thread_safe else 'no'}")
+
     def get_created_tracker(self):
         """Returns the created tracker after closing this dialog"""
         return self._created_tracker
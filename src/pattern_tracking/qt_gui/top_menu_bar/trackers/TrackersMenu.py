@@ -2,6 +2,7 @@ from PySide6.QtWidgets import QMenu, QWidget
 
 from src.pattern_tracking.qt_gui.top_menu_bar.trackers.ClearActiveTrackerDetectionRegion import \
     ClearActiveTrackerDetectionRegion
+from src.pattern_tracking.qt_gui.top_menu_bar.trackers.CreatePointGroupAction import CreatePointGroupAction
 from src.pattern_tracking.qt_gui.top_menu_bar.trackers.CreateTrackerAction import CreateTrackerAction
 from src.pattern_tracking.qt_gui.top_menu_bar.trackers.SwitchTrackersSubMenu import SwitchTrackersSubMenu
 from src.pattern_tracking.logic.tracker import TrackerManager
@@ -31,10 +32,19 @@ class TrackersMenu(QMenu):
             )
         """Button that opens a popup dialog to create a new tracker"""
 
+        self._CREATE_POINT_GROUP_ACTION = \
+            CreatePointGroupAction(
+                self._TRACKER_MANAGER,
+                self._SWITCH_TRACKERS_SUBMENU.on_tracker_added_callback,
+                top_level_parent=self.parent()
+            )
+        """Button that places optical flow trackers in the detection region of the active tracker"""
+
         self._CLEAR_ACTIVE_TRACKER_DETREG = ClearActiveTrackerDetectionRegion(tracker_manager)
 
         # menu parameters
         self.setTitle(TrackersMenu.DEFAULT_NAME if name is None else name)
         self.addAction(self._CREATE_TRACKER_ACTION)
+        self.addAction(self._CREATE_POINT_GROUP_ACTION)
         self.addAction(self._CLEAR_ACTIVE_TRACKER_DETREG)
         self.addMenu(self._SWITCH_TRACKERS_SUBMENU)
@@ -0,0 +1,50 @@
+from PySide6.QtGui import QAction, QActionGroup
+from PySide6.QtWidgets import QMenu, QWidget
+
+from src.pattern_tracking.logic.video.LiveFeedWrapper import LiveFeedWrapper
+
+
+class FrameDecimationMenu(QMenu):
+    """
+    Exclusive choice of the frames processed, when the motion is slow relative to the frame rate :
+    one frame out of a stride for the video files, and a maximum frame rate for the live feeds
+    """
+
+    STRIDES = (1, 2, 4, 8, 16)
+    """Processed one frame out of these many, in video files"""
+    MAX_RATES = (5, 10, 15)
+    """Maximum number of frames processed per second, in live feeds"""
+
+    def __init__(self, live_feed: LiveFeedWrapper, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._LIVE_FEED = live_feed
+        stride, interval = live_feed.get_decimation()
+        self._STRIDE_GROUP = QActionGroup(self)
+        """Only one stride is checked at a time"""
+        self._RATE_GROUP = QActionGroup(self)
+        """Only one maximum rate is checked at a time"""
+
+        self.addSection("Video files")
+        for s in FrameDecimationMenu.STRIDES:
+            action = QAction("Every frame" if s == 1 else f"One frame out of {s}", self._STRIDE_GROUP)
+            action.setCheckable(True)
+            action.setChecked(s == stride)
+            action.triggered.connect(lambda _=False, value=s: self._set_stride(value))
+            self.addAction(action)
+
+        self.addSection("Live feeds")
+        for rate in (None,) + FrameDecimationMenu.MAX_RATES:
+            action = QAction("Every frame" if rate is None else f"At most {rate} FPS", self._RATE_GROUP)
+            action.setCheckable(True)
+            action.setChecked(interval == (0.0 if rate is None else 1 / rate))
+            action.triggered.connect(lambda _=False, value=rate: self._set_max_rate(value))
+            self.addAction(action)
+        self.setTitle("Frame decimation")
+
+    def _set_stride(self, stride: int):
+        _, interval = self._LIVE_FEED.get_decimation()
+        self._LIVE_FEED.set_decimation(stride, interval)
+
+    def _set_max_rate(self, rate: float | None):
+        stride, _ = self._LIVE_FEED.get_decimation()
+        self._LIVE_FEED.set_decimation(stride, 0.0 if rate is None else 1 / rate)
@@ -0,0 +1,35 @@
+from PySide6.QtGui import QAction, QActionGroup
+from PySide6.QtWidgets import QMenu, QWidget
+
+from src.pattern_tracking.logic.video.PlaybackPacer import PlaybackPacer
+
+
+class PlaybackSpeedMenu(QMenu):
+    """
+    Exclusive choice of the playback speed of the video files,
+    or of playing them as fast as possible
+    """
+
+    SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+
+    def __init__(self, pacer: PlaybackPacer, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._PACER = pacer
+        self._ACTION_GROUP = QActionGroup(self)
+        """Only one speed is checked at a time"""
+        for speed in PlaybackSpeedMenu.SPEEDS:
+            action = QAction(f"{speed:g}x", self._ACTION_GROUP)
+            action.setCheckable(True)
+            action.setChecked(not pacer.is_unthrottled() and speed == pacer.get_speed())
+            action.triggered.connect(lambda _=False, s=speed: self._set_speed(s))
+            self.addAction(action)
+        action = QAction("As fast as possible", self._ACTION_GROUP)
+        action.setCheckable(True)
+        action.setChecked(pacer.is_unthrottled())
+        action.triggered.connect(lambda _=False: self._PACER.set_unthrottled(True))
+        self.addAction(action)
+        self.setTitle("Playback speed")
+
+    def _set_speed(self, speed: float):
+        self._PACER.set_speed(speed)
+        self._PACER.set_unthrottled(False)
@@ -1,15 +1,24 @@
+from threading import Thread
+
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QFileDialog, QWidget, QApplication
 
 from src.pattern_tracking.logic.video.LiveFeedWrapper import LiveFeedWrapper
-from src.pattern_tracking.logic.video.VideoReader import VideoReader
+from src.pattern_tracking.logic.video.SeekableVideoReader import SeekableVideoReader
+from src.pattern_tracking.qt_gui.generic.GenericAssets import GenericAssets
 
 
 class SelectVideoAction(QAction):
 
+    _open_failed = Signal(str)
+    """Emitted by the thread opening the video when it couldn't be opened, with the reason"""
+
     def __init__(self, live_feed: LiveFeedWrapper, dialog_parent: QWidget | None = None):
         super().__init__()
         self.triggered.connect(self._select_video_dialog)
+        # the popup is shown by the GUI thread
+        self._open_failed.connect(self._show_open_error, Qt.ConnectionType.QueuedConnection)
         self.setText("Launch from video")
         self._live_feed = live_feed
         self._dialog_parent = dialog_parent
@@ -17,11 +26,23 @@ class SelectVideoAction(QAction):
     def _select_video_dialog(self):
         file_name, _ = QFileDialog.getOpenFileName(self._dialog_parent, "Open video file", filter="Video files (*.avi *.jpg *.mp4)")
         if len(file_name) != 0:
-            self._live_feed.change_feed(
-                VideoReader(file_name,
-                            global_halt_event=self._live_feed.get_global_halt_event(),
-                            is_video=True, loop_video=True)
-            )
+            # indexing a long video takes a while, the GUI keeps running meanwhile
+            Thread(target=self._open_video, args=(file_name,), daemon=True).start()
+
+    def _open_video(self, file_name: str):
+        """Builds the reader of the video, with its FrameIndex, and makes it the live feed"""
+        try:
+            reader = SeekableVideoReader(file_name,
+                                         global_halt_event=self._live_feed.get_global_halt_event(),
+                                         loop_video=True,
+                                         pacer=self._live_feed.get_pacer())
+        except (IOError, ValueError) as err:
+            self._open_failed.emit(f"{file_name} : {err}")
+            return
+        self._live_feed.change_feed(reader)
+
+    def _show_open_error(self, message: str):
+        GenericAssets.popup_message("Error : Cannot open the video", message, is_error=True, parent=self._dialog_parent)
 
 
 if __name__ == '__main__':
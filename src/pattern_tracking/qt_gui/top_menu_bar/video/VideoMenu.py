@@ -1,6 +1,8 @@
 from PySide6.QtWidgets import QMenu, QWidget
 
 from src.pattern_tracking.logic.video.LiveFeedWrapper import LiveFeedWrapper
+from src.pattern_tracking.qt_gui.top_menu_bar.video.FrameDecimationMenu import FrameDecimationMenu
+from src.pattern_tracking.qt_gui.top_menu_bar.video.PlaybackSpeedMenu import PlaybackSpeedMenu
 from src.pattern_tracking.qt_gui.top_menu_bar.video.SelectCameraAsLiveFeedAction import SelectCameraAsLiveFeedAction
 from src.pattern_tracking.qt_gui.top_menu_bar.video.SelectFramesFromZMQSocketAction import SelectFramesFromZMQSocketAction
 from src.pattern_tracking.qt_gui.top_menu_bar.video.SelectVideoAction import SelectVideoAction
@@ -16,7 +18,12 @@ class VideoMenu(QMenu):
         self._FROM_DISTANT_SERVER_ACTION = SelectFramesFromZMQSocketAction(live_feed)
         self.addAction(self._SELECT_VIDEO_ACTION)
         self.addAction(self._SELECT_CAMERA_LIVE_FEED)
+        self._PLAYBACK_SPEED_MENU = PlaybackSpeedMenu(live_feed.get_pacer(), self)
         self.addAction(self._FROM_DISTANT_SERVER_ACTION)
+        self.addSeparator()
+        self.addMenu(self._PLAYBACK_SPEED_MENU)
+        self._FRAME_DECIMATION_MENU = FrameDecimationMenu(live_feed, self)
+        self.addMenu(self._FRAME_DECIMATION_MENU)
         self.setTitle("Video")
 
 
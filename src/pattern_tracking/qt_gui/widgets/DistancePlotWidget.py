@@ -2,7 +2,8 @@ from threading import Lock
 from typing import Any
 
 from pyqtgraph import PlotWidget
-import numpy as np
+
+from src.pattern_tracking.logic.plot.MinMaxPyramid import MinMaxPyramid
 
 
 class DistancePlotWidget(PlotWidget):
@@ -11,10 +12,18 @@ class DistancePlotWidget(PlotWidget):
     Note that we assume that we only use ONE PlotDataItem
     in this widget's PlotData.
 
+    The whole series is kept in a MinMaxPyramid, and only the points
+    required to display the visible range at the current pixel width
+    are given to the PlotDataItem. Thus, the cost of a repaint depends
+    on the size of the widget, not on the duration of the session.
+
     TODO: make abstraction of this base class, with methods like clear(), plot_new_point(),
     resume_plotting() and stop_plotting()
     """
 
+    DEFAULT_PIXEL_WIDTH = 800
+    """Width used to pick the level of detail when the widget hasn't been laid out yet"""
+
     def __init__(self,
                  feed_fps: int,
                  plot_title: str,
@@ -26,10 +35,13 @@ class DistancePlotWidget(PlotWidget):
         self.plotItem.setTitle(plot_title)
         self._feed_fps = feed_fps
         self._initialized = False
-        self._data_idx = 0
         self._stop_plotting = False
+        self._pyramid = MinMaxPyramid()
+        """All the points plotted since the last clear, at multiple levels of detail"""
         self._mutex = Lock()
         """Mutex used when the plot's data gets cleared, to block any update operation while clearing the plot"""
+        # zooming or panning changes which points must be displayed
+        self.plotItem.getViewBox().sigXRangeChanged.connect(lambda *_: self._refresh_displayed_data())
 
     def get_feed_fps(self):
         return self._feed_fps
@@ -39,36 +51,59 @@ class DistancePlotWidget(PlotWidget):
         """Plots a new point with the given data to this plot"""
         new_x, new_y = DistancePlotWidget.new_point_data(feed_fps, distance, current_frame_number)
 
+        if not self._stop_plotting:
+            last_x = self._pyramid.last_x()
+            if last_x is not None and new_x < last_x:
+                self._stop_plotting = True
+                return
+
+            self._mutex.acquire()
+            self._pyramid.append(new_x, new_y)
+            self._mutex.release()
+            self._refresh_displayed_data()
+
+    def _refresh_displayed_data(self):
+        """
+        Gives the PlotDataItem the points of the pyramid level matching
+        the visible x-range and the pixel width of this widget
+        """
+        self._mutex.acquire()
+        if len(self._pyramid) == 0:
+            self._mutex.release()
+            return
+
+        view_box = self.plotItem.getViewBox()
+        # when following the data, the visible range is the whole series
+        if view_box.autoRangeEnabled()[0]:
+            x_min, x_max = self._pyramid.get_x_bounds()
+        else:
+            x_min, x_max = view_box.viewRange()[0]
+        pixel_width = int(view_box.width()) or DistancePlotWidget.DEFAULT_PIXEL_WIDTH
+        data_x, data_y = self._pyramid.get_data(x_min, x_max, pixel_width)
+        self._mutex.release()
+
         # the only way to create a PlotDataItem for a PlotItem
         # is calling PlotItem.plot()
         # we need to know whether we have to update the plot
         # or to initialize the PlotDataItem behind
         # we check whether there is one PlotDataItem in this PlotItem
         # below line is similar to `if self.plotItem.listDataItems() != []`
-        if not self._stop_plotting:
-            if self.plotItem.listDataItems():
-                # a PlotItem can contain multiple PlotDataItem objects
-                # we only put 1 unique PlotDataItem in each plot
-                plot_data_item = self.plotItem.listDataItems()[0]
-                data_x, data_y = plot_data_item.getData()
-                if new_x < data_x[len(data_x) - 1]:
-                    self._stop_plotting = True
-                    return
-
-                self._data_idx = 0 if new_x < data_x[len(data_x) - 1] else self._data_idx + 1
-                data_x = np.insert(data_x, self._data_idx, new_x)
-                data_y = np.insert(data_y, self._data_idx, new_y)
-                plot_data_item.setData(data_x, data_y)
-
-            else:
-                self.plotItem.plot([new_x], [new_y])
-                self._initialized = True
+        if self.plotItem.listDataItems():
+            # a PlotItem can contain multiple PlotDataItem objects
+            # we only put 1 unique PlotDataItem in each plot
+            self.plotItem.listDataItems()[0].setData(data_x, data_y)
+        else:
+            self.plotItem.plot(data_x, data_y)
+            self._initialized = True
 
     def clear_data(self):
         """Removes the only PlotDataItem used in this PlotWidget"""
-        self.plotItem.clear()
+        self._mutex.acquire()
+        self._pyramid.clear()
         self._initialized = False
-        self._data_idx = 0
+        self._mutex.release()
+        # outside the lock, clearing the plot may change the view range and refresh the displayed data
+        self.plotItem.clear()
 
     def resume_plotting(self):
         self._stop_plotting = False
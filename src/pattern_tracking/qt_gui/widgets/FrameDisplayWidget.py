@@ -2,10 +2,11 @@ import PySide6.QtCore
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import QLabel
 
+import cv2 as cv
 import numpy as np
 
+from src.pattern_tracking.qt_gui.generic import qt_utils
 from src.pattern_tracking.qt_gui.generic.GenericAssets import GenericAssets
-from src.pattern_tracking.shared import utils
 from src.pattern_tracking.logic.tracker import TrackerManager
 from src.pattern_tracking.qt_gui.logic.UserRegionPlacer import UserRegionPlacer
 
@@ -25,6 +26,8 @@ class FrameDisplayWidget(QLabel):
     """
 
     WIDGET_SIZE = (720, 480)
+    HEAT_MAP_OPACITY = 0.4
+    """Weight of the heat map when it is blended over the frame"""
 
     def __init__(self, tracker_manager: TrackerManager):
         super().__init__()
@@ -43,7 +46,7 @@ class FrameDisplayWidget(QLabel):
         self._tracker_manager = tracker_manager
         """Contains all the trackers, and the current active one"""
 
-        self._frame_pixmap = utils.ndarray_to_qimage(
+        self._frame_pixmap = qt_utils.ndarray_to_qimage(
             np.zeros(np.array((
                 *FrameDisplayWidget.WIDGET_SIZE, 3
             ))),
@@ -52,6 +55,11 @@ class FrameDisplayWidget(QLabel):
 
         self.setPixmap(self._frame_pixmap)
 
+        self._heat_map: np.ndarray | None = None
+        """Image blended over the displayed frames, of the same shape as them"""
+        self._heat_map_visible = False
+        """Whether the heat map is blended over the displayed frames"""
+
     def get_current_frame(self):
         """Returns the backing NumPy array image displayed to the user"""
         return self._current_frame
@@ -95,9 +103,26 @@ class FrameDisplayWidget(QLabel):
                          Often necessary when working with OpenCV for example
         """
         self._current_frame = frame
-        q_img = utils.ndarray_to_qimage(frame, swap_rgb, as_qpixmap=True)
+        heat_map = self._heat_map
+        if self._heat_map_visible and heat_map is not None and heat_map.shape == frame.shape:
+            frame = cv.addWeighted(frame, 1 - FrameDisplayWidget.HEAT_MAP_OPACITY,
+                                   heat_map, FrameDisplayWidget.HEAT_MAP_OPACITY, 0)
+        q_img = qt_utils.ndarray_to_qimage(frame, swap_rgb, as_qpixmap=True)
         self.setPixmap(q_img)
 
+    def set_heat_map(self, heat_map: np.ndarray | None):
+        """
+        Sets the image blended over the next displayed frames, when the heat map is visible
+        :param heat_map: Image of the same shape and channel order as the displayed frames, or None to remove it
+        """
+        self._heat_map = heat_map
+
+    def is_heat_map_visible(self) -> bool:
+        return self._heat_map_visible
+
+    def set_heat_map_visible(self, visible: bool):
+        self._heat_map_visible = visible
+
     # -- Mouse events binding
     # We override Qt's mouse interaction methods to manage our events
 
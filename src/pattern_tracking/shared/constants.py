@@ -10,3 +10,57 @@ When detecting a template in the current live feed,
 if the detection is not at least above the given
 number, then we should not apply a rectangle
 """
+
+SEARCH_WINDOW_MARGIN = 15
+"""
+Number of pixels added on each side of the template to build the search window
+around the predicted position of a POI, when the search is restricted to its neighbourhood
+"""
+
+PYRAMID_MAX_LEVELS = 3
+"""Maximum number of times the frame and the template are downscaled by the coarse-to-fine template matching"""
+PYRAMID_MIN_TEMPLATE_SIZE = 12
+"""The template is never downscaled below this number of pixels by the coarse-to-fine template matching"""
+PYRAMID_CANDIDATES = 3
+"""Number of best locations of the coarsest level that are refined by the coarse-to-fine template matching"""
+PYRAMID_REFINE_MARGIN = 2
+"""Number of pixels searched around the location found at the previous level of the coarse-to-fine matching"""
+PYRAMID_AMBIGUITY_MARGIN = 0.05
+"""
+The coarse-to-fine matching searches the template at full resolution instead when the best location
+of the coarsest level that isn't refined is this close to the best one, relative to the mean score of that level
+"""
+PYRAMID_TIE_TOLERANCE = 1e-6
+"""Correlations closer than this are ties, which the coarse-to-fine matching leaves to the full resolution search"""
+
+TRACKER_MODELS_DIR = 'assets/tracker_models'
+"""Directory containing the ONNX models of the neural network trackers of OpenCV (NanoTrack, DaSiamRPN)"""
+
+POINT_GROUP_MAX_POINTS = 100
+"""Maximum number of points placed at once in a region, when creating a group of optical flow trackers"""
+POINT_GROUP_MIN_DISTANCE = 10
+"""Minimal distance in pixels between two points placed in a group of optical flow trackers"""
+
+SEGMENT_WARMUP_FRAMES = 30
+"""
+Number of frames tracked before the start of a segment of a video analysed in parallel,
+for the trackers whose result depends on the previous frames, so that their state converges
+"""
+
+RECORDINGS_DIR = 'recordings'
+"""Directory in which the centers and distances computed during each session are saved"""
+
+RESULT_CACHE_DIR = 'cache/results'
+"""Directory in which the centers computed by the headless analyses are cached"""
+RESULT_CACHE_MAX_BYTES = 1 << 30
+"""Maximum size of the cache of the centers, the least recently used ones are removed beyond it"""
+FRAME_CACHE_DIR = 'cache/frames'
+"""Directory in which the videos decoded for parameter sweeps are stored"""
+
+FRAME_QUEUE_MAX_BYTES = 256 << 20
+"""Maximum size of the frames waiting in the queue of a frame provider"""
+REGIONS_HINT_MARGIN = 16
+"""
+Number of pixels kept around the regions searched by the trackers when the providers crop the frames,
+for the trackers that read a few pixels around their region (optical flow windows, filters)
+"""
@@ -1,8 +1,9 @@
 import cv2 as cv
 import numpy as np
-from PySide6.QtGui import QImage, QPixmap
 
 from src.pattern_tracking.objects.RegionOfInterest import RegionOfInterest
+from src.pattern_tracking.objects.SharedFrameData import SharedFrameData
+from src.pattern_tracking.shared import constants
 
 
 def get_roi(image: np.ndarray, x: int, w: int, y: int, h: int) -> np.ndarray:
@@ -108,6 +109,112 @@ def find_template_in_image(image: np.ndarray, roi: np.ndarray, detection_thresho
     return region_matched_location
 
 
+def build_template_pyramid(template: np.ndarray, max_levels: int = constants.PYRAMID_MAX_LEVELS) -> list[np.ndarray]:
+    """
+    Downscales the given template by a factor 2 with cv.pyrDown(), as many times as possible
+    without going below constants.PYRAMID_MIN_TEMPLATE_SIZE pixels, nor above `max_levels` times
+    :param template: The template to downscale
+    :param max_levels: Maximum number of times the template can be downscaled
+    :return: The template at each level, starting with the template itself
+    """
+    pyramid = [template]
+    while len(pyramid) <= max_levels \
+            and min(pyramid[-1].shape[:2]) // 2 >= constants.PYRAMID_MIN_TEMPLATE_SIZE:
+        pyramid.append(cv.pyrDown(pyramid[-1]))
+    return pyramid
+
+
+def find_template_in_pyramid(frame_data: SharedFrameData, template_pyramid: list[np.ndarray],
+                             detection_threshold: float,
+                             detection_bounds: RegionOfInterest = RegionOfInterest.new_empty(),
+                             candidates: int = constants.PYRAMID_CANDIDATES) -> RegionOfInterest:
+    """
+    Coarse-to-fine variant of find_template_in_image().
+    The template is first matched at the coarsest level of the frame's pyramid. The best locations found
+    are then refined at each finer level, by only matching in a neighbourhood of a few pixels around them.
+    The result is the one of find_template_in_image() : the template is searched at full resolution instead
+    when the coarse level is ambiguous (a location that isn't refined scores almost as well as the best one),
+    when the best refined locations are tied, or when none of them reaches the threshold.
+    :param frame_data: The shared data of the image in which to find the template, that holds its pyramid
+    :param template_pyramid: The template at each level, see build_template_pyramid()
+    :param detection_threshold: Minimum value of the match correlation, to consider the matched region as valid
+    :param detection_bounds: If set, limits the search in the given detection bounds
+    :param candidates: Number of locations of the coarsest level that are refined
+    :return: The location of the template in the image, or an empty result if no match has been found
+    """
+    image = frame_data.get_frame()
+    template = template_pyramid[0]
+    try:
+        base, offset = compute_detection_offset(image, template, detection_bounds)
+    except IndexError:
+        return RegionOfInterest.new_empty()
+    top = len(template_pyramid) - 1
+    if top == 0:
+        return find_template_in_image(image, template, detection_threshold, detection_bounds)
+
+    # coarse search in the downscaled detection bounds
+    scale = 2 ** top
+    coarse_start = offset // scale
+    coarse_end = (offset + base.shape[1::-1]) // scale
+    coarse_base = frame_data.get_pyramid_level(top)[coarse_start[1]: coarse_end[1], coarse_start[0]: coarse_end[0]]
+    coarse_template = template_pyramid[top]
+    if (np.array(coarse_base.shape[:2]) < np.array(coarse_template.shape[:2])).any():
+        return find_template_in_image(image, template, detection_threshold, detection_bounds)
+    confidence_map = cv.matchTemplate(coarse_base, coarse_template, cv.TM_CCORR_NORMED)
+
+    best_score, best_location, tied = -1.0, None, False
+    suppression_radius = np.array(coarse_template.shape[1::-1]) // 2
+    _, best_coarse_score, _, _ = cv.minMaxLoc(confidence_map)
+    mean_coarse_score = cv.mean(confidence_map)[0]
+    for _ in range(candidates):
+        _, _, _, location = cv.minMaxLoc(confidence_map)
+        # suppress the neighbourhood of this candidate, to pick distinct locations
+        x, y = location
+        confidence_map[max(0, y - suppression_radius[1]): y + suppression_radius[1] + 1,
+                       max(0, x - suppression_radius[0]): x + suppression_radius[0] + 1] = -1
+        score, refined, refined_tied = _refine_pyramid_location(frame_data, template_pyramid,
+                                                                np.array(location) + coarse_start, offset, base.shape)
+        if abs(score - best_score) <= constants.PYRAMID_TIE_TOLERANCE:
+            tied = True
+        elif score > best_score:
+            best_score, best_location, tied = score, refined, refined_tied
+
+    _, next_coarse_score, _, _ = cv.minMaxLoc(confidence_map)
+    ambiguous = best_coarse_score - next_coarse_score \
+        < constants.PYRAMID_AMBIGUITY_MARGIN * (best_coarse_score - mean_coarse_score)
+    if ambiguous or tied or best_score < detection_threshold:
+        return find_template_in_image(image, template, detection_threshold, detection_bounds)
+    return RegionOfInterest.from_points(image, best_location, best_location + template.shape[1::-1])
+
+
+def _refine_pyramid_location(frame_data: SharedFrameData, template_pyramid: list[np.ndarray],
+                             location: np.ndarray, offset: np.ndarray, base_shape: tuple[int, ...]) \
+        -> tuple[float, np.ndarray, bool]:
+    """
+    Follows a location found at the coarsest level of the pyramid down to the full resolution,
+    by matching the template in a small neighbourhood at each level.
+    :return: The correlation at full resolution, the top-left xy location of the template in the image,
+             and True if another location of the full resolution neighbourhood has the same correlation
+    """
+    score, confidence_map = -1.0, None
+    margin = constants.PYRAMID_REFINE_MARGIN
+    for level in range(len(template_pyramid) - 2, -1, -1):
+        location = location * 2
+        scale = 2 ** level
+        # neighbourhood of the location, limited to the detection bounds at this level
+        low = np.maximum(location - margin, offset // scale)
+        template_size = np.array(template_pyramid[level].shape[1::-1])
+        high = np.minimum(location + template_size + margin, (offset + base_shape[1::-1]) // scale)
+        if (high - low < template_size).any():
+            return -1.0, location, False
+        window = frame_data.get_pyramid_level(level)[low[1]: high[1], low[0]: high[0]]
+        confidence_map = cv.matchTemplate(window, template_pyramid[level], cv.TM_CCORR_NORMED)
+        _, score, _, found = cv.minMaxLoc(confidence_map)
+        location = low + found
+    tied = np.count_nonzero(confidence_map >= score - constants.PYRAMID_TIE_TOLERANCE) > 1
+    return score, location, tied
+
+
 def compute_detection_offset(base_image: np.ndarray, poi: np.ndarray, detection_bounds: RegionOfInterest) \
         -> tuple[np.ndarray, np.ndarray]:
     """
@@ -142,6 +249,34 @@ def compute_detection_offset(base_image: np.ndarray, poi: np.ndarray, detection_
     return base, offset
 
 
+def compute_search_window(image: np.ndarray, center: np.ndarray, template_shape: tuple[int, ...], margin: int,
+                          detection_bounds: RegionOfInterest = RegionOfInterest.new_empty()) -> RegionOfInterest:
+    """
+    Builds the region in which to search a template expected to be centered on the given point.
+    The region is the template's area, extended by `margin` pixels on each side, and limited to
+    the image and to the detection bounds if they are defined.
+    :param image: The image in which the template will be searched
+    :param center: The expected xy location of the center of the template
+    :param template_shape: Shape of the template to find
+    :param margin: Number of pixels added on each side of the template
+    :param detection_bounds: If set, the window will not go beyond these bounds
+    :return: The search window, or an empty region if the template cannot fit in it
+    """
+    height, width = template_shape[:2]
+    x_min, y_min = 0, 0
+    x_max, y_max = image.shape[1], image.shape[0]
+    if not detection_bounds.is_undefined():
+        (x_min, y_min), (x_max, y_max) = detection_bounds.get_coords()
+
+    x = max(x_min, int(round(center[0] - width / 2)) - margin)
+    y = max(y_min, int(round(center[1] - height / 2)) - margin)
+    x_edge = min(x_max, int(round(center[0] - width / 2)) + width + margin)
+    y_edge = min(y_max, int(round(center[1] - height / 2)) + height + margin)
+    if x_edge - x < width or y_edge - y < height:
+        return RegionOfInterest.new_empty()
+    return RegionOfInterest.new(image, x, x_edge - x, y, y_edge - y)
+
+
 def convert_points_to_xwyh(p1, p2) -> tuple[int, int, int, int]:
     """
     Given two points p1 and p2 describing the corners of a rectangle,
@@ -162,28 +297,6 @@ def convert_points_to_xwyh(p1, p2) -> tuple[int, int, int, int]:
     return x, w, y, h
 
 
-def ndarray_to_qimage(image: np.ndarray,
-                      swap_rgb: bool = False,
-                      as_qpixmap: bool = False) -> QImage | QPixmap:
-    """
-    Converts a NumPy array representing an RGB image
-    into a QImage or a QPixmap.
-
-    Almost everything has been taken from here : https://stackoverflow.com/a/35857856
-    :param image The image to convert
-    :param swap_rgb If True, swaps the order of colors
-    :param as_qpixmap If True, converts the result into a QPixmap object
-    """
-    height, width, _ = image.shape
-    bytes_per_line = 3 * width
-    q_img = QImage(image.data, width, height, bytes_per_line, QImage.Format_RGB888)
-
-    if swap_rgb:
-        q_img = q_img.rgbSwapped()
-
-    return q_img if not as_qpixmap else QPixmap(q_img)
-
-
 def opencv_list_available_camera_ports() -> tuple[list[int], list[int], list[int]]:
     """
     Not written by me. See https://stackoverflow.com/a/62639343